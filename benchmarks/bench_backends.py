@@ -0,0 +1,118 @@
+"""Benchmark the in-process NumPy/SciPy backend against Qdrant.
+
+The Qdrant collections are scrolled (with vectors) into a temporary
+``LocalVectorStore``, so both backends serve exactly the same points. Queries
+are encoded once and only the candidate fetch (dense + sparse + RRF) is
+timed; reranking is backend-independent and left out.
+
+Usage:
+    uv run python benchmarks/bench_backends.py            # 20 runs per query
+    uv run python benchmarks/bench_backends.py --runs 50
+
+Requires populated Qdrant collections and a fitted TF-IDF model (run main.py once).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qdrant_client.models import Distance, PointStruct, VectorParams  # noqa: E402
+
+from goa_travel_agent.config.settings import settings  # noqa: E402
+from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder  # noqa: E402
+from goa_travel_agent.src.vector_db.backends import create_client, latency_stats  # noqa: E402
+from goa_travel_agent.src.vector_db.local_backend import LocalVectorStore  # noqa: E402
+from goa_travel_agent.src.vector_db.searcher import HybridSearcher, _hotel_filter  # noqa: E402
+
+QUERIES = [
+    (settings.HOTELS_COLLECTION, "luxury resort with pool near beach", None),
+    (settings.HOTELS_COLLECTION, "budget guest house with wifi in Panjim", None),
+    (settings.HOTELS_COLLECTION, "family hotel with spa and restaurant", _hotel_filter(3, 0, None)),
+    (settings.PLACES_COLLECTION, "romantic sunset point", None),
+    (settings.PLACES_COLLECTION, "portuguese church heritage", None),
+    (settings.PLACES_COLLECTION, "beach shack seafood dinner", None),
+]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _mirror(qdrant, local: LocalVectorStore, name: str, batch_size: int = 256) -> int:
+    local.recreate_collection(name, {"dense": VectorParams(size=settings.DENSE_DIM, distance=Distance.COSINE)})
+    copied, offset = 0, None
+    while True:
+        points, offset = qdrant.scroll(
+            name, limit=batch_size, offset=offset, with_payload=True, with_vectors=True,
+        )
+        local.upsert(name, [PointStruct(id=p.id, vector=p.vector, payload=p.payload) for p in points])
+        copied += len(points)
+        if offset is None:
+            return copied
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="repetitions per query")
+    parser.add_argument("--retrieve-limit", type=int, default=20)
+    args = parser.parse_args()
+
+    embedder = HybridEmbedder()
+    qdrant = create_client(backend="qdrant")
+    local = LocalVectorStore(Path(tempfile.mkdtemp(prefix="goa_local_index_")))
+    for name in (settings.HOTELS_COLLECTION, settings.PLACES_COLLECTION):
+        print(f"Mirrored {_mirror(qdrant, local, name)} points from '{name}'")
+
+    searchers = {
+        "qdrant": HybridSearcher(embedder=embedder, qdrant_client=qdrant),
+        "local": HybridSearcher(embedder=embedder, qdrant_client=local),
+    }
+    encoded = searchers["qdrant"]._encode_queries([q for _, q, _ in QUERIES])
+
+    timings: dict[str, list[float]] = {b: [] for b in searchers}
+    results: dict[str, list[list]] = {b: [] for b in searchers}
+
+    # warm-up: open connections, page in the memmap, build the inverted index
+    for searcher in searchers.values():
+        for (collection, _, qfilter), vectors in zip(QUERIES, encoded):
+            searcher._fetch_fused(collection, [vectors], [qfilter], args.retrieve_limit)
+
+    for _ in range(args.runs):
+        for backend, searcher in searchers.items():
+            for (collection, _, qfilter), vectors in zip(QUERIES, encoded):
+                start = time.perf_counter()
+                hits = searcher._fetch_fused(collection, [vectors], [qfilter], args.retrieve_limit)[0]
+                timings[backend].append((time.perf_counter() - start) * 1000)
+                if len(results[backend]) < len(encoded):
+                    results[backend].append([h["id"] for h in hits])
+
+    print(f"\n{'backend':<8} {'calls':>6} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for backend, values in timings.items():
+        print(
+            f"{backend:<8} {len(values):>6} {statistics.mean(values):>9.2f} "
+            f"{_percentile(values, 50):>8.2f} {_percentile(values, 95):>8.2f}"
+        )
+
+    print("\nTop-10 overlap between backends (1.0 = same candidates):")
+    for (collection, query, _), remote, inproc in zip(QUERIES, results["qdrant"], results["local"]):
+        top_q, top_l = set(remote[:10]), set(inproc[:10])
+        overlap = len(top_q & top_l) / max(1, len(top_q | top_l))
+        print(f"  {collection:<12} {query:<45} {overlap:.2f}")
+
+    print(f"\nQdrant client calls ({getattr(qdrant, 'transport', 'http')}):")
+    for url, methods in latency_stats().items():
+        for method, stats in methods.items():
+            print(f"  {url} {method:<20} {stats}")
+
+
+if __name__ == "__main__":
+    main()
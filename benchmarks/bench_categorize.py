@@ -0,0 +1,101 @@
+"""Benchmark place categorization: per-row keyword loop vs vectorized regex scan.
+
+A synthetic places table is built from the keywords in
+settings.PLACE_CATEGORIES mixed with filler words, so every category (and
+"General") occurs. Both categorizers run on the same combined text; the
+script checks that they assign identical categories and prints the timings.
+
+Usage:
+    uv run python benchmarks/bench_categorize.py                 # 200k rows
+    uv run python benchmarks/bench_categorize.py --rows 1000000 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from goa_travel_agent.config.settings import settings  # noqa: E402
+from goa_travel_agent.src.data_management.preprocessor import categorize_places  # noqa: E402
+
+FILLER = (
+    "lovely view crowded weekend friendly staff clean parking sunset walk old quiet "
+    "family evening local price visit great nice worth busy morning photo"
+).split()
+
+
+def _row_wise(df: pd.DataFrame) -> pd.Series:
+    """The previous implementation: row-wise text join, then a keyword loop per row."""
+
+    def categorize(text: str) -> list[str]:
+        text_lower = text.lower()
+        matched = [c for c, kws in settings.PLACE_CATEGORIES.items() if any(kw in text_lower for kw in kws)]
+        return matched or ["General"]
+
+    combined = df.apply(lambda r: " ".join(str(r.get(c, "")) for c in ["place", "review", "city"]), axis=1)
+    return combined.apply(categorize)
+
+
+def _vectorized(df: pd.DataFrame) -> pd.Series:
+    combined = df["place"].fillna("").astype(str)
+    for col in ["review", "city"]:
+        combined = combined + " " + df[col].fillna("").astype(str)
+    return categorize_places(combined)
+
+
+def _synthetic_places(rows: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    keywords = [kw for kws in settings.PLACE_CATEGORIES.values() for kw in kws]
+
+    def text(words: int, keyword_rate: float) -> str:
+        return " ".join(
+            rng.choice(keywords).title() if rng.random() < keyword_rate else rng.choice(FILLER)
+            for _ in range(words)
+        )
+
+    return pd.DataFrame(
+        {
+            "place": [text(3, 0.2) for _ in range(rows)],
+            "review": [text(rng.randint(10, 60), 0.03) for _ in range(rows)],
+            "city": [rng.choice(settings.GOA_CITIES) for _ in range(rows)],
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--runs", type=int, default=3, help="timed repetitions per implementation")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    df = _synthetic_places(args.rows, args.seed)
+    print(f"{len(df)} synthetic places, {sum(len(k) for k in settings.PLACE_CATEGORIES.values())} keywords")
+
+    modes = {"row-wise": _row_wise, "vectorized": _vectorized}
+    results: dict[str, pd.Series] = {}
+    print(f"\n{'mode':<11} {'mean s':>8} {'min s':>8} {'rows/s':>11}")
+    for mode, categorize in modes.items():
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            results[mode] = categorize(df)
+            timings.append(time.perf_counter() - start)
+        print(f"{mode:<11} {statistics.mean(timings):>8.2f} {min(timings):>8.2f} {len(df) / min(timings):>11,.0f}")
+
+    mismatches = (results["row-wise"] != results["vectorized"]).sum()
+    print(f"\nRows with different categories: {mismatches}")
+    counts = results["vectorized"].explode().value_counts()
+    print("Category counts:", ", ".join(f"{c}={n}" for c, n in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
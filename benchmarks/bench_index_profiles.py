@@ -0,0 +1,144 @@
+"""Benchmark recall and latency of the index profiles in settings.INDEX_PROFILES.
+
+For each profile the live collection is copied (with vectors) into a scratch
+collection created with that profile's HNSW / on-disk / quantization config.
+Dense queries are then timed with the profile's search params, and recall@k
+is measured against exact (brute-force) search on the live collection.
+
+Usage:
+    uv run python benchmarks/bench_index_profiles.py                     # hotels, 100 queries
+    uv run python benchmarks/bench_index_profiles.py --collection goa_places --queries 300
+
+Requires a populated Qdrant server (the profiles are Qdrant storage options;
+the in-process backend ignores them).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qdrant_client.models import CollectionStatus, PointStruct, SearchParams  # noqa: E402
+
+from goa_travel_agent.config.settings import settings  # noqa: E402
+from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder  # noqa: E402
+from goa_travel_agent.src.vector_db.backends import create_client  # noqa: E402
+from goa_travel_agent.src.vector_db.doc_store import get_doc_store  # noqa: E402
+from goa_travel_agent.src.vector_db.index_profiles import collection_config, search_params  # noqa: E402
+
+QUERIES = [
+    "luxury resort with pool near beach",
+    "budget guest house with wifi in Panjim",
+    "family hotel with spa and restaurant",
+    "romantic sunset point",
+    "portuguese church heritage",
+    "beach shack seafood dinner",
+]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _copy_collection(client, source: str, target: str, profile: str, batch_size: int = 256) -> int:
+    if client.collection_exists(target):
+        client.delete_collection(target)
+    client.create_collection(collection_name=target, **collection_config(profile))
+    copied, offset = 0, None
+    while True:
+        points, offset = client.scroll(source, limit=batch_size, offset=offset, with_payload=True, with_vectors=True)
+        client.upsert(target, [PointStruct(id=p.id, vector=p.vector, payload=p.payload) for p in points], wait=True)
+        copied += len(points)
+        if offset is None:
+            return copied
+
+
+def _wait_indexed(client, name: str, timeout: float = 300.0) -> None:
+    """Block until the optimizer has built the HNSW graph / quantized segments."""
+    time.sleep(1.0)  # give the optimizer a chance to pick up the fresh segments
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if client.get_collection(name).status == CollectionStatus.GREEN:
+            return
+        time.sleep(0.5)
+    print(f"  warning: '{name}' still optimizing after {timeout:.0f}s, timings include unindexed segments")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--collection", default=settings.HOTELS_COLLECTION)
+    parser.add_argument("--queries", type=int, default=100, help="number of queries (fixed + sampled texts)")
+    parser.add_argument("--runs", type=int, default=3, help="repetitions per query")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch collections")
+    args = parser.parse_args()
+
+    client = create_client(backend="qdrant")
+    embedder = HybridEmbedder()
+
+    # queries: the fixed examples + texts sampled from the collection itself
+    text_field = "search_text" if args.collection == settings.HOTELS_COLLECTION else "full_text"
+    sample, _ = client.scroll(args.collection, limit=2000, with_payload=["content_hash"], with_vectors=False)
+    random.Random(0).shuffle(sample)
+    keys = [(str(p.id), (p.payload or {}).get("content_hash")) for p in sample]
+    docs = get_doc_store().get_many(args.collection, keys)
+    sampled = [str(docs.get(key, {}).get(text_field, "")) for key in keys]
+    texts = QUERIES + [t for t in sampled if t][: max(0, args.queries - len(QUERIES))]
+    vectors = embedder.encode_dense(texts, use_cache=False, show_progress_bar=False).tolist()
+
+    exact = [
+        {p.id for p in client.query_points(
+            args.collection, query=v, using="dense", limit=args.top_k,
+            search_params=SearchParams(exact=True), with_payload=False,
+        ).points}
+        for v in vectors
+    ]
+
+    rows = []
+    for profile in settings.INDEX_PROFILES:
+        scratch = f"bench_{args.collection}_{profile.replace('-', '_')}"
+        print(f"Building '{scratch}' ...")
+        _copy_collection(client, args.collection, scratch, profile)
+        _wait_indexed(client, scratch)
+        params = search_params(profile)
+
+        timings: list[float] = []
+        hits = 0
+        for v, truth in zip(vectors, exact):
+            for run in range(args.runs):
+                start = time.perf_counter()
+                found = client.query_points(
+                    scratch, query=v, using="dense", limit=args.top_k, search_params=params, with_payload=False,
+                ).points
+                timings.append((time.perf_counter() - start) * 1000)
+                if run == 0:
+                    hits += len(truth & {p.id for p in found})
+        recall = hits / max(1, sum(len(t) for t in exact))
+        rows.append((profile, recall, timings))
+        if not args.keep:
+            client.delete_collection(scratch)
+
+    print(f"\n{args.collection}: {len(vectors)} queries x {args.runs} runs, recall@{args.top_k} vs exact search")
+    print(f"{'profile':<12} {'recall':>7} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8}  storage")
+    for profile, recall, timings in rows:
+        p = settings.INDEX_PROFILES[profile]
+        storage = (
+            f"m={p['m']} ef={p['hnsw_ef'] or 'default'} "
+            f"vectors={'disk' if p['on_disk'] else 'ram'} quant={p['quantization'] or 'none'}"
+        )
+        print(
+            f"{profile:<12} {recall:>7.3f} {statistics.mean(timings):>9.2f} "
+            f"{_percentile(timings, 50):>8.2f} {_percentile(timings, 95):>8.2f}  {storage}"
+        )
+
+
+if __name__ == "__main__":
+    main()
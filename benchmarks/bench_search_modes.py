@@ -0,0 +1,93 @@
+"""Benchmark server-side fusion against the legacy three-call hybrid search.
+
+Both paths receive the same pre-encoded queries, so the timings isolate the
+Qdrant round trips; reranking is identical for the two modes and is left out.
+
+Usage:
+    uv run python benchmarks/bench_search_modes.py            # 20 runs per query
+    uv run python benchmarks/bench_search_modes.py --runs 50
+
+Requires populated collections and a fitted TF-IDF model (run main.py once).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from goa_travel_agent.config.settings import settings  # noqa: E402
+from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder  # noqa: E402
+from goa_travel_agent.src.vector_db.searcher import HybridSearcher  # noqa: E402
+
+QUERIES = [
+    (settings.HOTELS_COLLECTION, "luxury resort with pool near beach"),
+    (settings.HOTELS_COLLECTION, "budget guest house with wifi in Panjim"),
+    (settings.HOTELS_COLLECTION, "family hotel with spa and restaurant"),
+    (settings.PLACES_COLLECTION, "romantic sunset point"),
+    (settings.PLACES_COLLECTION, "portuguese church heritage"),
+    (settings.PLACES_COLLECTION, "beach shack seafood dinner"),
+]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="repetitions per query")
+    parser.add_argument("--retrieve-limit", type=int, default=20)
+    args = parser.parse_args()
+
+    embedder = HybridEmbedder()
+    searcher = HybridSearcher(embedder=embedder)
+
+    encoded = [
+        (collection, vectors)
+        for (collection, _), vectors in zip(QUERIES, searcher._encode_queries([q for _, q in QUERIES]))
+    ]
+
+    modes = {
+        "fusion": searcher._fetch_fused,
+        "client": searcher._fetch_client_fused,
+    }
+    timings: dict[str, list[float]] = {mode: [] for mode in modes}
+    results: dict[str, list[list]] = {mode: [] for mode in modes}
+
+    # warm-up: open connections and load segments before timing
+    for fetch in modes.values():
+        for collection, vectors in encoded:
+            fetch(collection, [vectors], [None], args.retrieve_limit)
+
+    for _ in range(args.runs):
+        for mode, fetch in modes.items():
+            for collection, vectors in encoded:
+                start = time.perf_counter()
+                hits = fetch(collection, [vectors], [None], args.retrieve_limit)[0]
+                timings[mode].append((time.perf_counter() - start) * 1000)
+                if len(results[mode]) < len(encoded):
+                    results[mode].append([h["id"] for h in hits])
+
+    print(f"\n{'mode':<8} {'calls':>6} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode, values in timings.items():
+        print(
+            f"{mode:<8} {len(values):>6} {statistics.mean(values):>9.2f} "
+            f"{_percentile(values, 50):>8.2f} {_percentile(values, 95):>8.2f}"
+        )
+
+    print("\nTop-10 overlap between modes (1.0 = same candidates):")
+    for (collection, query), fused, legacy in zip(QUERIES, results["fusion"], results["client"]):
+        top_f, top_c = set(fused[:10]), set(legacy[:10])
+        overlap = len(top_f & top_c) / max(1, len(top_f | top_c))
+        print(f"  {collection:<12} {query:<45} {overlap:.2f}")
+
+
+if __name__ == "__main__":
+    main()
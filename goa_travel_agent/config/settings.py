@@ -22,6 +22,24 @@ TAVILY_API_KEY: str = os.getenv("TAVILY_API_KEY", "")
 HOTELS_DATASET = "PromptCloudHQ/hotels-on-goibibo"
 PLACES_DATASET = "ritvik1909/indian-places-to-visit-reviews-data"
 
+# -- Qdrant transport --
+# One shared client per process: gRPC (port 6334) when reachable, HTTP otherwise.
+QDRANT_PREFER_GRPC: bool = os.getenv("QDRANT_PREFER_GRPC", "true").lower() in ("1", "true", "yes")
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+QDRANT_POOL_SIZE = int(os.getenv("QDRANT_POOL_SIZE", "8"))
+QDRANT_KEEPALIVE_S = int(os.getenv("QDRANT_KEEPALIVE_S", "30"))
+QDRANT_TIMEOUT_S = 30
+
+# -- Vector store backend --
+# "qdrant": remote/self-hosted Qdrant at QDRANT_URL.
+# "local": in-process NumPy/SciPy index persisted under LOCAL_INDEX_DIR.
+VECTOR_BACKEND: str = os.getenv("VECTOR_BACKEND", "qdrant")
+LOCAL_INDEX_DIR = CACHE_DIR / "local_index"
+# Filter masks kept per local collection (one bool per row each).
+LOCAL_MASK_CACHE_SIZE = int(os.getenv("LOCAL_MASK_CACHE_SIZE", "64"))
+# Rewrite a local collection's append-only files once this share of their rows is dead.
+LOCAL_COMPACT_RATIO = float(os.getenv("LOCAL_COMPACT_RATIO", "0.3"))
+
 # -- Qdrant collections --
 HOTELS_COLLECTION = "goa_hotels"
 PLACES_COLLECTION = "goa_places"
@@ -31,8 +49,98 @@ DENSE_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
 DENSE_DIM = 384
 CROSS_ENCODER_NAME = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 TFIDF_PATH = CACHE_DIR / "tfidf_model.joblib"
+EMBEDDING_CACHE_DIR = CACHE_DIR / "embeddings"
+
+# -- Hybrid search --
+# "fusion": one Query API request (dense + sparse prefetch, server-side RRF).
+# "client": legacy dense + sparse + retrieve calls with RRF computed locally.
+SEARCH_MODE: str = os.getenv("SEARCH_MODE", "fusion")
+RRF_K = 60
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "1024"))
+RERANK_CACHE_SIZE = int(os.getenv("RERANK_CACHE_SIZE", "20000"))
+# Facet counts can be changed by a sync or reindex run in another process,
+# which the in-process invalidation never sees; they expire after this long.
+FACET_CACHE_TTL_S = float(os.getenv("FACET_CACHE_TTL_S", "60"))
+
+# -- Reranking policy --
+# "full" (default): cross-encode every fused candidate.
+# "adaptive": cap depth at max(RERANK_MIN_DEPTH, RERANK_DEPTH_FACTOR * top_k) and
+#             skip reranking when dense and sparse agree on the top results
+#             (judged on the fused score, assuming RRF with RRF_K and
+#             positions counted from 0, as Qdrant does); opt-in
+#             because it changes results.
+# "none": fast mode, fused order is final.
+RERANK_POLICY: str = os.getenv("RERANK_POLICY", "full")
+RERANK_DEPTH_FACTOR = 3
+RERANK_MIN_DEPTH = 10
+RERANK_AGREEMENT_DEPTH = 3
+
+# -- Index profiles --
+# Build-time settings (HNSW graph, on-disk storage, quantization) apply when a
+# collection is created, so switching INDEX_PROFILE needs `main.py --reindex`;
+# search-time settings (hnsw_ef, rescoring) apply immediately.
+# indexing_threshold_kb: Qdrant only builds HNSW / quantized segments above
+# this size; our collections are a few MB, below the 20 MB server default.
+INDEX_PROFILE: str = os.getenv("INDEX_PROFILE", "balanced")
+INDEX_PROFILES: dict[str, dict] = {
+    # Qdrant defaults, everything in RAM, exact float32 scoring
+    "balanced": {
+        "m": 16, "ef_construct": 100, "hnsw_ef": None,
+        "on_disk": False, "hnsw_on_disk": False, "sparse_on_disk": False,
+        "quantization": None, "rescore": False, "oversampling": None,
+        "indexing_threshold_kb": None,
+    },
+    # denser graph, int8 vectors pinned in RAM, small search beam
+    "low-latency": {
+        "m": 32, "ef_construct": 256, "hnsw_ef": 64,
+        "on_disk": False, "hnsw_on_disk": False, "sparse_on_disk": False,
+        "quantization": "scalar", "rescore": True, "oversampling": 1.0,
+        "indexing_threshold_kb": 1000,
+    },
+    # originals + graph + sparse index on disk, 1-bit vectors in RAM, rescored
+    "low-memory": {
+        "m": 8, "ef_construct": 100, "hnsw_ef": 128,
+        "on_disk": True, "hnsw_on_disk": True, "sparse_on_disk": True,
+        "quantization": "binary", "rescore": True, "oversampling": 3.0,
+        "indexing_threshold_kb": 1000,
+    },
+}
 
-# -- Processed CSV names --
+# -- Indexing --
+# Rows are encoded and uploaded UPLOAD_BATCH_SIZE at a time; up to
+# UPLOAD_PARALLEL upserts are in flight while the next batch is encoded.
+# UPLOAD_WAIT=false returns as soon as Qdrant has queued each batch.
+UPLOAD_BATCH_SIZE = int(os.getenv("UPLOAD_BATCH_SIZE", "256"))
+UPLOAD_PARALLEL = int(os.getenv("UPLOAD_PARALLEL", "4"))
+UPLOAD_WAIT: bool = os.getenv("UPLOAD_WAIT", "true").lower() in ("1", "true", "yes")
+# Blue/green reindex builds <collection>_vN behind an alias; the live version
+# and the newest previous ones (for rollback) are kept, older ones deleted.
+REINDEX_KEEP_VERSIONS = 2
+
+# -- Document store --
+# Long text fields stay out of the Qdrant payloads (RAM, bytes per hit) and
+# live in a local SQLite store keyed by point id; the searcher reads them only
+# for the rerank candidates and the final top_k.
+DOC_STORE_PATH = CACHE_DIR / "docstore.sqlite"
+DOC_STORE_FIELDS = ("search_text", "full_text", "review", "hotel_facilities")
+
+# -- Bootstrap bundles --
+# export_bundle() writes collection snapshots + TF-IDF model + processed datasets
+# here; a node with BOOTSTRAP_BUNDLE pointing at such a directory restores it
+# on first start instead of re-encoding the corpus.
+BUNDLE_DIR = CACHE_DIR / "bundle"
+BOOTSTRAP_BUNDLE: str = os.getenv("BOOTSTRAP_BUNDLE", "")
+
+# -- Build manifest --
+# Fingerprints of what each pipeline stage (preprocess, tfidf, index) was
+# last built from; a stage reruns only when one of them changes.
+BUILD_MANIFEST_PATH = CACHE_DIR / "build_manifest.json"
+
+# -- Processed datasets --
+# Typed Parquet is the working format (column projection, memory-mapped
+# reads); the CSVs are only written on request as an export.
+HOTELS_PARQUET = PROCESSED_DIR / "goa_hotels.parquet"
+PLACES_PARQUET = PROCESSED_DIR / "goa_places.parquet"
 HOTELS_CSV = PROCESSED_DIR / "goa_hotels.csv"
 PLACES_CSV = PROCESSED_DIR / "goa_places.csv"
 
@@ -62,6 +170,38 @@ HOTEL_COLUMNS = [
     "room_type",
 ]
 
+# -- Place columns to keep --
+PLACE_COLUMNS = ["city", "place", "review", "rating"]
+
+# -- Raw CSV ingestion --
+# Raw dumps are read in chunks of this many rows and filtered to Goa chunk
+# by chunk, so peak memory does not grow with the size of the raw file.
+CSV_CHUNK_ROWS = int(os.getenv("CSV_CHUNK_ROWS", "50000"))
+
+# -- Geo search --
+# Radius used when a search asks for "near <locality>" without one.
+GEO_DEFAULT_RADIUS_KM = float(os.getenv("GEO_DEFAULT_RADIUS_KM", "5"))
+
+# -- Hotel facility flags --
+# hotel_facilities free text -> normalized flags (indexed keyword array
+# "facilities" in the payload). Keywords match on word boundaries.
+HOTEL_FACILITIES: dict[str, list[str]] = {
+    "pool": ["pool", "swimming"],
+    "spa": ["spa", "massage", "sauna", "steam room", "jacuzzi"],
+    "wifi": ["wifi", "wi-fi", "wireless", "internet"],
+    "beach_access": ["beach", "beachfront", "sea view", "seaside"],
+    "parking": ["parking", "valet"],
+    "restaurant": ["restaurant", "dining", "coffee shop", "cafe"],
+    "bar": ["bar", "lounge", "pub"],
+    "gym": ["gym", "fitness"],
+    "air_conditioning": ["air conditioning", "air conditioned", "ac"],
+    "room_service": ["room service", "in-room dining"],
+    "airport_transfer": ["airport transfer", "airport shuttle", "airport pickup", "airport drop", "pick up", "pickup"],
+    "kids": ["kids", "children", "babysitting", "play area"],
+    "pet_friendly": ["pet friendly", "pets allowed", "pets"],
+    "power_backup": ["power backup", "generator"],
+}
+
 # -- Place categories keyword map --
 PLACE_CATEGORIES: dict[str, list[str]] = {
     "Beach": ["beach", "shore", "sand", "coast", "seaside", "sea"],
@@ -87,6 +227,17 @@ class _Settings:
     QDRANT_API_KEY = QDRANT_API_KEY
     TAVILY_API_KEY = TAVILY_API_KEY
 
+    QDRANT_PREFER_GRPC = QDRANT_PREFER_GRPC
+    QDRANT_GRPC_PORT = QDRANT_GRPC_PORT
+    QDRANT_POOL_SIZE = QDRANT_POOL_SIZE
+    QDRANT_KEEPALIVE_S = QDRANT_KEEPALIVE_S
+    QDRANT_TIMEOUT_S = QDRANT_TIMEOUT_S
+
+    VECTOR_BACKEND = VECTOR_BACKEND
+    LOCAL_INDEX_DIR = LOCAL_INDEX_DIR
+    LOCAL_MASK_CACHE_SIZE = LOCAL_MASK_CACHE_SIZE
+    LOCAL_COMPACT_RATIO = LOCAL_COMPACT_RATIO
+
     HOTELS_DATASET = HOTELS_DATASET
     PLACES_DATASET = PLACES_DATASET
     HOTELS_COLLECTION = HOTELS_COLLECTION
@@ -96,11 +247,42 @@ class _Settings:
     DENSE_DIM = DENSE_DIM
     CROSS_ENCODER_NAME = CROSS_ENCODER_NAME
     TFIDF_PATH = TFIDF_PATH
+    EMBEDDING_CACHE_DIR = EMBEDDING_CACHE_DIR
+
+    SEARCH_MODE = SEARCH_MODE
+    RRF_K = RRF_K
+    QUERY_CACHE_SIZE = QUERY_CACHE_SIZE
+    RERANK_CACHE_SIZE = RERANK_CACHE_SIZE
+    FACET_CACHE_TTL_S = FACET_CACHE_TTL_S
+    RERANK_POLICY = RERANK_POLICY
+    RERANK_DEPTH_FACTOR = RERANK_DEPTH_FACTOR
+    RERANK_MIN_DEPTH = RERANK_MIN_DEPTH
+    RERANK_AGREEMENT_DEPTH = RERANK_AGREEMENT_DEPTH
+
+    INDEX_PROFILE = INDEX_PROFILE
+    INDEX_PROFILES = INDEX_PROFILES
+
+    UPLOAD_BATCH_SIZE = UPLOAD_BATCH_SIZE
+    UPLOAD_PARALLEL = UPLOAD_PARALLEL
+    UPLOAD_WAIT = UPLOAD_WAIT
+    REINDEX_KEEP_VERSIONS = REINDEX_KEEP_VERSIONS
+    DOC_STORE_PATH = DOC_STORE_PATH
+    DOC_STORE_FIELDS = DOC_STORE_FIELDS
+
+    BUNDLE_DIR = BUNDLE_DIR
+    BOOTSTRAP_BUNDLE = BOOTSTRAP_BUNDLE
+    BUILD_MANIFEST_PATH = BUILD_MANIFEST_PATH
 
+    HOTELS_PARQUET = HOTELS_PARQUET
+    PLACES_PARQUET = PLACES_PARQUET
     HOTELS_CSV = HOTELS_CSV
     PLACES_CSV = PLACES_CSV
     GOA_CITIES = GOA_CITIES
     HOTEL_COLUMNS = HOTEL_COLUMNS
+    PLACE_COLUMNS = PLACE_COLUMNS
+    CSV_CHUNK_ROWS = CSV_CHUNK_ROWS
+    HOTEL_FACILITIES = HOTEL_FACILITIES
+    GEO_DEFAULT_RADIUS_KM = GEO_DEFAULT_RADIUS_KM
     PLACE_CATEGORIES = PLACE_CATEGORIES
 
 
@@ -1,34 +1,81 @@
+from collections.abc import Callable
 from pathlib import Path
 
 import pandas as pd
 
+from goa_travel_agent.config.settings import settings
 from goa_travel_agent.src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
 
+def _normalize_name(name: str) -> str:
+    return name.strip().lower().replace(" ", "_")
+
+
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
     return df
 
 
-def load_hotels_csv(raw_dir: Path) -> pd.DataFrame:
-    """Load the raw hotel CSV and normalize column names."""
-    candidates = list(raw_dir.glob("*.csv"))
+def _find_csv(raw_dir: Path) -> Path:
+    """The dataset CSV in ``raw_dir``: the first by name if there are several."""
+    candidates = sorted(raw_dir.glob("*.csv"))
     if not candidates:
         raise FileNotFoundError(f"No CSV found in {raw_dir}")
-    csv_path = candidates[0]
+    if len(candidates) > 1:
+        log.warning(
+            "%d CSVs in %s, reading %s (ignoring %s)",
+            len(candidates), raw_dir, candidates[0].name, ", ".join(p.name for p in candidates[1:]),
+        )
+    return candidates[0]
+
+
+def _read_filtered(
+    csv_path: Path,
+    columns: list[str],
+    keep: Callable[[pd.DataFrame], pd.Series],
+    chunk_rows: int = settings.CSV_CHUNK_ROWS,
+) -> pd.DataFrame:
+    """Stream ``csv_path`` in chunks, parsing only ``columns`` and keeping the rows ``keep`` selects.
+
+    Column names are matched after normalization ("Hotel Star Rating" ->
+    "hotel_star_rating"). Only surviving rows are held in memory, plus one chunk.
+    """
+    wanted = set(columns)
+    kept: list[pd.DataFrame] = []
+    total = 0
+    with pd.read_csv(csv_path, usecols=lambda c: _normalize_name(c) in wanted, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            chunk = _normalize_columns(chunk)
+            total += len(chunk)
+            kept.append(chunk[keep(chunk)])
+    df = pd.concat(kept, ignore_index=True) if kept else pd.DataFrame(columns=list(columns))
+    log.info("%s: kept %d of %d rows", csv_path.name, len(df), total)
+    return df
+
+
+def _goa_hotels(chunk: pd.DataFrame) -> pd.Series:
+    if "state" not in chunk.columns:
+        return pd.Series(True, index=chunk.index)
+    return chunk["state"].astype(str).str.strip().str.lower() == "goa"
+
+
+def _goa_places(chunk: pd.DataFrame) -> pd.Series:
+    if "city" not in chunk.columns:
+        return pd.Series(True, index=chunk.index)
+    return chunk["city"].astype(str).str.strip().str.lower().isin(settings.GOA_CITIES)
+
+
+def load_hotels_csv(raw_dir: Path) -> pd.DataFrame:
+    """Load the Goa rows of the raw hotel CSV (``HOTEL_COLUMNS`` only), normalizing column names."""
+    csv_path = _find_csv(raw_dir)
     log.info("Loading hotels CSV: %s", csv_path.name)
-    df = pd.read_csv(csv_path)
-    return _normalize_columns(df)
+    return _read_filtered(csv_path, settings.HOTEL_COLUMNS, _goa_hotels)
 
 
 def load_places_csv(raw_dir: Path) -> pd.DataFrame:
-    """Load the raw places/reviews CSV and normalize column names."""
-    candidates = list(raw_dir.glob("*.csv"))
-    if not candidates:
-        raise FileNotFoundError(f"No CSV found in {raw_dir}")
-    csv_path = candidates[0]
+    """Load the Goa rows of the raw places/reviews CSV (``PLACE_COLUMNS`` only), normalizing column names."""
+    csv_path = _find_csv(raw_dir)
     log.info("Loading places CSV: %s", csv_path.name)
-    df = pd.read_csv(csv_path)
-    return _normalize_columns(df)
+    return _read_filtered(csv_path, settings.PLACE_COLUMNS, _goa_places)
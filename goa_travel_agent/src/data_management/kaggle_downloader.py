@@ -1,15 +1,25 @@
+import hashlib
+import json
 import os
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.utils.file_utils import file_sha256
 from goa_travel_agent.src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
+EXTRACT_CHUNK = 1 << 20
+CHECKSUMS_FILE = "checksums.json"  # written last: marks an extract as complete
+
+
+class ArchiveLayoutError(RuntimeError):
+    """The archive cannot be extracted as one flat CSV per name; retrying will not help."""
 
 
 def _ensure_kaggle_env() -> None:
@@ -27,40 +37,115 @@ def _ensure_kaggle_env() -> None:
         )
 
 
+def _verified_extract(extract_dir: Path) -> bool:
+    """True when every CSV listed in the checksums file is present and intact."""
+    checksums_path = extract_dir / CHECKSUMS_FILE
+    if not checksums_path.exists():
+        return False
+    try:
+        checksums: dict[str, str] = json.loads(checksums_path.read_text())
+    except ValueError:
+        return False
+    for name, digest in checksums.items():
+        path = extract_dir / name
+        if not path.exists() or file_sha256(path) != digest:
+            log.warning("Extracted file %s is missing or corrupt", path)
+            return False
+    return bool(checksums)
+
+
+def _extract_csvs(zip_path: Path, extract_dir: Path) -> dict[str, str]:
+    """Stream the CSV members of ``zip_path`` into ``extract_dir`` and record their sha256.
+
+    Members are flattened to their base name (two members with the same base
+    name are an error, raised before anything is written) and written through
+    a ``.part`` file, so an interrupted extract never leaves a truncated CSV behind.
+    ``zipfile`` checks each member's CRC as it is read, so a damaged archive
+    raises ``BadZipFile`` here. The checksums file is written last and marks
+    the extract as complete.
+    """
+    checksums: dict[str, str] = {}
+    with zipfile.ZipFile(zip_path) as zf:
+        members = [
+            info for info in zf.infolist()
+            if not info.is_dir() and info.filename.lower().endswith(".csv") and "__MACOSX" not in info.filename
+        ]
+        if not members:
+            raise ArchiveLayoutError(f"No CSV member in {zip_path.name}")
+        by_name: dict[str, list[str]] = {}
+        for info in members:
+            by_name.setdefault(Path(info.filename).name, []).append(info.filename)
+        collisions = {name: paths for name, paths in by_name.items() if len(paths) > 1}
+        if collisions:
+            raise ArchiveLayoutError(f"CSV members of {zip_path.name} share a file name: {collisions}")
+
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        (extract_dir / CHECKSUMS_FILE).unlink(missing_ok=True)
+        for stale in [*extract_dir.glob("*.csv"), *extract_dir.glob("*.part")]:
+            stale.unlink()
+        for info in members:
+            name = Path(info.filename).name
+            part = extract_dir / f"{name}.part"
+            digest = hashlib.sha256()
+            with zf.open(info) as src, open(part, "wb") as dst:
+                while chunk := src.read(EXTRACT_CHUNK):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            part.replace(extract_dir / name)
+            checksums[name] = digest.hexdigest()
+            log.info("Extracted %s (%.1f MB)", name, info.file_size / 1e6)
+        skipped = len(zf.infolist()) - len(members)
+    if skipped:
+        log.info("Skipped %d non-CSV member(s) of %s", skipped, zip_path.name)
+    (extract_dir / CHECKSUMS_FILE).write_text(json.dumps(checksums, indent=2))
+    return checksums
+
+
 def download_dataset(dataset_slug: str, dest_dir: Path) -> Path:
-    """Download and extract a Kaggle dataset with retry logic.
+    """Download a Kaggle dataset and extract its CSVs, with retry logic.
+
+    An interrupted download leaves ``<dataset>.zip`` in ``dest_dir``; the next
+    attempt (or run) resumes it with an HTTP range request instead of
+    starting over. An extract is reused only if its checksums still match.
 
     Returns the directory containing the extracted files.
     """
-    _ensure_kaggle_env()
-    from kaggle.api.kaggle_api_extended import KaggleApi
-
     dest_dir.mkdir(parents=True, exist_ok=True)
     dataset_name = dataset_slug.split("/")[-1]
     extract_dir = dest_dir / dataset_name
+    zip_path = dest_dir / f"{dataset_name}.zip"
 
-    if extract_dir.exists() and any(extract_dir.iterdir()):
+    if _verified_extract(extract_dir):
         log.info("Dataset '%s' already downloaded at %s", dataset_slug, extract_dir)
         return extract_dir
 
+    _ensure_kaggle_env()
+    from kaggle.api.kaggle_api_extended import KaggleApi
+
     api = KaggleApi()
     api.authenticate()
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            log.info("Downloading '%s' (attempt %d/%d)...", dataset_slug, attempt, MAX_RETRIES)
-            api.dataset_download_files(dataset_slug, path=str(dest_dir), unzip=False)
-
-            zip_path = dest_dir / f"{dataset_name}.zip"
             if zip_path.exists():
-                extract_dir.mkdir(parents=True, exist_ok=True)
-                with zipfile.ZipFile(zip_path, "r") as zf:
-                    zf.extractall(extract_dir)
-                zip_path.unlink()
-                log.info("Extracted to %s", extract_dir)
+                log.info("Resuming '%s' from %.1f MB (attempt %d/%d)...",
+                         dataset_slug, zip_path.stat().st_size / 1e6, attempt, MAX_RETRIES)
+            else:
+                log.info("Downloading '%s' (attempt %d/%d)...", dataset_slug, attempt, MAX_RETRIES)
+            # force=False: kaggle continues a partial zip_path with a Range request
+            api.dataset_download_files(dataset_slug, path=str(dest_dir), force=False, unzip=False)
+
+            _extract_csvs(zip_path, extract_dir)
+            zip_path.unlink()
+            log.info("Extracted to %s", extract_dir)
             return extract_dir
 
+        except ArchiveLayoutError:
+            raise
         except Exception as exc:
+            if isinstance(exc, zipfile.BadZipFile):
+                # A complete but damaged archive cannot be resumed: start over
+                zip_path.unlink(missing_ok=True)
             log.warning("Attempt %d failed: %s", attempt, exc)
             if attempt < MAX_RETRIES:
                 time.sleep(RETRY_DELAY * attempt)
@@ -73,7 +158,8 @@ def download_dataset(dataset_slug: str, dest_dir: Path) -> Path:
 
 
 def download_all() -> tuple[Path, Path]:
-    """Download both hotel and places datasets. Returns (hotels_dir, places_dir)."""
-    hotels_dir = download_dataset(settings.HOTELS_DATASET, settings.RAW_DIR)
-    places_dir = download_dataset(settings.PLACES_DATASET, settings.RAW_DIR)
-    return hotels_dir, places_dir
+    """Download the hotel and places datasets concurrently. Returns (hotels_dir, places_dir)."""
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="kaggle") as pool:
+        hotels = pool.submit(download_dataset, settings.HOTELS_DATASET, settings.RAW_DIR)
+        places = pool.submit(download_dataset, settings.PLACES_DATASET, settings.RAW_DIR)
+        return hotels.result(), places.result()
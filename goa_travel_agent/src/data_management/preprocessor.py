@@ -1,17 +1,29 @@
+import re
+from pathlib import Path
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.utils.facility_utils import facility_flags_column
+from goa_travel_agent.src.utils.geo_utils import coords_columns, locality_id_column
 from goa_travel_agent.src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# List-valued columns: native lists in Parquet, pipe-joined in exported CSVs
+# (older CSVs joined categories with ", ", which is still read back correctly).
+LIST_COLUMNS = ("facilities", "category")
+_LIST_SEP = re.compile(r"\s*[|,]\s*")
+
 
 # ---------------------------------------------------------------------------
 # Hotels
 # ---------------------------------------------------------------------------
 
 def preprocess_hotels(df: pd.DataFrame) -> pd.DataFrame:
-    """Filter Goa hotels, drop nulls on critical fields, create search_text."""
+    """Filter Goa hotels, drop nulls on critical fields, create search_text, facility flags and location."""
     # Keep only relevant columns that exist
     cols = [c for c in settings.HOTEL_COLUMNS if c in df.columns]
     df = df[cols].copy()
@@ -50,26 +62,60 @@ def preprocess_hotels(df: pd.DataFrame) -> pd.DataFrame:
     df["search_text"] = df["search_text"].fillna("")
 
     df = df.reset_index(drop=True)
+    _add_facility_flags(df)
+    _add_location(df, ["locality", "address"])
     log.info("Hotels after preprocessing: %d rows", len(df))
     return df
 
 
+def _add_facility_flags(df: pd.DataFrame) -> None:
+    if "hotel_facilities" in df.columns:
+        df["facilities"] = facility_flags_column(df["hotel_facilities"])
+    else:
+        df["facilities"] = [[] for _ in range(len(df))]
+
+
+def _add_location(df: pd.DataFrame, columns: list[str]) -> None:
+    """Canonical ``locality_id`` and lat/lon from the first of ``columns`` naming a known locality.
+
+    lat/lon are NaN when no column matches the gazetteer.
+    """
+    sources = [df[c] for c in columns if c in df.columns]
+    if not sources:
+        df["locality_id"] = None
+        df["lat"] = df["lon"] = float("nan")
+        return
+    df["locality_id"] = locality_id_column(*sources)
+    coords = coords_columns(*sources)
+    df["lat"], df["lon"] = coords["lat"], coords["lon"]
+
+
 # ---------------------------------------------------------------------------
 # Places
 # ---------------------------------------------------------------------------
 
-def _categorize_place(text: str) -> str:
-    """Auto-categorize a place based on keyword matching."""
-    text_lower = text.lower()
-    matched = []
-    for category, keywords in settings.PLACE_CATEGORIES.items():
-        if any(kw in text_lower for kw in keywords):
-            matched.append(category)
-    return ", ".join(matched) if matched else "General"
+# One alternation per category. Keywords match as substrings of the
+# lowercased text ("ayurved" -> "ayurvedic"), like the original per-row loop.
+_CATEGORY_PATTERNS: dict[str, re.Pattern] = {
+    category: re.compile("|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+    for category, keywords in settings.PLACE_CATEGORIES.items()
+}
+
+
+def categorize_places(texts: pd.Series) -> pd.Series:
+    """All matching categories per text (["General"] when none), one vectorized scan per category."""
+    texts = texts.fillna("").astype(str).str.lower()
+    categories = list(_CATEGORY_PATTERNS)
+    hits = [texts.str.contains(pattern).to_numpy(dtype=bool) for pattern in _CATEGORY_PATTERNS.values()]
+    return pd.Series(
+        [[c for c, hit in zip(categories, row) if hit] or ["General"] for row in zip(*hits)],
+        index=texts.index,
+        dtype=object,
+    )
 
 
 def preprocess_places(df: pd.DataFrame) -> pd.DataFrame:
-    """Filter Goa places, dedup keeping longest review, categorize, create full_text."""
+    """Filter Goa places, dedup keeping longest review, categorize, create full_text and location."""
     # Normalize city
     if "city" in df.columns:
         df["city"] = df["city"].astype(str).str.strip().str.lower()
@@ -100,19 +146,14 @@ def preprocess_places(df: pd.DataFrame) -> pd.DataFrame:
         df = df.drop(columns=["_review_len"])
 
     # Auto-categorize
-    text_for_cat = ""
-    for col in ["place", "review", "city"]:
-        if col in df.columns:
-            text_for_cat = df[col].astype(str)
-            break
-    if isinstance(text_for_cat, pd.Series):
-        combined_text = df.apply(
-            lambda r: " ".join(str(r.get(c, "")) for c in ["place", "review", "city"]),
-            axis=1,
-        )
-        df["category"] = combined_text.apply(_categorize_place)
+    text_cols = [c for c in ["place", "review", "city"] if c in df.columns]
+    if text_cols:
+        combined_text = df[text_cols[0]].fillna("").astype(str)
+        for col in text_cols[1:]:
+            combined_text = combined_text + " " + df[col].fillna("").astype(str)
+        df["category"] = categorize_places(combined_text)
     else:
-        df["category"] = "General"
+        df["category"] = [["General"] for _ in range(len(df))]
 
     # Create full_text
     parts = []
@@ -130,6 +171,7 @@ def preprocess_places(df: pd.DataFrame) -> pd.DataFrame:
     df["full_text"] = df["full_text"].fillna("")
 
     df = df.reset_index(drop=True)
+    _add_location(df, ["city", "place"])
     log.info("Places after preprocessing: %d rows", len(df))
     return df
 
@@ -138,8 +180,99 @@ def preprocess_places(df: pd.DataFrame) -> pd.DataFrame:
 # Save
 # ---------------------------------------------------------------------------
 
+def _join_lists(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    for col in LIST_COLUMNS:
+        if col in out.columns:
+            out[col] = out[col].map(lambda v: "|".join(v) if isinstance(v, list) else "")
+    return out
+
+
+def _split_lists(df: pd.DataFrame) -> pd.DataFrame:
+    for col in LIST_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(lambda v: [x for x in _LIST_SEP.split(v) if x] if isinstance(v, str) else [])
+    return df
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp, compression="zstd")
+    tmp.replace(path)
+
+
+def _read_parquet(path: Path, columns: list[str] | None) -> pd.DataFrame:
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [c for c in columns if c in available]
+    df = pq.read_table(path, columns=columns, memory_map=True).to_pandas()
+    for col in LIST_COLUMNS:  # Arrow lists arrive as numpy arrays
+        if col in df.columns:
+            df[col] = [list(v) if v is not None else [] for v in df[col]]
+    return df
+
+
 def save_processed(hotels_df: pd.DataFrame, places_df: pd.DataFrame) -> None:
     settings.PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
-    hotels_df.to_csv(settings.HOTELS_CSV, index=False)
-    places_df.to_csv(settings.PLACES_CSV, index=False)
-    log.info("Saved processed CSVs to %s", settings.PROCESSED_DIR)
+    _write_parquet(hotels_df, settings.HOTELS_PARQUET)
+    _write_parquet(places_df, settings.PLACES_PARQUET)
+    log.info("Saved processed datasets to %s", settings.PROCESSED_DIR)
+
+
+def export_csv() -> tuple[Path, Path]:
+    """Write the processed datasets as CSV (list columns pipe-joined)."""
+    hotels_df, places_df = load_processed()
+    _join_lists(hotels_df).to_csv(settings.HOTELS_CSV, index=False)
+    _join_lists(places_df).to_csv(settings.PLACES_CSV, index=False)
+    log.info("Exported processed CSVs to %s", settings.PROCESSED_DIR)
+    return settings.HOTELS_CSV, settings.PLACES_CSV
+
+
+def processed_exists() -> bool:
+    parquet = settings.HOTELS_PARQUET.exists() and settings.PLACES_PARQUET.exists()
+    return parquet or (settings.HOTELS_CSV.exists() and settings.PLACES_CSV.exists())
+
+
+def processed_row_counts() -> tuple[int, int]:
+    """(hotels, places) row counts from the Parquet footers, without reading any data."""
+    _ensure_parquet()
+    return (
+        pq.ParquetFile(settings.HOTELS_PARQUET).metadata.num_rows,
+        pq.ParquetFile(settings.PLACES_PARQUET).metadata.num_rows,
+    )
+
+
+def _migrate_csv() -> None:
+    """One-off: turn processed CSVs from before the Parquet switch into Parquet."""
+    log.info("Converting processed CSVs to Parquet...")
+    hotels_df = _split_lists(pd.read_csv(settings.HOTELS_CSV))
+    places_df = _split_lists(pd.read_csv(settings.PLACES_CSV))
+    # CSVs written before facility flags / locations existed
+    if "facilities" not in hotels_df.columns:
+        _add_facility_flags(hotels_df)
+    if "locality_id" not in hotels_df.columns:
+        _add_location(hotels_df, ["locality", "address"])
+    if "locality_id" not in places_df.columns:
+        _add_location(places_df, ["city", "place"])
+    save_processed(hotels_df, places_df)
+
+
+def _ensure_parquet() -> None:
+    if not (settings.HOTELS_PARQUET.exists() and settings.PLACES_PARQUET.exists()):
+        _migrate_csv()
+
+
+def load_processed(
+    hotel_columns: list[str] | None = None,
+    place_columns: list[str] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Read the processed datasets, optionally only some columns of each.
+
+    Reads are memory-mapped and column-projected, so e.g. fitting TF-IDF
+    only touches ``search_text`` / ``full_text``. Unknown columns are skipped.
+    """
+    _ensure_parquet()
+    return (
+        _read_parquet(settings.HOTELS_PARQUET, hotel_columns),
+        _read_parquet(settings.PLACES_PARQUET, place_columns),
+    )
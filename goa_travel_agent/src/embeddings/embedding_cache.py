@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from goa_travel_agent.src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """Persistent, content-addressed store of dense vectors for ONE model.
+
+    Vectors are appended to ``vectors.f32`` (raw float32, read back through
+    ``np.memmap``) and their sha1(text) keys to ``keys.txt``, one per line:
+    line N is row N. Both files are append-only, so storing a batch costs
+    O(batch) and a reindex after a data refresh only encodes new texts.
+    ``meta.json`` (model, dim) is written once.
+    """
+
+    def __init__(self, root: Path, model_name: str) -> None:
+        self.model_name = model_name
+        self.dir = root / model_name.replace("/", "__")
+        self._vectors_path = self.dir / "vectors.f32"
+        self._keys_path = self.dir / "keys.txt"
+        self._meta_path = self.dir / "meta.json"
+        self._legacy_index_path = self.dir / "index.json"  # pre keys.txt layout
+        self._lock = threading.Lock()
+        self._dim: int | None = None
+        self._rows: dict[str, int] = {}
+        self._mmap: np.memmap | None = None
+        self._load()
+
+    @staticmethod
+    def text_key(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # -- persistence -----------------------------------------------------
+
+    def _load(self) -> None:
+        if self._legacy_index_path.exists() and not self._keys_path.exists():
+            self._migrate_legacy_index()
+        if not self._meta_path.exists():
+            return
+        try:
+            dim = int(json.loads(self._meta_path.read_text())["dim"])
+            text = self._keys_path.read_text() if self._keys_path.exists() else ""
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            log.warning("Embedding cache metadata in %s unreadable (%s), starting empty", self.dir, exc)
+            self._reset()
+            return
+
+        # an interrupted put can leave a partial last key or vectors without keys
+        keys = text.split("\n")[:-1]
+        stored = (self._vectors_path.stat().st_size if self._vectors_path.exists() else 0) // (dim * 4)
+        rows = min(len(keys), stored)
+        if rows < len(keys) or (text and not text.endswith("\n")):
+            log.warning("Embedding cache %s: dropping incomplete entries after row %d", self.dir, rows)
+            self._keys_path.write_text("".join(k + "\n" for k in keys[:rows]))
+        if self._vectors_path.exists() and self._vectors_path.stat().st_size > rows * dim * 4:
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(rows * dim * 4)
+
+        self._dim = dim
+        self._rows = {k: i for i, k in enumerate(keys[:rows])}
+        log.info("Embedding cache for '%s': %d vectors", self.model_name, len(self._rows))
+
+    def _migrate_legacy_index(self) -> None:
+        """Convert an ``index.json`` cache (rewritten on every put) to ``keys.txt``."""
+        try:
+            meta = json.loads(self._legacy_index_path.read_text())
+            dim, rows = int(meta["dim"]), dict(meta["rows"])
+        except (ValueError, KeyError, TypeError) as exc:
+            log.warning("Embedding cache index %s unreadable (%s), starting empty", self._legacy_index_path, exc)
+            self._reset()
+            return
+        keys = sorted(rows, key=rows.get)
+        self._keys_path.write_text("".join(k + "\n" for k in keys))
+        self._write_meta(dim)
+        self._legacy_index_path.unlink()
+
+    def _reset(self) -> None:
+        for path in (self._vectors_path, self._keys_path, self._meta_path, self._legacy_index_path):
+            path.unlink(missing_ok=True)
+        self._dim, self._rows, self._mmap = None, {}, None
+
+    def _write_meta(self, dim: int) -> None:
+        tmp = self._meta_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"model": self.model_name, "dim": dim}))
+        os.replace(tmp, self._meta_path)
+
+    def _vectors(self) -> np.memmap:
+        if self._mmap is None or self._mmap.shape[0] != len(self._rows):
+            self._mmap = np.memmap(
+                self._vectors_path, dtype=np.float32, mode="r", shape=(len(self._rows), self._dim),
+            )
+        return self._mmap
+
+    # -- public API ------------------------------------------------------
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Return cached vectors for the keys that are present."""
+        with self._lock:
+            hits = {k: self._rows[k] for k in keys if k in self._rows}
+            if not hits:
+                return {}
+            vectors = self._vectors()
+            order = list(hits.values())
+            block = np.asarray(vectors[order])
+            return dict(zip(hits.keys(), block))
+
+    def put_many(self, keys: list[str], vectors: np.ndarray) -> None:
+        """Append new vectors; keys already present are skipped."""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock:
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding cache for '{self.model_name}' holds {self._dim}-d vectors, got {vectors.shape[1]}-d"
+                )
+
+            fresh: list[int] = []
+            seen: set[str] = set()
+            for i, k in enumerate(keys):
+                if k not in self._rows and k not in seen:
+                    fresh.append(i)
+                    seen.add(k)
+            if not fresh:
+                return
+            self.dir.mkdir(parents=True, exist_ok=True)
+            if not self._meta_path.exists():
+                self._write_meta(self._dim)
+            # vectors first: keys without a vector are dropped on load
+            with open(self._vectors_path, "ab") as f:
+                vectors[fresh].tofile(f)
+            with open(self._keys_path, "a") as f:
+                f.write("".join(keys[i] + "\n" for i in fresh))
+            next_row = len(self._rows)
+            for offset, i in enumerate(fresh):
+                self._rows[keys[i]] = next_row + offset
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import joblib
@@ -8,6 +9,8 @@ from sentence_transformers import SentenceTransformer
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.embeddings.embedding_cache import EmbeddingCache
+from goa_travel_agent.src.utils.file_utils import file_sha256
 from goa_travel_agent.src.utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -24,11 +27,15 @@ class HybridEmbedder:
         self,
         dense_model_name: str = settings.DENSE_MODEL_NAME,
         tfidf_path: Path = settings.TFIDF_PATH,
+        embedding_cache_dir: Path | None = settings.EMBEDDING_CACHE_DIR,
     ) -> None:
         self._dense_model_name = dense_model_name
         self._tfidf_path = tfidf_path
         self._dense_model: SentenceTransformer | None = None
         self._tfidf: TfidfVectorizer | None = None
+        self._tfidf_stamp: str | None = None  # content digest of the fitted model file
+        self._embedding_cache_dir = embedding_cache_dir
+        self._embedding_cache: EmbeddingCache | None = None
 
     # -- dense -----------------------------------------------------------
 
@@ -39,11 +46,48 @@ class HybridEmbedder:
             self._dense_model = SentenceTransformer(self._dense_model_name)
         return self._dense_model
 
-    def encode_dense(self, texts: list[str], batch_size: int = 64) -> np.ndarray:
-        """Batch-encode texts to dense vectors (N x 384)."""
-        return self.dense_model.encode(
-            texts, batch_size=batch_size, show_progress_bar=True, normalize_embeddings=True,
-        )
+    @property
+    def embedding_cache(self) -> EmbeddingCache | None:
+        if self._embedding_cache is None and self._embedding_cache_dir is not None:
+            self._embedding_cache = EmbeddingCache(self._embedding_cache_dir, self._dense_model_name)
+        return self._embedding_cache
+
+    def encode_dense(
+        self,
+        texts: list[str],
+        batch_size: int = 64,
+        use_cache: bool = True,
+        show_progress_bar: bool = True,
+    ) -> np.ndarray:
+        """Batch-encode texts to dense vectors (N x 384).
+
+        With ``use_cache`` only texts missing from the on-disk embedding cache
+        are sent to the model; queries should pass ``use_cache=False``.
+        """
+        cache = self.embedding_cache if use_cache else None
+        if cache is None:
+            return self.dense_model.encode(
+                texts, batch_size=batch_size, show_progress_bar=show_progress_bar, normalize_embeddings=True,
+            )
+
+        keys = [EmbeddingCache.text_key(t) for t in texts]
+        found = cache.get_many(keys)
+        misses: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                misses.setdefault(key, text)
+        log.debug("Embedding cache: %d/%d texts cached, encoding %d", len(texts) - len(misses), len(texts), len(misses))
+
+        if misses:
+            encoded = self.dense_model.encode(
+                list(misses.values()), batch_size=batch_size, show_progress_bar=show_progress_bar, normalize_embeddings=True,
+            )
+            cache.put_many(list(misses.keys()), encoded)
+            found.update(zip(misses.keys(), encoded))
+
+        if not texts:
+            return np.empty((0, settings.DENSE_DIM), dtype=np.float32)
+        return np.stack([found[key] for key in keys]).astype(np.float32, copy=False)
 
     # -- sparse (TF-IDF) -------------------------------------------------
 
@@ -68,12 +112,14 @@ class HybridEmbedder:
         self._tfidf.fit(corpus)
         self._tfidf_path.parent.mkdir(parents=True, exist_ok=True)
         joblib.dump(self._tfidf, self._tfidf_path)
+        self._tfidf_stamp = file_sha256(self._tfidf_path)[:16]
         log.info("TF-IDF model saved to %s (vocab size: %d)", self._tfidf_path, len(self._tfidf.vocabulary_))
 
     def load_tfidf(self) -> None:
         """Load a previously fitted TF-IDF model."""
         log.info("Loading TF-IDF model from %s", self._tfidf_path)
         self._tfidf = joblib.load(self._tfidf_path)
+        self._tfidf_stamp = file_sha256(self._tfidf_path)[:16]
 
     def encode_sparse(self, text: str) -> tuple[list[int], list[float]]:
         """Transform a SINGLE text to sparse vector (indices, values).
@@ -83,5 +129,24 @@ class HybridEmbedder:
         row = self.tfidf.transform([text])
         return row.indices.tolist(), row.data.tolist()
 
+    def encode_sparse_batch(self, texts: list[str]) -> Iterator[tuple[list[int], list[float]]]:
+        """Transform a whole corpus in one call and yield (indices, values) per row.
+
+        The CSR buffers are converted to Python lists once; each row is then
+        a cheap slice between consecutive ``indptr`` offsets.
+        """
+        matrix = self.tfidf.transform(texts)
+        indptr = matrix.indptr.tolist()
+        indices = matrix.indices.tolist()
+        values = matrix.data.tolist()
+        for start, end in zip(indptr[:-1], indptr[1:]):
+            yield indices[start:end], values[start:end]
+
+    @property
+    def model_key(self) -> str:
+        """Identity of the dense model + fitted TF-IDF pair (changes when the TF-IDF file does)."""
+        _ = self.tfidf  # make sure the stamp reflects the loaded model
+        return f"{self._dense_model_name}|tfidf@{self._tfidf_stamp}"
+
     def is_tfidf_fitted(self) -> bool:
         return self._tfidf_path.exists()
@@ -19,23 +19,40 @@ def _get_searcher() -> HybridSearcher:
 
 
 @tool
-def hotel_search_tool(query: str, min_stars: float = 0, min_rating: float = 0, locality: str = "") -> str:
-    """Search hotels in Goa by description, star rating, review rating and locality.
+def hotel_search_tool(
+    query: str,
+    min_stars: float = 0,
+    min_rating: float = 0,
+    locality: str = "",
+    facilities: str = "",
+    near_locality: str = "",
+    radius_km: float = 0,
+) -> str:
+    """Search hotels in Goa by description, star rating, review rating, locality, facilities and distance.
 
     Args:
         query: Natural language description of desired hotel (e.g. 'luxury resort with pool near beach')
         min_stars: Minimum star rating (1-5), 0 means no filter
         min_rating: Minimum review rating (0-5), 0 means no filter
-        locality: Specific locality name (e.g. 'Candolim'), empty means all
+        locality: Locality name, or several comma-separated to accept any of them (e.g. 'Candolim, Baga'), empty means all
+        facilities: Comma-separated facilities the hotel must have (e.g. 'pool, spa, wifi, beach_access, parking'), empty means no filter
+        near_locality: Only hotels within radius_km of this locality (e.g. 'Baga'), empty means no distance filter
+        radius_km: Search radius around near_locality in km, 0 means the default (5 km)
     """
     searcher = _get_searcher()
-    results = searcher.search_hotels(
-        query=query,
-        min_stars=min_stars,
-        min_rating=min_rating,
-        locality=locality or None,
-        top_k=5,
-    )
+    try:
+        results = searcher.search_hotels(
+            query=query,
+            min_stars=min_stars,
+            min_rating=min_rating,
+            locality=[loc for loc in locality.split(",") if loc.strip()] or None,
+            facilities=[f for f in facilities.split(",") if f.strip()] or None,
+            near_locality=near_locality or None,
+            radius_km=radius_km or None,
+            top_k=5,
+        )
+    except ValueError as exc:
+        return f"Invalid search: {exc}"
 
     if not results:
         return "No hotels found matching your criteria."
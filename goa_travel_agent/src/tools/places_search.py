@@ -19,19 +19,30 @@ def _get_searcher() -> HybridSearcher:
 
 
 @tool
-def discover_places_tool(query: str, category: str = "") -> str:
+def discover_places_tool(
+    query: str, category: str = "", locality: str = "", near_locality: str = "", radius_km: float = 0,
+) -> str:
     """Search tourist attractions and places to visit in Goa.
 
     Args:
         query: Natural language description of what you want to do or see (e.g. 'romantic sunset spot')
-        category: Filter by category - one of: Beach, Nightlife, Culture, Adventure, Wellness, Food. Empty means all.
+        category: Filter by category - one or more (comma-separated) of: Beach, Nightlife, Culture, Adventure, Wellness, Food. A place matches if it has any of them. Empty means all.
+        locality: Town/village name, or several comma-separated to accept any of them (e.g. 'Anjuna, Vagator'), empty means all
+        near_locality: Only places within radius_km of this locality (e.g. 'Panjim'), empty means anywhere
+        radius_km: Search radius around near_locality in km, 0 means the default (5 km)
     """
     searcher = _get_searcher()
-    results = searcher.search_places(
-        query=query,
-        category=category or None,
-        top_k=5,
-    )
+    try:
+        results = searcher.search_places(
+            query=query,
+            category=[c for c in category.split(",") if c.strip()] or None,
+            locality=[loc for loc in locality.split(",") if loc.strip()] or None,
+            near_locality=near_locality or None,
+            radius_km=radius_km or None,
+            top_k=5,
+        )
+    except ValueError as exc:
+        return f"Invalid search: {exc}"
 
     if not results:
         return "No places found matching your query."
@@ -40,7 +51,8 @@ def discover_places_tool(query: str, category: str = "") -> str:
     for r in results:
         place = r.get("place", r.get("full_text", "N/A"))
         city = r.get("city", "?")
-        cat = r.get("category", "General")
+        cat = r.get("category") or ["General"]
+        cat = cat if isinstance(cat, str) else ", ".join(cat)
         review = r.get("review", "")
         snippet = (review[:150] + "...") if len(str(review)) > 150 else review
         lines.append(f"- {place} ({city}) [{cat}]: {snippet}")
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.utils.file_utils import file_sha256
+from goa_travel_agent.src.utils.geo_utils import GOA_COORDS, LOCALITY_ALIASES
+from goa_travel_agent.src.utils.logger import get_logger
+from goa_travel_agent.src.vector_db.doc_store import LAYOUT as DOC_STORE_LAYOUT
+
+log = get_logger(__name__)
+
+# Pipeline stages in execution order; each one consumes the outputs of the previous ones.
+STAGES = ("preprocess", "tfidf", "index")
+
+
+class StagePlan(NamedTuple):
+    stage: str
+    run: bool
+    reason: str
+
+
+def raw_files() -> list[Path]:
+    """Raw CSVs of both Kaggle datasets, as laid out by ``download_dataset``."""
+    files: list[Path] = []
+    for slug in (settings.HOTELS_DATASET, settings.PLACES_DATASET):
+        files.extend(sorted((settings.RAW_DIR / slug.split("/")[-1]).glob("*.csv")))
+    return files
+
+
+def config_digest() -> str:
+    """Digest of every setting (and the locality gazetteer) that changes what preprocessing produces."""
+    config = {
+        "goa_cities": sorted(settings.GOA_CITIES),
+        "place_categories": settings.PLACE_CATEGORIES,
+        "hotel_columns": settings.HOTEL_COLUMNS,
+        "place_columns": settings.PLACE_COLUMNS,
+        "hotel_facilities": settings.HOTEL_FACILITIES,
+        "goa_coords": GOA_COORDS,
+        "locality_aliases": LOCALITY_ALIASES,
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+
+class BuildManifest:
+    """What each pipeline stage was last built from, persisted as JSON.
+
+    A stage reruns only when the fingerprint of one of its inputs differs
+    from the recorded one, or when its outputs are gone. Inputs that cannot
+    be fingerprinted right now (raw files not downloaded, e.g. on a node
+    bootstrapped from a bundle) are not compared. A stage with no entry but
+    with outputs on disk is adopted as-is, so upgrading an existing install
+    does not trigger a rebuild.
+
+    File digests are cached by (size, mtime) so unchanged files are not
+    re-hashed on every start.
+    """
+
+    def __init__(self, path: Path = settings.BUILD_MANIFEST_PATH) -> None:
+        self.path = Path(path)
+        self.data: dict = {"files": {}, "stages": {}}
+        if self.path.exists():
+            try:
+                self.data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                log.warning("Unreadable build manifest %s, starting a new one", self.path)
+
+    # -- fingerprints ----------------------------------------------------
+
+    def file_digest(self, path: Path) -> str | None:
+        if not path.exists():
+            return None
+        stat = path.stat()
+        cached = self.data["files"].get(str(path))
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            return cached["sha256"]
+        digest = file_sha256(path)
+        self.data["files"][str(path)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        return digest
+
+    def _digests(self, paths: list[Path]) -> dict[str, str | None]:
+        return {p.name: self.file_digest(p) for p in paths}
+
+    def inputs(self, stage: str) -> dict:
+        """Current fingerprints of everything ``stage`` is built from (None = unknown)."""
+        processed = self._digests([settings.HOTELS_PARQUET, settings.PLACES_PARQUET])
+        if stage == "preprocess":
+            return {"config": config_digest(), "raw": self._digests(raw_files()) or None}
+        if stage == "tfidf":
+            return {"processed": processed}
+        if stage == "index":
+            return {
+                "processed": processed,
+                "tfidf": self.file_digest(settings.TFIDF_PATH),
+                "dense_model": f"{settings.DENSE_MODEL_NAME}@{settings.DENSE_DIM}",
+                "doc_store_fields": list(settings.DOC_STORE_FIELDS),
+                "doc_store_layout": DOC_STORE_LAYOUT,
+                "target": f"{settings.VECTOR_BACKEND}:{settings.QDRANT_URL}",
+            }
+        raise ValueError(f"Unknown stage '{stage}', expected one of {STAGES}")
+
+    def _outputs_present(self, stage: str) -> bool:
+        if stage == "preprocess":
+            from goa_travel_agent.src.data_management.preprocessor import processed_exists
+
+            return processed_exists()
+        if stage == "tfidf":
+            return settings.TFIDF_PATH.exists()
+        raise ValueError(f"Outputs of stage '{stage}' must be checked by the caller")
+
+    # -- decisions -------------------------------------------------------
+
+    def check(self, stage: str, present: bool | None = None, force: bool = False) -> StagePlan:
+        """Whether ``stage`` must run now. ``present`` overrides the output check (needed for "index")."""
+        if force:
+            return StagePlan(stage, True, "forced")
+        if not (self._outputs_present(stage) if present is None else present):
+            return StagePlan(stage, True, "outputs missing")
+        recorded = self.data["stages"].get(stage)
+        if recorded is None:
+            return StagePlan(stage, False, "no manifest entry, adopting existing outputs")
+        current = self.inputs(stage)
+        changed = [
+            key for key, value in current.items()
+            if value is not None and recorded["inputs"].get(key) != value
+        ]
+        if changed:
+            return StagePlan(stage, True, "changed: " + ", ".join(changed))
+        return StagePlan(stage, False, "up to date")
+
+    def plan(self, index_present: bool | None = None, reindex: bool = False) -> list[StagePlan]:
+        """Decision for every stage, assuming any stage that runs changes its outputs.
+
+        ``index_present=None`` means there is no vector store to index into.
+        """
+        steps: list[StagePlan] = []
+        upstream = ""
+        for stage in STAGES:
+            if stage == "index" and index_present is None:
+                steps.append(StagePlan(stage, False, "no vector backend configured"))
+                continue
+            if stage == "index":
+                step = self.check(stage, present=index_present, force=reindex)
+            else:
+                step = self.check(stage)
+            if not step.run and upstream:
+                step = StagePlan(stage, True, f"if {upstream} changes its outputs")
+            upstream = upstream or (stage if step.run else "")
+            steps.append(step)
+        return steps
+
+    # -- recording -------------------------------------------------------
+
+    def record(self, stage: str) -> None:
+        """Store the current input fingerprints of ``stage`` (after it ran or was found up to date)."""
+        entry = self.data["stages"].get(stage, {})
+        previous = entry.get("inputs", {})
+        inputs = {key: previous.get(key) if value is None else value for key, value in self.inputs(stage).items()}
+        if inputs != previous or "built_at" not in entry:
+            entry = {"inputs": inputs, "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+        self.data["stages"][stage] = entry
+        self.save()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self.data, indent=2, sort_keys=True))
+        tmp.replace(self.path)
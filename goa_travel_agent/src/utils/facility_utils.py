@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+import pandas as pd
+
+from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# One word-bounded alternation per flag: "bar" must not match "barbecue".
+_PATTERNS: dict[str, re.Pattern] = {
+    flag: re.compile(r"\b(?:" + "|".join(re.escape(kw) for kw in keywords) + r")\b", re.IGNORECASE)
+    for flag, keywords in settings.HOTEL_FACILITIES.items()
+}
+
+
+def facility_flags(text: object) -> list[str]:
+    """Normalized facility flags mentioned in a free-text facilities string."""
+    if not isinstance(text, str):
+        return []
+    return [flag for flag, pattern in _PATTERNS.items() if pattern.search(text)]
+
+
+def facility_flags_column(texts: pd.Series) -> pd.Series:
+    """``facility_flags`` over a whole column, one vectorized scan per flag."""
+    texts = texts.fillna("").astype(str)
+    hits = pd.DataFrame({flag: texts.str.contains(pattern) for flag, pattern in _PATTERNS.items()})
+    flags = list(_PATTERNS)
+    return pd.Series(
+        [[flag for flag, hit in zip(flags, row) if hit] for row in hits.to_numpy()],
+        index=texts.index,
+        dtype=object,
+    )
+
+
+def normalize_facilities(requested: str | Iterable[str] | None) -> list[str]:
+    """Map requested facilities ("pool, Wi-Fi", ["beach_access"]) to flag names.
+
+    Accepts flag names or any keyword of ``settings.HOTEL_FACILITIES``;
+    unrecognized entries are logged and ignored rather than turned into a
+    filter that can never match.
+    """
+    if not requested:
+        return []
+    items = requested.split(",") if isinstance(requested, str) else list(requested)
+    flags: list[str] = []
+    for item in (str(i).strip() for i in items):
+        if not item:
+            continue
+        key = item.lower().replace(" ", "_")
+        matched = [key] if key in settings.HOTEL_FACILITIES else facility_flags(item)
+        if not matched:
+            log.warning("Unknown facility '%s' ignored (known: %s)", item, ", ".join(settings.HOTEL_FACILITIES))
+        flags.extend(matched)
+    return list(dict.fromkeys(flags))
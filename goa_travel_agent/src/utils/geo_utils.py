@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import math
+import re
 
-# Hardcoded coordinates for ~30 Goa localities (lat, lon)
+import numpy as np
+import pandas as pd
+
+# Hardcoded coordinates for ~40 Goa localities (lat, lon)
 GOA_COORDS: dict[str, tuple[float, float]] = {
     "agonda": (14.9888, 74.0023),
+    "amboli": (15.9630, 73.9990),  # hill station just over the border, in the places dataset
     "anjuna": (15.5739, 73.7413),
     "arambol": (15.6868, 73.7042),
+    "ashwem": (15.6500, 73.7180),
     "assagao": (15.5935, 73.7631),
     "baga": (15.5551, 73.7514),
     "bardez": (15.5600, 73.7800),
@@ -14,13 +20,18 @@ GOA_COORDS: dict[str, tuple[float, float]] = {
     "calangute": (15.5439, 73.7555),
     "canacona": (15.0100, 74.0500),
     "candolim": (15.5176, 73.7620),
+    "caranzalem": (15.4650, 73.8080),
+    "cavelossim": (15.1730, 73.9420),
     "chapora": (15.6044, 73.7351),
     "colva": (15.2798, 73.9221),
+    "dabolim": (15.3800, 73.8380),
     "divar island": (15.5100, 73.8800),
     "dona paula": (15.3955, 73.8079),
+    "mandrem": (15.6660, 73.7130),
     "margao": (15.2832, 73.9862),
     "marmagao": (15.3989, 73.7929),
     "mapusa": (15.5923, 73.8080),
+    "miramar": (15.4790, 73.8070),
     "mobor": (15.2108, 73.9275),
     "morjim": (15.6308, 73.7273),
     "nuvem": (15.3100, 73.9400),
@@ -33,6 +44,7 @@ GOA_COORDS: dict[str, tuple[float, float]] = {
     "sangolda": (15.5500, 73.7900),
     "sanguem": (15.2300, 74.1500),
     "sanquelim": (15.5600, 74.0100),
+    "sinquerim": (15.5000, 73.7670),
     "vagator": (15.5979, 73.7353),
     "varca": (15.2340, 73.9310),
     "vasco da gama": (15.3982, 73.8113),
@@ -40,6 +52,20 @@ GOA_COORDS: dict[str, tuple[float, float]] = {
     "verna": (15.3600, 73.9400),
 }
 
+# Alternative spellings of a gazetteer name. Neighbouring villages are not
+# aliases: they get their own entry above, so a locality filter stays exact.
+LOCALITY_ALIASES: dict[str, str] = {
+    "panaji": "panjim",
+    "pangim": "panjim",
+    "alto porvorim": "porvorim",
+    "alto-porvorim": "porvorim",
+    "madgaon": "margao",
+    "mormugao": "marmagao",
+    "vasco": "vasco da gama",
+    "old-goa": "old goa",
+    "velha goa": "old goa",
+}
+
 TRAFFIC_FACTOR = 1.5  # Goa roads multiplier
 AVG_SPEED_KMH = 30  # average speed in Goa (accounting for traffic)
 
@@ -56,6 +82,77 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+# Longest names first, so "old goa" wins over a shorter name inside it.
+_GAZETTEER_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(n) for n in sorted({*GOA_COORDS, *LOCALITY_ALIASES}, key=len, reverse=True))
+    + r")\b"
+)
+
+
+def find_locality(text: object) -> str | None:
+    """First gazetteer locality named in free text ("Near Candolim Beach" -> "candolim", "Panaji" -> "panjim")."""
+    if not isinstance(text, str):
+        return None
+    match = _GAZETTEER_RE.search(text.lower())
+    if not match:
+        return None
+    return LOCALITY_ALIASES.get(match.group(1), match.group(1))
+
+
+def locality_id(*texts: object) -> str | None:
+    """Canonical locality id: the first gazetteer hit among ``texts``, slugged ("old goa" -> "old_goa").
+
+    When none of them names a known locality, the slug of the first
+    non-empty text is used, so unknown localities still filter exactly.
+    """
+    for text in texts:
+        name = find_locality(text)
+        if name:
+            return _slug(name)
+    for text in texts:
+        if isinstance(text, str) and text.strip():
+            return _slug(text)
+    return None
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", text.strip().lower()).strip("_")
+
+
+def locality_id_column(*columns: pd.Series) -> pd.Series:
+    """``locality_id`` row by row over aligned columns, each distinct combination resolved once."""
+    frame = pd.concat([c.where(c.notna(), None) for c in columns], axis=1)
+    keys = list(frame.itertuples(index=False, name=None))
+    resolved = {key: locality_id(*key) for key in set(keys)}
+    return pd.Series([resolved[key] for key in keys], index=columns[0].index, dtype=object)
+
+
+def locality_coords(text: object) -> tuple[float, float] | None:
+    """(lat, lon) of the locality named in ``text``, None if it is not in the gazetteer."""
+    name = find_locality(text)
+    return GOA_COORDS[name] if name else None
+
+
+def coords_columns(*columns: pd.Series) -> pd.DataFrame:
+    """``lat`` / ``lon`` columns from the first of ``columns`` that names a known locality.
+
+    Rows without a match get NaN. Each distinct value is resolved once.
+    """
+    coords = np.full((len(columns[0]), 2), np.nan)
+    for col in columns:
+        todo = np.flatnonzero(np.isnan(coords[:, 0]))
+        if todo.size == 0:
+            break
+        values = col.to_numpy(dtype=object)[todo]
+        resolved = {v: locality_coords(v) for v in set(values)}
+        hits = [(row, resolved[v]) for row, v in zip(todo, values) if resolved[v] is not None]
+        if hits:
+            rows, found = zip(*hits)
+            coords[list(rows)] = np.asarray(found, dtype=float)
+    return pd.DataFrame({"lat": coords[:, 0], "lon": coords[:, 1]}, index=columns[0].index)
+
+
 def distance_between(loc1: str, loc2: str) -> float | None:
     """Return approximate distance in km between two Goa localities."""
     c1 = GOA_COORDS.get(loc1.lower())
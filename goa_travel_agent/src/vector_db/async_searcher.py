@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import Executor
+from functools import partial
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Filter, SparseVector
+
+from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder
+from goa_travel_agent.src.vector_db.backends import create_async_client
+from goa_travel_agent.src.vector_db.searcher import _hotel_filter, _place_filter, _SearchCore
+
+_last_stats: contextvars.ContextVar[list[dict]] = contextvars.ContextVar("async_search_stats", default=[])
+
+
+class AsyncHybridSearcher(_SearchCore):
+    """asyncio variant of ``HybridSearcher`` built on ``AsyncQdrantClient``.
+
+    Query encoding and cross-encoder reranking run in an executor so the
+    event loop keeps serving other searches; in client search mode the dense
+    and sparse Qdrant queries are issued concurrently. Filters, caches and
+    the rerank policy are shared with the sync searcher.
+    """
+
+    def __init__(
+        self,
+        embedder: HybridEmbedder,
+        qdrant_client: AsyncQdrantClient | None = None,
+        search_mode: str = settings.SEARCH_MODE,
+        rerank_policy: str = settings.RERANK_POLICY,
+        executor: Executor | None = None,
+        index_profile: str = settings.INDEX_PROFILE,
+    ) -> None:
+        super().__init__(embedder, search_mode, rerank_policy, index_profile)
+        self.client = qdrant_client or create_async_client()
+        self._executor = executor  # None -> loop's default thread pool
+
+    @property
+    def last_batch_stats(self) -> list[dict]:
+        """Per-query stats of the last search awaited in the current task context."""
+        return _last_stats.get()
+
+    async def _run_cpu(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args))
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    # -- candidate retrieval ---------------------------------------------
+
+    async def _fetch_fused(
+        self,
+        collection: str,
+        encoded: list[tuple[list[float], SparseVector]],
+        filters: list[Filter | None],
+        retrieve_limit: int,
+    ) -> list[list[dict]]:
+        requests = [
+            self._fused_request(q_dense, q_sparse, qfilter, retrieve_limit)
+            for (q_dense, q_sparse), qfilter in zip(encoded, filters)
+        ]
+        responses = await self.client.query_batch_points(collection_name=collection, requests=requests)
+        return [self._fused_candidates(resp) for resp in responses]
+
+    async def _fetch_client_fused(
+        self,
+        collection: str,
+        encoded: list[tuple[list[float], SparseVector]],
+        filters: list[Filter | None],
+        retrieve_limit: int,
+    ) -> list[list[dict]]:
+        dense_reqs, sparse_reqs = self._client_requests(encoded, filters, retrieve_limit)
+        dense_resps, sparse_resps = await asyncio.gather(
+            self.client.query_batch_points(collection_name=collection, requests=dense_reqs),
+            self.client.query_batch_points(collection_name=collection, requests=sparse_reqs),
+        )
+        fused_lists = self._client_fuse(dense_resps, sparse_resps)
+
+        all_ids = list({pid: None for fused in fused_lists for pid, _ in fused})
+        if not all_ids:
+            return [[] for _ in fused_lists]
+        records = await self.client.retrieve(collection, ids=all_ids, with_payload=True)
+        return self._attach_payloads(fused_lists, records)
+
+    # -- facets ----------------------------------------------------------
+
+    async def category_facets(self, city: str | None = None) -> dict[str, int]:
+        key = self._facet_key(city)
+        counts = self._facet_cache.get(key)
+        if counts is None:
+            resp = await self.client.facet(
+                collection_name=settings.PLACES_COLLECTION,
+                key="category",
+                facet_filter=self._facet_filter("city", city),
+                limit=len(settings.PLACE_CATEGORIES) + 1,
+                exact=True,
+            )
+            counts = self._facet_counts(resp)
+            self._facet_cache.put(key, counts)
+        return counts
+
+    async def category_facets_by_city(self) -> dict[str, dict[str, int]]:
+        key = self._facet_key(None, field="city")
+        cities = self._facet_cache.get(key)
+        if cities is None:
+            resp = await self.client.facet(
+                collection_name=settings.PLACES_COLLECTION, key="city", limit=len(settings.GOA_CITIES), exact=True,
+            )
+            cities = self._facet_counts(resp)
+            self._facet_cache.put(key, cities)
+        cities = list(cities)
+        counts = await asyncio.gather(*(self.category_facets(city) for city in cities))
+        return dict(zip(cities, counts))
+
+    # -- core search -----------------------------------------------------
+
+    async def _search_batch(
+        self,
+        collection: str,
+        queries: list[str],
+        filters: list[Filter | None],
+        retrieve_limit: int = 20,
+        top_k: int = 5,
+        text_field: str = "search_text",
+    ) -> list[list[dict]]:
+        if not queries:
+            return []
+        start = time.perf_counter()
+        encoded = await self._run_cpu(self._encode_queries, queries)
+
+        fetch = self._fetch_fused if self.search_mode == "fusion" else self._fetch_client_fused
+        candidate_lists = await fetch(collection, encoded, filters, retrieve_limit)
+
+        results, all_stats = await self._run_cpu(
+            self._rank, collection, queries, candidate_lists, top_k, text_field,
+        )
+        self._finish_stats(all_stats, start)
+        _last_stats.set(all_stats)
+        return results
+
+    # -- public API ------------------------------------------------------
+
+    async def search_hotels(
+        self,
+        query: str,
+        min_stars: float = 0,
+        min_rating: float = 0,
+        locality: str | list[str] | None = None,
+        facilities: list[str] | None = None,
+        top_k: int = 5,
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
+    ) -> list[dict]:
+        results = await self._search_batch(
+            collection=settings.HOTELS_COLLECTION,
+            queries=[query],
+            filters=[_hotel_filter(min_stars, min_rating, locality, facilities, near, radius_km, near_locality)],
+            top_k=top_k,
+            text_field="search_text",
+        )
+        return results[0]
+
+    async def search_places(
+        self,
+        query: str,
+        category: str | list[str] | None = None,
+        top_k: int = 5,
+        category_match: str = "any",
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
+        locality: str | list[str] | None = None,
+    ) -> list[dict]:
+        results = await self._search_batch(
+            collection=settings.PLACES_COLLECTION,
+            queries=[query],
+            filters=[_place_filter(category, category_match, near, radius_km, near_locality, locality)],
+            top_k=top_k,
+            text_field="full_text",
+        )
+        return results[0]
+
+    async def search_hotels_batch(
+        self,
+        queries: list[str],
+        min_stars: float = 0,
+        min_rating: float = 0,
+        locality: str | list[str] | None = None,
+        facilities: list[str] | None = None,
+        top_k: int = 5,
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
+    ) -> list[list[dict]]:
+        qfilter = _hotel_filter(min_stars, min_rating, locality, facilities, near, radius_km, near_locality)
+        return await self._search_batch(
+            collection=settings.HOTELS_COLLECTION,
+            queries=queries,
+            filters=[qfilter] * len(queries),
+            top_k=top_k,
+            text_field="search_text",
+        )
+
+    async def search_places_batch(
+        self,
+        queries: list[str],
+        category: str | list[str] | None = None,
+        top_k: int = 5,
+        category_match: str = "any",
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
+        locality: str | list[str] | None = None,
+    ) -> list[list[dict]]:
+        qfilter = _place_filter(category, category_match, near, radius_km, near_locality, locality)
+        return await self._search_batch(
+            collection=settings.PLACES_COLLECTION,
+            queries=queries,
+            filters=[qfilter] * len(queries),
+            top_k=top_k,
+            text_field="full_text",
+        )
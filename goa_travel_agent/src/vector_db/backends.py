@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from collections import deque
+from typing import Any, Protocol
+
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+VECTOR_BACKENDS = ("qdrant", "local")
+
+_local_store = None
+_local_lock = threading.Lock()
+_clients: dict[tuple[str, str], InstrumentedClient] = {}
+_clients_lock = threading.Lock()
+
+
+class VectorBackend(Protocol):
+    """The slice of the ``QdrantClient`` API the project relies on.
+
+    ``QdrantClient`` satisfies it natively; ``LocalVectorStore`` reimplements
+    it in-process so indexing and search code never branch on the backend.
+    """
+
+    def collection_exists(self, collection_name: str) -> bool: ...
+    def create_collection(self, collection_name: str, vectors_config: Any, **kwargs: Any) -> bool: ...
+    def recreate_collection(self, collection_name: str, vectors_config: Any, **kwargs: Any) -> bool: ...
+    def delete_collection(self, collection_name: str, **kwargs: Any) -> bool: ...
+    def get_collection(self, collection_name: str) -> Any: ...
+    def get_collections(self) -> Any: ...
+    def get_aliases(self) -> Any: ...
+    def update_collection_aliases(self, change_aliases_operations: Any, **kwargs: Any) -> bool: ...
+    def create_payload_index(self, collection_name: str, field_name: str, field_schema: Any = None, **kwargs: Any) -> Any: ...
+    def delete_payload_index(self, collection_name: str, field_name: str, **kwargs: Any) -> Any: ...
+    def upsert(self, collection_name: str, points: Any, **kwargs: Any) -> Any: ...
+    def delete(self, collection_name: str, points_selector: Any, **kwargs: Any) -> Any: ...
+    def scroll(self, collection_name: str, **kwargs: Any) -> tuple[list, Any]: ...
+    def retrieve(self, collection_name: str, ids: Any, with_payload: Any = True, **kwargs: Any) -> list: ...
+    def query_points(self, collection_name: str, **kwargs: Any) -> Any: ...
+    def query_batch_points(self, collection_name: str, requests: Any, **kwargs: Any) -> list: ...
+    def facet(self, collection_name: str, key: str, **kwargs: Any) -> Any: ...
+
+
+def _check_backend(backend: str) -> None:
+    if backend not in VECTOR_BACKENDS:
+        raise ValueError(f"Unknown VECTOR_BACKEND '{backend}', expected one of {VECTOR_BACKENDS}")
+
+
+def _local_store_instance():
+    # One store per process: collections are cached in memory and writes
+    # must go through the same object the searchers read from.
+    global _local_store
+    from goa_travel_agent.src.vector_db.local_backend import LocalVectorStore
+
+    with _local_lock:
+        if _local_store is None:
+            _local_store = LocalVectorStore(settings.LOCAL_INDEX_DIR)
+        return _local_store
+
+
+class CallStats:
+    """Latency of recent calls to one client method (bounded window)."""
+
+    def __init__(self, window: int = 1000) -> None:
+        self.calls = 0
+        self.errors = 0
+        self._recent_ms: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float, failed: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.errors += failed
+            self._recent_ms.append(elapsed_ms)
+
+    def summary(self) -> dict[str, float]:
+        with self._lock:
+            recent = sorted(self._recent_ms)
+        if not recent:
+            return {"calls": self.calls, "errors": self.errors}
+        pick = lambda pct: recent[min(len(recent) - 1, int(pct / 100 * len(recent)))]  # noqa: E731
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_ms": round(sum(recent) / len(recent), 3),
+            "p50_ms": round(pick(50), 3),
+            "p95_ms": round(pick(95), 3),
+        }
+
+
+class InstrumentedClient:
+    """Transparent proxy that times every public method call of a client.
+
+    Works for sync and asyncio clients alike: awaitables are timed until
+    they complete. Per-method stats are exposed through ``latency_stats``.
+    """
+
+    def __init__(self, client: Any, transport: str) -> None:
+        self._client = client
+        self.transport = transport
+        self._stats: dict[str, CallStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def _stats_for(self, name: str) -> CallStats:
+        with self._stats_lock:
+            return self._stats.setdefault(name, CallStats())
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        stats = self._stats_for(name)
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                result = attr(*args, **kwargs)
+            except Exception:
+                stats.record((time.perf_counter() - start) * 1000, failed=True)
+                raise
+            if not inspect.isawaitable(result):
+                stats.record((time.perf_counter() - start) * 1000, failed=False)
+                return result
+
+            async def awaited() -> Any:
+                failed = True
+                try:
+                    value = await result
+                    failed = False
+                    return value
+                finally:
+                    stats.record((time.perf_counter() - start) * 1000, failed=failed)
+
+            return awaited()
+
+        return timed
+
+    def latency_stats(self) -> dict[str, dict[str, float]]:
+        with self._stats_lock:
+            items = list(self._stats.items())
+        return {name: stats.summary() for name, stats in sorted(items)}
+
+
+def _qdrant_kwargs(url: str, api_key: str, grpc: bool) -> dict:
+    kwargs: dict = {
+        "url": url or settings.QDRANT_URL,
+        "timeout": settings.QDRANT_TIMEOUT_S,
+        "pool_size": settings.QDRANT_POOL_SIZE,  # gRPC channels / HTTP connections
+    }
+    key = api_key or settings.QDRANT_API_KEY
+    if key:
+        kwargs["api_key"] = key
+    if grpc:
+        keepalive_ms = settings.QDRANT_KEEPALIVE_S * 1000
+        kwargs.update(
+            prefer_grpc=True,
+            grpc_port=settings.QDRANT_GRPC_PORT,
+            grpc_options={
+                "grpc.keepalive_time_ms": keepalive_ms,
+                "grpc.keepalive_timeout_ms": min(keepalive_ms, 10_000),
+                "grpc.keepalive_permit_without_calls": 1,
+                "grpc.http2.max_pings_without_data": 0,
+            },
+        )
+    return kwargs
+
+
+def _connect_qdrant(url: str, api_key: str) -> InstrumentedClient:
+    if settings.QDRANT_PREFER_GRPC:
+        client = QdrantClient(**_qdrant_kwargs(url, api_key, grpc=True))
+        try:
+            client.get_collections()  # goes over gRPC: proves the port is reachable
+            log.info("Qdrant client: gRPC on port %d, pool size %d", settings.QDRANT_GRPC_PORT, settings.QDRANT_POOL_SIZE)
+            return InstrumentedClient(client, "grpc")
+        except Exception as exc:
+            log.warning(
+                "Qdrant gRPC unavailable on port %d (%s), falling back to HTTP",
+                settings.QDRANT_GRPC_PORT, type(exc).__name__,
+            )
+            log.debug("gRPC probe failure", exc_info=exc)
+            client.close()
+    log.info("Qdrant client: HTTP, pool size %d", settings.QDRANT_POOL_SIZE)
+    return InstrumentedClient(QdrantClient(**_qdrant_kwargs(url, api_key, grpc=False)), "http")
+
+
+def create_client(url: str = "", api_key: str = "", backend: str = settings.VECTOR_BACKEND) -> VectorBackend:
+    """Shared, thread-safe client for the store selected by ``VECTOR_BACKEND``.
+
+    Every caller with the same (url, api key) gets the same pooled client,
+    so searches and indexing in one process reuse warm connections.
+    """
+    _check_backend(backend)
+    if backend == "local":
+        return _local_store_instance()
+    key = (url or settings.QDRANT_URL, api_key or settings.QDRANT_API_KEY)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _connect_qdrant(*key)
+        return client
+
+
+def create_async_client(url: str = "", api_key: str = "", backend: str = settings.VECTOR_BACKEND):
+    """asyncio counterpart of ``create_client``.
+
+    Async clients are bound to the event loop they first run on, so each
+    call builds a new (instrumented, pooled) one instead of sharing.
+    """
+    _check_backend(backend)
+    if backend == "local":
+        from goa_travel_agent.src.vector_db.local_backend import AsyncLocalVectorStore
+
+        return AsyncLocalVectorStore(_local_store_instance())
+    grpc = settings.QDRANT_PREFER_GRPC and "grpc" == getattr(create_client(url, api_key, backend), "transport", "")
+    return InstrumentedClient(AsyncQdrantClient(**_qdrant_kwargs(url, api_key, grpc=grpc)), "grpc" if grpc else "http")
+
+
+def latency_stats() -> dict[str, dict[str, dict[str, float]]]:
+    """Per-method call latency of every shared Qdrant client, keyed by URL."""
+    with _clients_lock:
+        clients = list(_clients.items())
+    return {url: client.latency_stats() for (url, _), client in clients}
+
+
+def close_clients() -> None:
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
+def backend_configured() -> bool:
+    """True when there is a vector store to index into / search against."""
+    return settings.VECTOR_BACKEND == "local" or bool(settings.QDRANT_URL)
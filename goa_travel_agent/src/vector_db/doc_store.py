@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Bumped whenever the table key changes; part of the "index" build inputs,
+# so the next sync refills a store that had to be recreated.
+LAYOUT = "content-hash-v1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    collection   TEXT NOT NULL,
+    point_id     TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    doc          TEXT NOT NULL,
+    PRIMARY KEY (collection, point_id, content_hash)
+) WITHOUT ROWID
+"""
+
+DocKey = tuple[str, str]  # (point id, content_hash)
+
+_store: DocStore | None = None
+_store_lock = threading.Lock()
+
+
+def _columns(conn: sqlite3.Connection, schema: str = "main") -> set[str]:
+    return {row[1] for row in conn.execute(f"PRAGMA {schema}.table_info(docs)")}
+
+
+class DocStore:
+    """Long text fields of indexed points, keyed by (collection, point id, content_hash).
+
+    Backed by SQLite in WAL mode with a memory-mapped read path: searches
+    read concurrently while indexing writes. Collections are addressed by
+    their logical name (the alias); the ``content_hash`` in the key lets
+    every blue/green version behind the alias find its own text, so a
+    rebuild never overwrites what the live version serves. Rows no version
+    references any more are removed by ``QdrantManager.gc_docs``. Each
+    thread gets its own connection.
+    """
+
+    def __init__(self, path: Path = settings.DOC_STORE_PATH, mmap_bytes: int = 256 << 20) -> None:
+        self.path = Path(path)
+        self.mmap_bytes = mmap_bytes
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._conn() as conn:
+            if _columns(conn) and "content_hash" not in _columns(conn):
+                # keyed by point id only: cannot tell versions apart, refilled by the next sync
+                log.warning("Recreating document store %s with content_hash keys", self.path)
+                conn.execute("DROP TABLE docs")
+            conn.execute(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_bytes)}")
+            self._local.conn = conn
+        return conn
+
+    def put_many(self, collection: str, docs: Iterable[tuple[str, str, dict]]) -> int:
+        """Store (point id, content_hash, doc) triples."""
+        rows = [(collection, str(pid), h, json.dumps(doc, default=str)) for pid, h, doc in docs]
+        with self._conn() as conn:
+            conn.executemany("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def get_many(self, collection: str, keys: Iterable[DocKey]) -> dict[DocKey, dict]:
+        """{(point id, content_hash): doc} for the keys that are stored (missing keys are skipped)."""
+        keys = list(dict.fromkeys((str(pid), h) for pid, h in keys if h))
+        found: dict[DocKey, dict] = {}
+        conn = self._conn()
+        for start in range(0, len(keys), 400):  # stay under SQLITE_MAX_VARIABLE_NUMBER
+            chunk = keys[start : start + 400]
+            pairs = ",".join(["(?, ?)"] * len(chunk))
+            for pid, h, doc in conn.execute(
+                "SELECT point_id, content_hash, doc FROM docs "
+                f"WHERE collection = ? AND (point_id, content_hash) IN (VALUES {pairs})",
+                [collection, *(v for key in chunk for v in key)],
+            ):
+                found[(pid, h)] = json.loads(doc)
+        return found
+
+    def keys(self, collection: str) -> set[DocKey]:
+        return set(self._conn().execute("SELECT point_id, content_hash FROM docs WHERE collection = ?", (collection,)))
+
+    def delete_many(self, collection: str, keys: Iterable[DocKey]) -> int:
+        rows = [(collection, str(pid), h) for pid, h in keys]
+        with self._conn() as conn:
+            conn.executemany("DELETE FROM docs WHERE collection = ? AND point_id = ? AND content_hash = ?", rows)
+        return len(rows)
+
+    def retain(self, collection: str, keys: Iterable[DocKey]) -> int:
+        """Delete every doc of ``collection`` whose (point id, content_hash) is not in ``keys``."""
+        keep = {(str(pid), h) for pid, h in keys}
+        return self.delete_many(collection, [key for key in self.keys(collection) if key not in keep])
+
+    def backup_to(self, dest: Path) -> None:
+        """Consistent copy of the whole store (safe while other threads write)."""
+        dest.unlink(missing_ok=True)
+        with sqlite3.connect(dest) as target:
+            self._conn().backup(target)
+        target.close()
+
+    def restore_from(self, src: Path, hashes: dict[str, dict] | None = None) -> int:
+        """Merge the docs of a store copied by ``backup_to`` into this one.
+
+        Existing rows are kept, so versions still behind an alias keep their
+        text. Copies made before docs were keyed by content_hash are keyed
+        through ``hashes`` ({collection: {point id: content_hash}}, i.e. the
+        points restored with them); without it they are skipped.
+        """
+        conn = self._conn()
+        conn.execute("ATTACH DATABASE ? AS src", (str(src),))
+        try:
+            columns = _columns(conn, "src")
+            with conn:
+                if "content_hash" in columns:
+                    before = conn.total_changes
+                    conn.execute("INSERT OR IGNORE INTO docs SELECT collection, point_id, content_hash, doc FROM src.docs")
+                    return conn.total_changes - before
+                if not columns:
+                    return 0
+                if not hashes:
+                    log.warning("Skipping document store %s: keyed by point id only", src)
+                    return 0
+                rows = [
+                    (collection, pid, hashes[collection][pid], doc)
+                    for collection, pid, doc in conn.execute("SELECT collection, point_id, doc FROM src.docs")
+                    if hashes.get(collection, {}).get(pid)
+                ]
+                conn.executemany("INSERT OR IGNORE INTO docs VALUES (?, ?, ?, ?)", rows)
+                return len(rows)
+        finally:
+            conn.execute("DETACH DATABASE src")
+
+
+def split_payload(payload: dict, fields: Iterable[str] = settings.DOC_STORE_FIELDS) -> tuple[dict, dict]:
+    """Split a row into (slim Qdrant payload, doc-store fields)."""
+    fields = set(fields)
+    slim = {k: v for k, v in payload.items() if k not in fields}
+    doc = {k: v for k, v in payload.items() if k in fields}
+    return slim, doc
+
+
+def get_doc_store() -> DocStore:
+    """Process-wide store at ``settings.DOC_STORE_PATH``."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DocStore(settings.DOC_STORE_PATH)
+        return _store
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    SparseIndexParams,
+    SparseVectorParams,
+    VectorParams,
+)
+
+from goa_travel_agent.config.settings import settings
+
+
+def get_profile(name: str = settings.INDEX_PROFILE) -> dict:
+    try:
+        return settings.INDEX_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown INDEX_PROFILE '{name}', expected one of {tuple(settings.INDEX_PROFILES)}"
+        ) from None
+
+
+def _quantization(profile: dict) -> ScalarQuantization | BinaryQuantization | None:
+    kind = profile["quantization"]
+    if kind is None:
+        return None
+    if kind == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True),
+        )
+    if kind == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    raise ValueError(f"Unknown quantization '{kind}', expected 'scalar', 'binary' or None")
+
+
+def collection_config(name: str = settings.INDEX_PROFILE) -> dict:
+    """``create_collection`` keyword arguments for an index profile."""
+    profile = get_profile(name)
+    config: dict = {
+        "vectors_config": {
+            "dense": VectorParams(
+                size=settings.DENSE_DIM,
+                distance=Distance.COSINE,
+                on_disk=profile["on_disk"],
+                hnsw_config=HnswConfigDiff(
+                    m=profile["m"], ef_construct=profile["ef_construct"], on_disk=profile["hnsw_on_disk"],
+                ),
+                quantization_config=_quantization(profile),
+            ),
+        },
+        "sparse_vectors_config": {
+            "sparse": SparseVectorParams(index=SparseIndexParams(on_disk=profile["sparse_on_disk"])),
+        },
+    }
+    if profile["indexing_threshold_kb"] is not None:
+        config["optimizers_config"] = OptimizersConfigDiff(indexing_threshold=profile["indexing_threshold_kb"])
+    return config
+
+
+def search_params(name: str = settings.INDEX_PROFILE) -> SearchParams | None:
+    """Dense query params for an index profile (None -> server defaults)."""
+    profile = get_profile(name)
+    quantization = None
+    if profile["quantization"] is not None:
+        quantization = QuantizationSearchParams(rescore=profile["rescore"], oversampling=profile["oversampling"])
+    if profile["hnsw_ef"] is None and quantization is None:
+        return None
+    return SearchParams(hnsw_ef=profile["hnsw_ef"], quantization=quantization)
@@ -0,0 +1,734 @@
+"""In-process search backend: NumPy brute-force dense scoring + SciPy sparse index.
+
+``LocalVectorStore`` implements the subset of the ``QdrantClient`` API used by
+``QdrantManager`` and ``HybridSearcher`` (collection lifecycle and aliases,
+upsert/delete, retrieve/scroll, ``query_points`` / ``query_batch_points`` with
+prefetch + RRF and payload filters, ``facet`` counts), so it can be swapped in through
+``VECTOR_BACKEND=local``.
+
+On-disk layout per collection (append-only, replayed on open):
+    config.json    vector size and declared payload indexes
+    dense.f32      raw float32 rows, read back through ``np.memmap``
+    points.jsonl   one line per upsert (id, payload, sparse vector) or delete
+
+Once ``LOCAL_COMPACT_RATIO`` of the rows are superseded or deleted, both files are
+rewritten with the live rows only (staged under ``compact/`` and committed by a
+marker file, so an interrupted compaction is either finished or discarded on open).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import shutil
+import tarfile
+import threading
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+from qdrant_client.http.models import FacetResponse, FacetValueHit, QueryResponse
+from qdrant_client.models import (
+    CreateAliasOperation,
+    DeleteAliasOperation,
+    FieldCondition,
+    Filter,
+    FusionQuery,
+    HasIdCondition,
+    MatchAny,
+    MatchExcept,
+    MatchText,
+    MatchValue,
+    NearestQuery,
+    PointIdsList,
+    PointStruct,
+    Prefetch,
+    QueryRequest,
+    Record,
+    RenameAliasOperation,
+    RrfQuery,
+    ScoredPoint,
+    SparseVector,
+)
+from scipy.sparse import csr_matrix
+
+from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.utils.geo_utils import haversine
+from goa_travel_agent.src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _as_list(value: Any) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _select_payload(payload: dict, with_payload: Any) -> dict | None:
+    if with_payload is True:
+        return payload
+    if not with_payload:
+        return None
+    return {k: payload[k] for k in with_payload if k in payload}
+
+
+class _LocalCollection:
+    """One collection: dense memmap, sparse inverted index and payloads."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.RLock()
+        config = json.loads((path / "config.json").read_text())
+        self.dim: int = config["dim"]
+        self.payload_schema: dict[str, str] = config.get("payload_schema", {})
+
+        self.row_ids: list = []  # dense row -> point id
+        self.payloads: list[dict | None] = []  # dense row -> payload (None once superseded/deleted)
+        self.sparse_rows: list[tuple[list[int], list[float]]] = []
+        self.id_row: dict = {}  # live point id -> dense row
+        self._dense: np.memmap | None = None
+        self._inverted: csr_matrix | None = None
+        self._masks: OrderedDict[str, np.ndarray] = OrderedDict()  # LRU, filter JSON -> row mask
+        if self._apply_compaction():
+            log.info("Finished interrupted compaction of %s", path)
+        self._replay()
+
+    # -- persistence -----------------------------------------------------
+
+    @classmethod
+    def create(cls, path: Path, dim: int) -> _LocalCollection:
+        if path.exists():
+            shutil.rmtree(path)
+        path.mkdir(parents=True)
+        (path / "config.json").write_text(json.dumps({"dim": dim, "payload_schema": {}}))
+        (path / "dense.f32").touch()
+        (path / "points.jsonl").touch()
+        return cls(path)
+
+    def _replay(self) -> None:
+        """Rebuild the in-memory state from disk, trimming what an interrupted write left behind.
+
+        A write can stop after the dense rows but before (or halfway through)
+        their JSONL lines: an unfinished last line is cut off and dense rows
+        without a record are truncated, so later appends stay aligned.
+        """
+        points_path = self.path / "points.jsonl"
+        good_bytes = 0
+        with open(points_path, "rb") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line) if line.endswith(b"\n") else None
+                except ValueError:
+                    rec = None
+                if rec is None:
+                    if f.read(1):
+                        raise RuntimeError(f"Local index {self.path} is corrupt: unreadable line in points.jsonl")
+                    break
+                good_bytes += len(line)
+                self._apply(rec)
+        if points_path.stat().st_size > good_bytes:
+            log.warning("Local index %s: dropping an unfinished last record", self.path)
+            os.truncate(points_path, good_bytes)
+
+        dense_path = self.path / "dense.f32"
+        expected = len(self.row_ids) * 4 * self.dim
+        size = dense_path.stat().st_size
+        if size < expected:
+            raise RuntimeError(f"Local index {self.path} is corrupt: dense.f32 shorter than points.jsonl")
+        if size > expected:
+            orphans = (size - expected) // (4 * self.dim)
+            log.warning("Local index %s: dropping %d dense rows without a record", self.path, orphans)
+            os.truncate(dense_path, expected)
+
+    def _apply(self, rec: dict) -> None:
+        """Apply one ``points.jsonl`` record (upsert or delete) to the in-memory state."""
+        old = self.id_row.pop(rec["id"], None)
+        if old is not None:
+            self.payloads[old] = None
+        if rec.get("deleted"):
+            return
+        self.id_row[rec["id"]] = len(self.row_ids)
+        self.row_ids.append(rec["id"])
+        self.payloads.append(rec["payload"])
+        self.sparse_rows.append((rec["sparse"][0], rec["sparse"][1]))
+
+    def _append(self, records: list[dict], dense: np.ndarray | None = None) -> None:
+        """Append ``dense`` rows and then ``records`` to disk; memory is updated only once both are written.
+
+        A failed write truncates both files back, so this process keeps
+        appending to aligned files (a crash is handled by ``_replay``).
+        """
+        dense_path, points_path = self.path / "dense.f32", self.path / "points.jsonl"
+        sizes = dense_path.stat().st_size, points_path.stat().st_size
+        try:
+            if dense is not None and len(dense):
+                with open(dense_path, "ab") as f:
+                    dense.tofile(f)
+            with open(points_path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(rec) + "\n" for rec in records))
+        except BaseException:
+            os.truncate(dense_path, sizes[0])
+            os.truncate(points_path, sizes[1])
+            raise
+        for rec in records:
+            self._apply(rec)
+
+    def _apply_compaction(self) -> bool:
+        """Move committed staged files into place (discarding uncommitted ones); True if any were."""
+        staging = self.path / "compact"
+        if not staging.exists():
+            return False
+        committed = (staging / "COMMITTED").exists()
+        if committed:
+            for fname in ("dense.f32", "points.jsonl"):
+                if (staging / fname).exists():
+                    os.replace(staging / fname, self.path / fname)
+        shutil.rmtree(staging)
+        return committed
+
+    def _maybe_compact(self) -> None:
+        total = len(self.row_ids)
+        dead = total - len(self.id_row)
+        if dead and dead >= total * settings.LOCAL_COMPACT_RATIO:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite ``dense.f32`` and ``points.jsonl`` with the live rows only."""
+        with self.lock:
+            live = self.live_rows()
+            staging = self.path / "compact"
+            if staging.exists():
+                shutil.rmtree(staging)
+            staging.mkdir()
+            dense = self.dense()
+            with open(staging / "dense.f32", "wb") as f:
+                for start in range(0, len(live), 4096):
+                    np.ascontiguousarray(dense[live[start : start + 4096]]).tofile(f)
+            with open(staging / "points.jsonl", "w", encoding="utf-8") as f:
+                for row in live:
+                    rec = {"id": self.row_ids[row], "payload": self.payloads[row], "sparse": self.sparse_rows[row]}
+                    f.write(json.dumps(rec) + "\n")
+            (staging / "COMMITTED").touch()
+
+            del dense
+            self._dense = None  # drop the memmap of the old file before replacing it
+            dropped = len(self.row_ids) - len(live)
+            self.row_ids = [self.row_ids[r] for r in live]
+            self.payloads = [self.payloads[r] for r in live]
+            self.sparse_rows = [self.sparse_rows[r] for r in live]
+            self.id_row = {pid: row for row, pid in enumerate(self.row_ids)}
+            self._apply_compaction()
+            self._invalidate()
+            log.info("Compacted %s: dropped %d dead rows, %d live", self.path.name, dropped, len(live))
+
+    def _save_config(self) -> None:
+        (self.path / "config.json").write_text(json.dumps({"dim": self.dim, "payload_schema": self.payload_schema}))
+
+    def _invalidate(self) -> None:
+        self._dense = None
+        self._inverted = None
+        self._masks.clear()
+
+    # -- writes ----------------------------------------------------------
+
+    def upsert(self, points: list[PointStruct]) -> None:
+        with self.lock:
+            dense = np.empty((len(points), self.dim), dtype=np.float32)
+            records = []
+            for i, p in enumerate(points):
+                vec = np.asarray(p.vector["dense"], dtype=np.float32)
+                norm = np.linalg.norm(vec)
+                dense[i] = vec / norm if norm else vec  # cosine distance == dot on unit vectors
+                sp = p.vector.get("sparse")
+                sparse = (list(sp.indices), list(sp.values)) if sp is not None else ([], [])
+                records.append({"id": p.id, "payload": p.payload or {}, "sparse": sparse})
+
+            self._append(records, dense)
+            self._invalidate()
+            self._maybe_compact()
+
+    def delete(self, ids: list) -> None:
+        with self.lock:
+            records = [{"id": pid, "deleted": True} for pid in dict.fromkeys(ids) if pid in self.id_row]
+            if records:
+                self._append(records)
+                self._invalidate()
+                self._maybe_compact()
+
+    def live_rows(self) -> list[int]:
+        with self.lock:
+            return sorted(self.id_row.values())
+
+    def record(self, row: int, with_payload: Any = True, with_vectors: bool = False) -> Record:
+        vector = None
+        if with_vectors:
+            idx, val = self.sparse_rows[row]
+            vector = {
+                "dense": np.asarray(self.dense()[row]).tolist(),
+                "sparse": SparseVector(indices=idx, values=val),
+            }
+        return Record(
+            id=self.row_ids[row],
+            payload=_select_payload(self.payloads[row], with_payload),
+            vector=vector,
+        )
+
+    def set_index(self, field: str, schema: str) -> None:
+        with self.lock:
+            self.payload_schema[field] = schema
+            self._save_config()
+
+    def drop_index(self, field: str) -> None:
+        with self.lock:
+            if self.payload_schema.pop(field, None) is not None:
+                self._save_config()
+
+    # -- derived structures ----------------------------------------------
+
+    def dense(self) -> np.ndarray:
+        with self.lock:
+            if self._dense is None:
+                rows = len(self.row_ids)
+                if rows == 0:
+                    return np.empty((0, self.dim), dtype=np.float32)
+                self._dense = np.memmap(self.path / "dense.f32", dtype=np.float32, mode="r", shape=(rows, self.dim))
+            return self._dense
+
+    def inverted(self) -> csr_matrix:
+        """Term -> document postings (CSR of shape vocab x rows)."""
+        with self.lock:
+            if self._inverted is None:
+                indptr = [0]
+                indices: list[int] = []
+                values: list[float] = []
+                for idx, val in self.sparse_rows:
+                    indices.extend(idx)
+                    values.extend(val)
+                    indptr.append(len(indices))
+                vocab = (max(indices) + 1) if indices else 1
+                docs = csr_matrix(
+                    (np.asarray(values, dtype=np.float32), np.asarray(indices, dtype=np.int64), np.asarray(indptr)),
+                    shape=(len(self.sparse_rows), vocab),
+                )
+                self._inverted = docs.T.tocsr()
+            return self._inverted
+
+    def live_mask(self) -> np.ndarray:
+        return np.fromiter((p is not None for p in self.payloads), dtype=bool, count=len(self.payloads))
+
+    # -- filters ---------------------------------------------------------
+
+    def filter_mask(self, flt: Filter | None) -> np.ndarray:
+        key = flt.model_dump_json() if flt is not None else ""
+        with self.lock:
+            mask = self._masks.get(key)
+            if mask is not None:
+                self._masks.move_to_end(key)
+                return mask
+            mask = self.live_mask()
+            if flt is not None:
+                mask &= self._eval_filter(flt)
+            self._masks[key] = mask
+            while len(self._masks) > settings.LOCAL_MASK_CACHE_SIZE:
+                self._masks.popitem(last=False)
+            return mask
+
+    def _eval_filter(self, flt: Filter) -> np.ndarray:
+        n = len(self.payloads)
+        mask = np.ones(n, dtype=bool)
+        for cond in _as_list(flt.must):
+            mask &= self._eval_condition(cond)
+        should = _as_list(flt.should)
+        if should:
+            any_mask = np.zeros(n, dtype=bool)
+            for cond in should:
+                any_mask |= self._eval_condition(cond)
+            mask &= any_mask
+        for cond in _as_list(flt.must_not):
+            mask &= ~self._eval_condition(cond)
+        return mask
+
+    def _eval_condition(self, cond: Any) -> np.ndarray:
+        if isinstance(cond, Filter):
+            return self._eval_filter(cond)
+        if isinstance(cond, HasIdCondition):
+            wanted = set(cond.has_id)
+            return np.fromiter((pid in wanted for pid in self.row_ids), dtype=bool, count=len(self.row_ids))
+        if not isinstance(cond, FieldCondition):
+            raise NotImplementedError(f"Local backend does not support condition {type(cond).__name__}")
+
+        test = self._field_test(cond)
+        return np.fromiter(
+            (p is not None and any(test(v) for v in _as_list(p.get(cond.key))) for p in self.payloads),
+            dtype=bool,
+            count=len(self.payloads),
+        )
+
+    @staticmethod
+    def _field_test(cond: FieldCondition):
+        match, rng = cond.match, cond.range
+        if isinstance(match, MatchValue):
+            return lambda v: v == match.value
+        if isinstance(match, MatchAny):
+            wanted = set(match.any)
+            return lambda v: v in wanted
+        if isinstance(match, MatchExcept):
+            excluded = set(match.except_)
+            return lambda v: v not in excluded
+        if isinstance(match, MatchText):
+            tokens = set(_TOKEN_RE.findall(match.text.lower()))
+            return lambda v: isinstance(v, str) and tokens <= set(_TOKEN_RE.findall(v.lower()))
+        if cond.geo_radius is not None:
+            center, radius_km = cond.geo_radius.center, cond.geo_radius.radius / 1000
+
+            def in_radius(v: Any) -> bool:
+                if not isinstance(v, dict) or v.get("lat") is None or v.get("lon") is None:
+                    return False
+                return haversine(center.lat, center.lon, v["lat"], v["lon"]) <= radius_km
+            return in_radius
+        if rng is not None:
+            def in_range(v: Any) -> bool:
+                if not isinstance(v, (int, float)) or v != v:
+                    return False
+                return (
+                    (rng.gte is None or v >= rng.gte)
+                    and (rng.gt is None or v > rng.gt)
+                    and (rng.lte is None or v <= rng.lte)
+                    and (rng.lt is None or v < rng.lt)
+                )
+            return in_range
+        raise NotImplementedError(f"Local backend does not support field condition on '{cond.key}'")
+
+    # -- scoring ---------------------------------------------------------
+
+    def rank(self, query: Any, using: str | None, flt: Filter | None, limit: int) -> list[tuple[int, float]]:
+        """Top ``limit`` (row, score) pairs for a dense or sparse query."""
+        if isinstance(query, NearestQuery):
+            query = query.nearest
+        mask = self.filter_mask(flt)
+
+        if isinstance(query, SparseVector) or using == "sparse":
+            inv = self.inverted()
+            pairs = [(i, v) for i, v in zip(query.indices, query.values) if i < inv.shape[0]]
+            if not pairs:
+                return []
+            idx, val = zip(*pairs)
+            q = csr_matrix((np.asarray(val, dtype=np.float32), ([0] * len(idx), list(idx))), shape=(1, inv.shape[0]))
+            hits = (q @ inv).tocsr()
+            rows, scores = hits.indices, hits.data
+            keep = mask[rows]
+            rows, scores = rows[keep], scores[keep]
+        else:
+            q = np.asarray(query, dtype=np.float32)
+            norm = np.linalg.norm(q)
+            if norm:
+                q = q / norm
+            rows = np.flatnonzero(mask)
+            if rows.size == 0:
+                return []
+            scores = self.dense()[rows] @ q
+
+        if rows.size == 0:
+            return []
+        if rows.size > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[top], scores[top]
+        order = np.lexsort((rows, -scores))  # ties -> insertion order
+        return [(int(rows[i]), float(scores[i])) for i in order]
+
+
+class LocalVectorStore:
+    """Drop-in, in-process replacement for the ``QdrantClient`` calls this project makes."""
+
+    def __init__(self, path: Path = settings.LOCAL_INDEX_DIR) -> None:
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._collections: dict[str, _LocalCollection] = {}
+        self._lock = threading.RLock()
+        self._aliases_path = self.path / "aliases.json"
+        self._aliases: dict[str, str] = {}
+        self._aliases_mtime: int | None = None
+
+    # -- aliases -----------------------------------------------------------
+
+    def _alias_map(self) -> dict[str, str]:
+        # re-read when another process (e.g. a reindex run) swapped an alias
+        with self._lock:
+            mtime = self._aliases_path.stat().st_mtime_ns if self._aliases_path.exists() else None
+            if mtime != self._aliases_mtime:
+                self._aliases = json.loads(self._aliases_path.read_text()) if mtime is not None else {}
+                self._aliases_mtime = mtime
+            return self._aliases
+
+    def _save_aliases(self, aliases: dict[str, str]) -> None:
+        tmp = self._aliases_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(aliases))
+        os.replace(tmp, self._aliases_path)
+        self._aliases = aliases
+        self._aliases_mtime = self._aliases_path.stat().st_mtime_ns
+
+    def _resolve(self, name: str) -> str:
+        return self._alias_map().get(name, name)
+
+    def get_aliases(self) -> SimpleNamespace:
+        return SimpleNamespace(aliases=[
+            SimpleNamespace(alias_name=alias, collection_name=coll) for alias, coll in sorted(self._alias_map().items())
+        ])
+
+    def update_collection_aliases(self, change_aliases_operations: list, **kwargs: Any) -> bool:
+        """Apply alias operations all-or-nothing, like Qdrant."""
+        with self._lock:
+            aliases = dict(self._alias_map())
+            for op in change_aliases_operations:
+                if isinstance(op, CreateAliasOperation):
+                    if not self._is_collection(op.create_alias.collection_name):
+                        raise ValueError(f"Collection {op.create_alias.collection_name} not found")
+                    aliases[op.create_alias.alias_name] = op.create_alias.collection_name
+                elif isinstance(op, DeleteAliasOperation):
+                    aliases.pop(op.delete_alias.alias_name, None)
+                elif isinstance(op, RenameAliasOperation):
+                    aliases[op.rename_alias.new_alias_name] = aliases.pop(op.rename_alias.old_alias_name)
+            self._save_aliases(aliases)
+            return True
+
+    # -- collection lifecycle --------------------------------------------
+
+    def _is_collection(self, name: str) -> bool:
+        return (self.path / name / "config.json").exists()
+
+    def _get(self, name: str) -> _LocalCollection:
+        name = self._resolve(name)
+        with self._lock:
+            coll = self._collections.get(name)
+            if coll is None:
+                if not self._is_collection(name):
+                    raise ValueError(f"Collection {name} not found")
+                coll = self._collections[name] = _LocalCollection(self.path / name)
+            return coll
+
+    def collection_exists(self, collection_name: str) -> bool:
+        return self._is_collection(self._resolve(collection_name))
+
+    def create_collection(self, collection_name: str, vectors_config: dict, **kwargs: Any) -> bool:
+        with self._lock:
+            if self.collection_exists(collection_name):
+                raise ValueError(f"Collection {collection_name} already exists")
+            dim = vectors_config["dense"].size
+            self._collections[collection_name] = _LocalCollection.create(self.path / collection_name, dim)
+            return True
+
+    def recreate_collection(self, collection_name: str, vectors_config: dict, **kwargs: Any) -> bool:
+        self.delete_collection(collection_name)
+        return self.create_collection(collection_name, vectors_config, **kwargs)
+
+    def delete_collection(self, collection_name: str, **kwargs: Any) -> bool:
+        with self._lock:
+            self._collections.pop(collection_name, None)
+            path = self.path / collection_name
+            if not path.exists():
+                return False
+            shutil.rmtree(path)
+            aliases = self._alias_map()
+            if collection_name in aliases.values():
+                self._save_aliases({a: c for a, c in aliases.items() if c != collection_name})
+            return True
+
+    def export_snapshot(self, collection_name: str, dest: Path) -> None:
+        """Pack a collection's files into a tar archive at ``dest``."""
+        coll = self._get(collection_name)
+        with coll.lock, tarfile.open(dest, "w") as tar:
+            for fname in ("config.json", "dense.f32", "points.jsonl"):
+                tar.add(coll.path / fname, arcname=fname)
+
+    def import_snapshot(self, collection_name: str, src: Path) -> None:
+        """Create ``collection_name`` from an ``export_snapshot`` archive."""
+        with self._lock:
+            if self.collection_exists(collection_name):
+                raise ValueError(f"Collection {collection_name} already exists")
+            path = self.path / collection_name
+            path.mkdir(parents=True)
+            with tarfile.open(src) as tar:
+                tar.extractall(path, filter="data")
+            self._collections[collection_name] = _LocalCollection(path)
+
+    def get_collection(self, collection_name: str) -> SimpleNamespace:
+        coll = self._get(collection_name)
+        return SimpleNamespace(
+            status="green",
+            points_count=len(coll.id_row),
+            payload_schema=dict(coll.payload_schema),
+        )
+
+    def get_collections(self) -> SimpleNamespace:
+        names = sorted(p.name for p in self.path.iterdir() if (p / "config.json").exists())
+        return SimpleNamespace(collections=[SimpleNamespace(name=n) for n in names])
+
+    def create_payload_index(self, collection_name: str, field_name: str, field_schema: Any = None, **kwargs: Any):
+        schema = getattr(field_schema, "value", field_schema)
+        self._get(collection_name).set_index(field_name, str(schema))
+
+    def delete_payload_index(self, collection_name: str, field_name: str, **kwargs: Any):
+        self._get(collection_name).drop_index(field_name)
+
+    # -- points ----------------------------------------------------------
+
+    def upsert(self, collection_name: str, points: list[PointStruct], **kwargs: Any) -> None:
+        self._get(collection_name).upsert(list(points))
+
+    def delete(self, collection_name: str, points_selector: PointIdsList | list, **kwargs: Any) -> None:
+        ids = points_selector.points if isinstance(points_selector, PointIdsList) else list(points_selector)
+        self._get(collection_name).delete(ids)
+
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: list,
+        with_payload: Any = True,
+        with_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[Record]:
+        coll = self._get(collection_name)
+        with coll.lock:  # rows are renumbered by compaction
+            rows = [coll.id_row.get(pid) for pid in ids]
+            return [coll.record(row, with_payload, with_vectors) for row in rows if row is not None]
+
+    def scroll(
+        self,
+        collection_name: str,
+        scroll_filter: Filter | None = None,
+        limit: int = 10,
+        offset: Any = None,
+        with_payload: Any = True,
+        with_vectors: bool = False,
+        **kwargs: Any,
+    ) -> tuple[list[Record], Any]:
+        """Page through live points in insertion order; ``offset`` is a point id."""
+        coll = self._get(collection_name)
+        with coll.lock:
+            rows = coll.live_rows()
+            if scroll_filter is not None:
+                mask = coll.filter_mask(scroll_filter)
+                rows = [r for r in rows if mask[r]]
+            start = 0
+            if offset is not None:
+                offset_row = coll.id_row.get(offset)
+                start = bisect_left(rows, offset_row) if offset_row is not None else len(rows)
+            page = rows[start : start + limit]
+            next_offset = coll.row_ids[rows[start + limit]] if start + limit < len(rows) else None
+            return [coll.record(r, with_payload, with_vectors) for r in page], next_offset
+
+    def facet(
+        self,
+        collection_name: str,
+        key: str,
+        facet_filter: Filter | None = None,
+        limit: int = 10,
+        exact: bool = False,
+        **kwargs: Any,
+    ) -> FacetResponse:
+        """Count points per value of ``key`` (array values count once each), largest first."""
+        coll = self._get(collection_name)
+        counts: Counter = Counter()
+        with coll.lock:
+            for row in np.flatnonzero(coll.filter_mask(facet_filter)):
+                values = _as_list(coll.payloads[row].get(key))
+                counts.update(v for v in set(values) if isinstance(v, (str, int)) and not isinstance(v, bool))
+        ordered = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+        return FacetResponse(hits=[FacetValueHit(value=v, count=c) for v, c in ordered])
+
+    def query_points(
+        self,
+        collection_name: str,
+        query: Any = None,
+        using: str | None = None,
+        prefetch: Prefetch | list[Prefetch] | None = None,
+        query_filter: Filter | None = None,
+        limit: int = 10,
+        with_payload: Any = True,
+        **kwargs: Any,
+    ) -> QueryResponse:
+        coll = self._get(collection_name)
+        with coll.lock:  # row numbers stay valid only until the next compaction
+            if prefetch:
+                ranked = self._fuse(coll, _as_list(prefetch), query, query_filter, limit)
+            else:
+                ranked = coll.rank(query, using, query_filter, limit)
+
+            points = [
+                ScoredPoint(
+                    id=coll.row_ids[row],
+                    version=0,
+                    score=score,
+                    payload=_select_payload(coll.payloads[row], with_payload),
+                )
+                for row, score in ranked
+            ]
+        return QueryResponse(points=points)
+
+    def query_batch_points(self, collection_name: str, requests: list[QueryRequest], **kwargs: Any) -> list[QueryResponse]:
+        return [
+            self.query_points(
+                collection_name,
+                query=r.query,
+                using=r.using,
+                prefetch=r.prefetch,
+                query_filter=r.filter,
+                limit=r.limit or 10,
+                with_payload=r.with_payload if r.with_payload is not None else True,
+            )
+            for r in requests
+        ]
+
+    @staticmethod
+    def _fuse(
+        coll: _LocalCollection,
+        prefetches: list[Prefetch],
+        query: Any,
+        query_filter: Filter | None,
+        limit: int,
+    ) -> list[tuple[int, float]]:
+        if isinstance(query, RrfQuery):
+            k = query.rrf.k if query.rrf.k is not None else settings.RRF_K
+        elif isinstance(query, FusionQuery):
+            k = settings.RRF_K
+        else:
+            raise NotImplementedError("Local backend only supports RRF fusion over prefetches")
+
+        allowed = coll.filter_mask(query_filter) if query_filter is not None else None
+        scores: dict[int, float] = {}
+        for pf in prefetches:
+            # positions start at 0, matching Qdrant's RRF scores
+            for rank, (row, _) in enumerate(coll.rank(pf.query, pf.using, pf.filter, pf.limit or 10)):
+                if allowed is None or allowed[row]:
+                    scores[row] = scores.get(row, 0.0) + 1.0 / (k + rank)
+        return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncLocalVectorStore:
+    """asyncio facade over ``LocalVectorStore`` for ``AsyncHybridSearcher``."""
+
+    def __init__(self, store: LocalVectorStore) -> None:
+        self._store = store
+
+    async def query_batch_points(self, collection_name: str, requests: list[QueryRequest], **kwargs: Any):
+        return await asyncio.to_thread(self._store.query_batch_points, collection_name, requests)
+
+    async def retrieve(self, collection_name: str, ids: list, with_payload: Any = True, **kwargs: Any):
+        return await asyncio.to_thread(self._store.retrieve, collection_name, ids, with_payload)
+
+    async def facet(self, collection_name: str, key: str, **kwargs: Any):
+        return await asyncio.to_thread(self._store.facet, collection_name, key, **kwargs)
+
+    async def close(self) -> None:
+        pass
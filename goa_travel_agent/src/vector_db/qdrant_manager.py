@@ -1,52 +1,104 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
+from pathlib import Path
+
+import httpx
 import pandas as pd
-from qdrant_client import QdrantClient
 from qdrant_client.models import (
-    Distance,
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
     PayloadSchemaType,
+    PointIdsList,
     PointStruct,
     SparseVector,
-    SparseVectorParams,
-    VectorParams,
 )
 from tqdm import tqdm
 
 from goa_travel_agent.config.settings import settings
 from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder
+from goa_travel_agent.src.vector_db.backends import create_client
+from goa_travel_agent.src.vector_db.doc_store import get_doc_store, split_payload
+from goa_travel_agent.src.vector_db.index_profiles import collection_config
+from goa_travel_agent.src.vector_db.query_cache import invalidate_collection
+from goa_travel_agent.src.utils.build_manifest import STAGES, BuildManifest
+from goa_travel_agent.src.utils.file_utils import file_sha256
 from goa_travel_agent.src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Fixed namespace so uuid5 point ids are identical across runs and machines.
+_POINT_ID_NAMESPACE = uuid.UUID("3d0f5a8e-6c1b-5b7e-9a0e-2f4c8d1e7b93")
+
+# Part of every content_hash: bumping it re-uploads each point once, e.g.
+# when fields move between the Qdrant payload and the document store.
+_PAYLOAD_LAYOUT = "slim-v1"
+
+
+def hotel_point_id(property_id: object) -> str:
+    """Stable point id of a hotel, derived from its Goibibo ``property_id``."""
+    return str(uuid.uuid5(_POINT_ID_NAMESPACE, f"hotel:{str(property_id).strip()}"))
+
+
+def place_point_id(city: object, place: object) -> str:
+    """Stable point id of a place, derived from its (city, place) pair."""
+    key = f"{str(city).strip().lower()}|{str(place).strip().lower()}"
+    return str(uuid.uuid5(_POINT_ID_NAMESPACE, f"place:{key}"))
+
+
+def content_hash(text: str, payload: dict, model_key: str) -> str:
+    """Fingerprint of everything that ends up in a point (vectors + payload)."""
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(f"{model_key}\x00{text}\x00{blob}".encode("utf-8")).hexdigest()
+
 
 class QdrantManager:
     """Manages Qdrant collections for hotels and places."""
 
-    def __init__(self, url: str = "", api_key: str = "") -> None:
-        qdrant_url = url or settings.QDRANT_URL
-        qdrant_key = api_key or settings.QDRANT_API_KEY
-        kwargs: dict = {"url": qdrant_url, "timeout": 30}
-        if qdrant_key:
-            kwargs["api_key"] = qdrant_key
-        self.client = QdrantClient(**kwargs)
+    def __init__(self, url: str = "", api_key: str = "", index_profile: str = settings.INDEX_PROFILE) -> None:
+        self.client = create_client(url, api_key)
+        self.docs = get_doc_store()
+        self.index_profile = index_profile
+        self._url = (url or settings.QDRANT_URL).rstrip("/")
+        self._api_key = api_key or settings.QDRANT_API_KEY
+        self._reindex_lock = threading.RLock()  # also held by gc_docs, which reindexing calls
 
     # -- collection lifecycle --------------------------------------------
 
-    def create_collection(self, name: str) -> None:
-        self.client.recreate_collection(
-            collection_name=name,
-            vectors_config={"dense": VectorParams(size=settings.DENSE_DIM, distance=Distance.COSINE)},
-            sparse_vectors_config={"sparse": SparseVectorParams()},
-        )
-        log.info("Created collection '%s'", name)
+    def create_collection(self, name: str, recreate: bool = False) -> bool:
+        """Create ``name`` if missing (or drop and rebuild with ``recreate``).
+
+        Returns True when a new, empty collection was created.
+        """
+        if self.client.collection_exists(name):
+            if not recreate:
+                return False
+            self.client.delete_collection(name)
+        self.client.create_collection(collection_name=name, **collection_config(self.index_profile))
+        invalidate_collection(name)
+        log.info("Created collection '%s' (index profile '%s')", name, self.index_profile)
+        return True
 
     def create_indexes(self, name: str) -> None:
         schemas: dict[str, PayloadSchemaType] = {
             "city": PayloadSchemaType.KEYWORD,
-            "locality": PayloadSchemaType.TEXT,
+            "locality_id": PayloadSchemaType.KEYWORD,
             "hotel_star_rating": PayloadSchemaType.INTEGER,
             "site_review_rating": PayloadSchemaType.FLOAT,
             "category": PayloadSchemaType.KEYWORD,
+            "facilities": PayloadSchemaType.KEYWORD,
+            "location": PayloadSchemaType.GEO,
         }
         for field, schema in schemas.items():
             try:
@@ -55,10 +107,13 @@ class QdrantManager:
                 )
             except Exception:
                 pass  # index may already exist
+        # full-text locality index from before locality_id; nothing queries it any more
+        if "locality" in (self.client.get_collection(name).payload_schema or {}):
+            self.client.delete_payload_index(collection_name=name, field_name="locality")
         log.info("Payload indexes created for '%s'", name)
 
     def collection_count(self, name: str) -> int:
-        info = self.client.get_collection(name)
+        info = self.client.get_collection(self.resolve(name))
         return info.points_count or 0
 
     def collection_exists_and_populated(self, name: str) -> bool:
@@ -69,61 +124,472 @@ class QdrantManager:
 
     # -- upload ----------------------------------------------------------
 
-    def upload_points(
-        self,
-        name: str,
-        dense_vectors: list[list[float]],
-        sparse_data: list[tuple[list[int], list[float]]],
-        payloads: list[dict],
-        batch_size: int = 100,
-    ) -> None:
-        points: list[PointStruct] = []
-        for i, (dense, (sp_idx, sp_val), payload) in enumerate(
-            zip(dense_vectors, sparse_data, payloads)
-        ):
-            points.append(
+    @staticmethod
+    def _sanitize_texts(texts: list) -> list[str]:
+        return [str(t) if t is not None and t == t else "" for t in texts]
+
+    @classmethod
+    def iter_point_batches(
+        cls,
+        df: pd.DataFrame,
+        text_column: str,
+        embedder: HybridEmbedder,
+        ids: list[str],
+        batch_size: int = settings.UPLOAD_BATCH_SIZE,
+    ) -> Iterator[list[PointStruct]]:
+        """Encode ``df`` slice by slice and yield ready-to-upsert point batches.
+
+        ``ids`` is aligned with the rows of ``df``. Only one batch of vectors
+        and payloads is alive at a time, so memory stays flat regardless of
+        the collection size. Payloads are slim: the ``DOC_STORE_FIELDS`` are
+        left out (see ``store_docs``).
+        """
+        for start in range(0, len(df), batch_size):
+            chunk = df.iloc[start : start + batch_size]
+            texts = cls._sanitize_texts(chunk[text_column].tolist())
+            dense = embedder.encode_dense(texts, show_progress_bar=False)
+            sparse = embedder.encode_sparse_batch(texts)
+            payloads = chunk.to_dict(orient="records")
+            yield [
                 PointStruct(
-                    id=i,
+                    id=point_id,
                     vector={
-                        "dense": dense,
+                        "dense": dense[i].tolist(),
                         "sparse": SparseVector(indices=sp_idx, values=sp_val),
                     },
-                    payload=payload,
+                    payload=split_payload(payload)[0],
+                )
+                for i, (point_id, (sp_idx, sp_val), payload) in enumerate(
+                    zip(ids[start : start + batch_size], sparse, payloads)
                 )
+            ]
+
+    def upload_points(
+        self,
+        name: str,
+        batches: Iterable[list[PointStruct]],
+        total_batches: int | None = None,
+        parallel: int = settings.UPLOAD_PARALLEL,
+        wait: bool = settings.UPLOAD_WAIT,
+    ) -> int:
+        """Upsert point batches with up to ``parallel`` requests in flight.
+
+        ``batches`` is consumed lazily on the calling thread, so producing
+        (encoding) the next batch overlaps with uploading the previous ones.
+        At most ``parallel`` batches are buffered; the first failed upsert
+        is re-raised.
+        """
+        uploaded = 0
+        in_flight: set[Future] = set()
+        progress = tqdm(total=total_batches, desc=f"Uploading to '{name}'")
+
+        def drain(block_until: str) -> None:
+            nonlocal uploaded, in_flight
+            done, in_flight = futures_wait(in_flight, return_when=block_until)
+            for fut in done:
+                uploaded += fut.result()
+                progress.update(1)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, parallel), thread_name_prefix="qdrant-upload") as pool:
+                for batch in batches:
+                    if len(in_flight) >= max(1, parallel):
+                        drain(FIRST_COMPLETED)
+                    in_flight.add(pool.submit(self._upsert_batch, name, batch, wait))
+                drain(ALL_COMPLETED)
+        finally:
+            progress.close()
+            invalidate_collection(name)
+
+        log.info("Uploaded %d points to '%s'", uploaded, name)
+        return uploaded
+
+    def _upsert_batch(self, name: str, batch: list[PointStruct], wait: bool) -> int:
+        self.client.upsert(collection_name=name, points=batch, wait=wait)
+        return len(batch)
+
+    def delete_points(self, name: str, ids: list, batch_size: int = 1000) -> int:
+        for start in range(0, len(ids), batch_size):
+            self.client.delete(
+                collection_name=name,
+                points_selector=PointIdsList(points=ids[start : start + batch_size]),
+                wait=True,
             )
+        if ids:
+            invalidate_collection(name)
+        return len(ids)
+
+    def store_docs(self, name: str, df: pd.DataFrame, ids: list[str]) -> int:
+        """Write the long text fields of ``df`` to the document store under ``name``.
 
-        for start in tqdm(range(0, len(points), batch_size), desc=f"Uploading to '{name}'"):
-            batch = points[start : start + batch_size]
-            self.client.upsert(collection_name=name, points=batch)
+        Rows are keyed by their ``content_hash`` (stamped by ``_prepare_rows``).
+        """
+        rows = df.to_dict(orient="records")
+        return self.docs.put_many(
+            name, ((pid, row["content_hash"], split_payload(row)[1]) for pid, row in zip(ids, rows))
+        )
+
+    def gc_docs(self, name: str) -> int:
+        """Drop the docs of ``name`` that no collection behind it references any more.
 
-        log.info("Uploaded %d points to '%s'", len(points), name)
+        Every ``<name>_vN`` version still on the server (and a plain
+        collection called ``name``) keeps the (id, content_hash) pairs of its
+        points, so rolling the alias back finds its text.
+        """
+        with self._reindex_lock:  # a build in progress has docs but not all of its points yet
+            collections = [coll for _, coll in self.versions(name)]
+            if name not in self.aliases() and self.client.collection_exists(name):
+                collections.append(name)
+            keep: set = set()
+            for coll in collections:
+                keep.update((str(pid), h) for pid, h in self.stored_hashes(coll).items() if h)
+            dropped = self.docs.retain(name, keep)
+        if dropped:
+            log.info("Dropped %d unreferenced docs of '%s'", dropped, name)
+        return dropped
+
+    def stored_hashes(self, name: str, page_size: int = 1000) -> dict:
+        """{point id: content_hash} for every point currently in ``name``."""
+        hashes: dict = {}
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=name,
+                limit=page_size,
+                offset=offset,
+                with_payload=["content_hash"],
+                with_vectors=False,
+            )
+            for rec in records:
+                hashes[rec.id] = (rec.payload or {}).get("content_hash")
+            if offset is None:
+                return hashes
 
     # -- high-level setup ------------------------------------------------
 
-    @staticmethod
-    def _sanitize_texts(texts: list) -> list[str]:
-        return [str(t) if t is not None and t == t else "" for t in texts]
+    def _prepare_rows(
+        self,
+        df: pd.DataFrame,
+        ids: list[str],
+        text_column: str,
+        embedder: HybridEmbedder,
+    ) -> tuple[pd.DataFrame, list[str]]:
+        """Drop duplicate ids (last row wins), add the geo point and stamp each row's content_hash."""
+        df = df.drop(columns=["content_hash"], errors="ignore").reset_index(drop=True)
+        if "lat" in df.columns and "lon" in df.columns:
+            df["location"] = [
+                {"lat": float(lat), "lon": float(lon)} if lat == lat and lon == lon else None
+                for lat, lon in zip(df["lat"], df["lon"])
+            ]
+            df = df.drop(columns=["lat", "lon"])
+        keep = ~pd.Series(ids).duplicated(keep="last")
+        if not keep.all():
+            log.warning("Dropping %d rows with duplicate ids", int((~keep).sum()))
+            df = df[keep.values].reset_index(drop=True)
+            ids = [i for i, k in zip(ids, keep) if k]
+
+        model_key = f"{embedder.model_key}|{_PAYLOAD_LAYOUT}"
+        texts = self._sanitize_texts(df[text_column].tolist())
+        df["content_hash"] = [
+            content_hash(text, payload, model_key)
+            for text, payload in zip(texts, df.to_dict(orient="records"))
+        ]
+        return df, ids
 
-    def setup_hotels_collection(self, df: pd.DataFrame, embedder: HybridEmbedder) -> None:
-        name = settings.HOTELS_COLLECTION
+    def sync_collection(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        ids: list[str],
+        text_column: str,
+        embedder: HybridEmbedder,
+    ) -> dict[str, int]:
+        """Make ``name`` mirror ``df``: upsert new/changed rows, delete removed ones.
+
+        Rows are matched on their stable id and compared on ``content_hash``,
+        so only rows whose text, payload or embedding models changed are
+        re-encoded. Creates the collection on first use. The document store
+        is kept in step, keyed by the logical (alias) name.
+        """
+        alias, name = name, self.resolve(name)
         self.create_collection(name)
+        df, ids = self._prepare_rows(df, ids, text_column, embedder)
+        stored = self.stored_hashes(name)
 
-        texts = self._sanitize_texts(df["search_text"].tolist())
-        dense = embedder.encode_dense(texts).tolist()
-        sparse = [embedder.encode_sparse(t) for t in tqdm(texts, desc="Sparse encoding hotels")]
-        payloads = df.to_dict(orient="records")
+        changed = [i for i, (pid, h) in enumerate(zip(ids, df["content_hash"])) if stored.get(pid) != h]
+        current = set(ids)
+        removed = [pid for pid in stored if pid not in current]
 
-        self.upload_points(name, dense, sparse, payloads)
+        # docs go in before their points, so no search hit lacks its text
+        have_docs = self.docs.keys(alias)
+        doc_rows = [i for i, key in enumerate(zip(ids, df["content_hash"])) if key not in have_docs]
+        self.store_docs(alias, df.iloc[doc_rows], [ids[i] for i in doc_rows])
+
+        if changed:
+            batch_size = settings.UPLOAD_BATCH_SIZE
+            self.upload_points(
+                name,
+                self.iter_point_batches(df.iloc[changed], text_column, embedder, [ids[i] for i in changed], batch_size),
+                total_batches=-(-len(changed) // batch_size),
+            )
+        self.delete_points(name, removed)
+        self.gc_docs(alias)
+        if changed or removed:
+            invalidate_collection(alias)  # caches are keyed by the alias, not by name_vN
         self.create_indexes(name)
 
-    def setup_places_collection(self, df: pd.DataFrame, embedder: HybridEmbedder) -> None:
-        name = settings.PLACES_COLLECTION
-        self.create_collection(name)
+        stats = {"upserted": len(changed), "deleted": len(removed), "unchanged": len(ids) - len(changed)}
+        log.info(
+            "Synced '%s': %d upserted, %d deleted, %d unchanged",
+            name, stats["upserted"], stats["deleted"], stats["unchanged"],
+        )
+        return stats
+
+    @staticmethod
+    def hotel_ids(df: pd.DataFrame) -> list[str]:
+        return [hotel_point_id(pid) for pid in df["property_id"]]
 
-        texts = self._sanitize_texts(df["full_text"].tolist())
-        dense = embedder.encode_dense(texts).tolist()
-        sparse = [embedder.encode_sparse(t) for t in tqdm(texts, desc="Sparse encoding places")]
-        payloads = df.to_dict(orient="records")
+    @staticmethod
+    def place_ids(df: pd.DataFrame) -> list[str]:
+        return [place_point_id(city, place) for city, place in zip(df["city"], df["place"])]
 
-        self.upload_points(name, dense, sparse, payloads)
-        self.create_indexes(name)
+    def setup_hotels_collection(self, df: pd.DataFrame, embedder: HybridEmbedder) -> dict[str, int]:
+        return self.sync_collection(settings.HOTELS_COLLECTION, df, self.hotel_ids(df), "search_text", embedder)
+
+    def setup_places_collection(self, df: pd.DataFrame, embedder: HybridEmbedder) -> dict[str, int]:
+        return self.sync_collection(settings.PLACES_COLLECTION, df, self.place_ids(df), "full_text", embedder)
+
+    # -- blue/green reindex ----------------------------------------------
+
+    def aliases(self) -> dict[str, str]:
+        """{alias: collection} for every alias on the server."""
+        return {a.alias_name: a.collection_name for a in self.client.get_aliases().aliases}
+
+    def resolve(self, name: str) -> str:
+        """Physical collection behind ``name`` (``name`` itself if it is not an alias)."""
+        return self.aliases().get(name, name)
+
+    def versions(self, name: str) -> list[tuple[int, str]]:
+        """Versioned builds of ``name`` (``<name>_vN``), oldest first."""
+        pattern = re.compile(rf"^{re.escape(name)}_v(\d+)$")
+        found = []
+        for coll in self.client.get_collections().collections:
+            match = pattern.match(coll.name)
+            if match:
+                found.append((int(match.group(1)), coll.name))
+        return sorted(found)
+
+    def reindex_collection(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        ids: list[str],
+        text_column: str,
+        embedder: HybridEmbedder,
+        keep_versions: int = settings.REINDEX_KEEP_VERSIONS,
+    ) -> str:
+        """Rebuild ``name`` from scratch without taking it offline.
+
+        Points are uploaded into a fresh ``<name>_vN`` collection while the
+        alias ``name`` keeps serving the previous version. Once the new
+        collection holds every row, the alias is switched in one atomic
+        operation and versions beyond ``keep_versions`` are deleted. A build
+        that fails or comes up short is dropped and the alias is untouched.
+        """
+        with self._reindex_lock:
+            versions = self.versions(name)
+            target = f"{name}_v{versions[-1][0] + 1 if versions else 1}"
+            df, ids = self._prepare_rows(df, ids, text_column, embedder)
+            log.info("Reindexing '%s' into '%s' (%d rows)", name, target, len(ids))
+
+            self.create_collection(target, recreate=True)
+            self.store_docs(name, df, ids)  # new (id, hash) keys only: the live version's docs stay
+            try:
+                batch_size = settings.UPLOAD_BATCH_SIZE
+                self.upload_points(
+                    target,
+                    self.iter_point_batches(df, text_column, embedder, ids, batch_size),
+                    total_batches=-(-len(ids) // batch_size),
+                    wait=True,  # the count check below must see every point
+                )
+                self.create_indexes(target)
+                count = self.collection_count(target)
+                if count != len(ids):
+                    raise RuntimeError(f"Reindex of '{name}' produced {count} points, expected {len(ids)}")
+            except Exception:
+                self.client.delete_collection(target)
+                self.gc_docs(name)
+                raise
+
+            self._swap_alias(name, target)
+            self._drop_old_versions(name, keep_versions)
+            return target
+
+    def start_reindex(self, *args, **kwargs) -> Future:
+        """Run ``reindex_collection`` on a background thread; searches keep hitting the old version."""
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qdrant-reindex")
+        future = pool.submit(self.reindex_collection, *args, **kwargs)
+        pool.shutdown(wait=False)
+        return future
+
+    def reindex_hotels_collection(self, df: pd.DataFrame, embedder: HybridEmbedder, background: bool = False):
+        args = (settings.HOTELS_COLLECTION, df, self.hotel_ids(df), "search_text", embedder)
+        return self.start_reindex(*args) if background else self.reindex_collection(*args)
+
+    def reindex_places_collection(self, df: pd.DataFrame, embedder: HybridEmbedder, background: bool = False):
+        args = (settings.PLACES_COLLECTION, df, self.place_ids(df), "full_text", embedder)
+        return self.start_reindex(*args) if background else self.reindex_collection(*args)
+
+    def _swap_alias(self, alias: str, target: str) -> None:
+        current = self.aliases().get(alias)
+        operations: list = []
+        if current is not None:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+        elif self.client.collection_exists(alias):
+            # pre-alias deployment: a plain collection owns the name and must
+            # go before the alias can take it (one-off, brief gap)
+            log.warning("Replacing plain collection '%s' with an alias", alias)
+            self.client.delete_collection(alias)
+        operations.append(CreateAliasOperation(create_alias=CreateAlias(collection_name=target, alias_name=alias)))
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        invalidate_collection(alias)
+        log.info("Alias '%s' -> '%s' (was %s)", alias, target, current or "unset")
+
+    def _drop_old_versions(self, name: str, keep_versions: int) -> None:
+        live = self.resolve(name)
+        versions = [coll for _, coll in self.versions(name)]
+        for coll in versions[: max(0, len(versions) - max(1, keep_versions))]:
+            if coll != live:
+                self.client.delete_collection(coll)
+                log.info("Deleted old version '%s'", coll)
+        self.gc_docs(name)
+
+    # -- snapshot bundles ------------------------------------------------
+
+    def _http(self) -> httpx.Client:
+        headers = {"api-key": self._api_key} if self._api_key else {}
+        return httpx.Client(base_url=self._url, headers=headers, timeout=httpx.Timeout(30.0, read=600.0))
+
+    def _download_snapshot(self, collection: str, dest: Path) -> None:
+        if hasattr(self.client, "export_snapshot"):  # in-process backend
+            self.client.export_snapshot(collection, dest)
+            return
+        snapshot = self.client.create_snapshot(collection_name=collection, wait=True)
+        try:
+            with self._http() as http, http.stream("GET", f"/collections/{collection}/snapshots/{snapshot.name}") as resp:
+                resp.raise_for_status()
+                with open(dest, "wb") as f:
+                    for chunk in resp.iter_bytes(1 << 20):
+                        f.write(chunk)
+        finally:
+            self.client.delete_snapshot(collection_name=collection, snapshot_name=snapshot.name)
+
+    def _upload_snapshot(self, collection: str, src: Path) -> None:
+        if hasattr(self.client, "import_snapshot"):
+            self.client.import_snapshot(collection, src)
+            return
+        with self._http() as http, open(src, "rb") as f:
+            resp = http.post(
+                f"/collections/{collection}/snapshots/upload",
+                params={"priority": "snapshot", "wait": "true"},
+                files={"snapshot": (src.name, f, "application/octet-stream")},
+            )
+            resp.raise_for_status()
+
+    def export_bundle(self, embedder: HybridEmbedder, dest: Path = settings.BUNDLE_DIR) -> Path:
+        """Write everything a fresh node needs to serve search without re-encoding.
+
+        The bundle holds a snapshot of each collection, the document store,
+        the fitted TF-IDF model, the processed datasets and ``manifest.json`` (models, point counts
+        and sha256 of every file).
+        """
+        tmp = dest.with_name(dest.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        files = {"tfidf_model.joblib": settings.TFIDF_PATH}
+        for data_path in (settings.HOTELS_PARQUET, settings.PLACES_PARQUET):
+            if data_path.exists():
+                files[data_path.name] = data_path
+        for name, src in files.items():
+            shutil.copy2(src, tmp / name)
+        self.docs.backup_to(tmp / "docstore.sqlite")
+
+        collections = {}
+        for alias in (settings.HOTELS_COLLECTION, settings.PLACES_COLLECTION):
+            physical = self.resolve(alias)
+            snapshot_file = f"{alias}.snapshot"
+            log.info("Snapshotting '%s' (%s)", alias, physical)
+            self._download_snapshot(physical, tmp / snapshot_file)
+            collections[alias] = {"file": snapshot_file, "source": physical, "points": self.collection_count(alias)}
+
+        manifest = {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "vector_backend": settings.VECTOR_BACKEND,
+            "dense_model": settings.DENSE_MODEL_NAME,
+            "dense_dim": settings.DENSE_DIM,
+            "model_key": embedder.model_key,
+            "collections": collections,
+            "files": {p.name: file_sha256(p) for p in sorted(tmp.iterdir())},
+        }
+        (tmp / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+        shutil.rmtree(dest, ignore_errors=True)
+        tmp.rename(dest)
+        log.info("Bundle written to %s", dest)
+        return dest
+
+    def restore_bundle(self, src: Path) -> dict:
+        """Restore a bundle from ``export_bundle`` and return its manifest.
+
+        Files are checksum-verified first. Each snapshot is recovered into a
+        new ``<name>_vN`` collection and the alias swapped to it, so restoring
+        onto a node that is already serving is also zero-downtime.
+        """
+        manifest = json.loads((src / "manifest.json").read_text())
+        if manifest["dense_model"] != settings.DENSE_MODEL_NAME or manifest["dense_dim"] != settings.DENSE_DIM:
+            raise ValueError(f"Bundle {src} was built with {manifest['dense_model']}, not {settings.DENSE_MODEL_NAME}")
+        for name, digest in manifest["files"].items():
+            if file_sha256(src / name) != digest:
+                raise ValueError(f"Bundle file {src / name} is corrupt (sha256 mismatch)")
+
+        with self._reindex_lock:
+            targets: dict[str, str] = {}
+            try:
+                for alias, info in manifest["collections"].items():
+                    versions = self.versions(alias)
+                    target = targets[alias] = f"{alias}_v{versions[-1][0] + 1 if versions else 1}"
+                    log.info("Restoring '%s' into '%s'", alias, target)
+                    self._upload_snapshot(target, src / info["file"])
+                    count = self.collection_count(target)
+                    if count != info["points"]:
+                        raise RuntimeError(f"Restored '{target}' has {count} points, bundle says {info['points']}")
+                # docs go in before the aliases move, so no search hit lacks its text
+                if (src / "docstore.sqlite").exists():  # absent in bundles with full payloads
+                    hashes = {alias: self.stored_hashes(target) for alias, target in targets.items()}
+                    self.docs.restore_from(src / "docstore.sqlite", hashes=hashes)
+            except Exception:
+                for alias, target in targets.items():
+                    self.client.delete_collection(target)
+                    self.gc_docs(alias)
+                raise
+            for alias, target in targets.items():
+                self._swap_alias(alias, target)
+                self._drop_old_versions(alias, settings.REINDEX_KEEP_VERSIONS)
+
+        settings.TFIDF_PATH.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src / "tfidf_model.joblib", settings.TFIDF_PATH)
+        settings.PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+        # Older bundles carry the processed CSVs instead of Parquet
+        for data_path in (settings.HOTELS_PARQUET, settings.PLACES_PARQUET, settings.HOTELS_CSV, settings.PLACES_CSV):
+            if (src / data_path.name).exists():
+                shutil.copy2(src / data_path.name, data_path)
+
+        # The restored artifacts belong together: record them as built so
+        # the next start does not refit TF-IDF or resync the collections.
+        build = BuildManifest()
+        for stage in STAGES:
+            build.record(stage)
+
+        log.info("Bundle %s restored (built %s)", src, manifest["created_at"])
+        return manifest
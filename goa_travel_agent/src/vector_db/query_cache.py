@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+# Rebuild counter per collection: cache keys that depend on collection
+# contents embed the current epoch, so bumping it orphans stale entries.
+_collection_epochs: dict[str, int] = {}
+_epochs_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """Cache-key form of a query: lower-cased, whitespace collapsed.
+
+    The MiniLM encoder, the TF-IDF vectorizer and the cross-encoder are all
+    uncased, so this does not change what the models see.
+    """
+    return " ".join(query.lower().split())
+
+
+def collection_epoch(name: str) -> int:
+    with _epochs_lock:
+        return _collection_epochs.get(name, 0)
+
+
+def invalidate_collection(name: str) -> None:
+    """Mark every cached result derived from ``name`` as stale."""
+    with _epochs_lock:
+        _collection_epochs[name] = _collection_epochs.get(name, 0) + 1
+
+
+class LRUCache:
+    """Bounded, thread-safe least-recently-used cache with hit/miss counters.
+
+    With ``ttl_s`` set, entries also expire that many seconds after being stored.
+    """
+
+    def __init__(self, maxsize: int, ttl_s: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._expires: dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if self.ttl_s is not None and self._expires[key] <= time.monotonic():
+                del self._data[key], self._expires[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.ttl_s is not None:
+                self._expires[key] = time.monotonic() + self.ttl_s
+            while len(self._data) > self.maxsize:
+                oldest, _ = self._data.popitem(last=False)
+                self._expires.pop(oldest, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
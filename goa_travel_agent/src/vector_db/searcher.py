@@ -1,124 +1,576 @@
 from __future__ import annotations
 
+import threading
+import time
+
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     FieldCondition,
     Filter,
-    MatchText,
+    GeoPoint,
+    GeoRadius,
+    MatchAny,
     MatchValue,
+    Prefetch,
     Range,
+    Rrf,
+    QueryRequest,
+    QueryResponse,
+    RrfQuery,
     SparseVector,
 )
 from sentence_transformers import CrossEncoder
 
 from goa_travel_agent.config.settings import settings
 from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder
+from goa_travel_agent.src.vector_db.backends import VectorBackend, create_client
+from goa_travel_agent.src.vector_db.doc_store import get_doc_store
+from goa_travel_agent.src.vector_db.index_profiles import search_params
+from goa_travel_agent.src.utils.facility_utils import normalize_facilities
+from goa_travel_agent.src.utils.geo_utils import GOA_COORDS, find_locality, locality_id
+from goa_travel_agent.src.vector_db.query_cache import LRUCache, collection_epoch, normalize_query
 from goa_travel_agent.src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+SEARCH_MODES = ("fusion", "client")
+RERANK_POLICIES = ("full", "adaptive", "none")
+CATEGORY_MATCHES = ("any", "all")
+
+
+def _rrf(ranked_lists: list[list[int]], k: int = settings.RRF_K) -> list[tuple[int, float]]:
+    """Reciprocal Rank Fusion over multiple ranked id-lists -> [(id, fused score)].
 
-def _rrf(ranked_lists: list[list[int]], k: int = 60) -> list[int]:
-    """Reciprocal Rank Fusion over multiple ranked id-lists."""
+    Positions start at 0, as in Qdrant's server-side RRF, so both search
+    modes produce the same fused scores.
+    """
     scores: dict[int, float] = {}
     for rlist in ranked_lists:
-        for rank, doc_id in enumerate(rlist, start=1):
+        for rank, doc_id in enumerate(rlist):
             scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
-    return [doc_id for doc_id, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)]
+    return sorted(scores.items(), key=lambda x: x[1], reverse=True)
 
 
-class HybridSearcher:
-    """Hybrid (dense + sparse) search with RRF fusion and cross-encoder reranking."""
+def _geo_conditions(
+    near: tuple[float, float] | None,
+    radius_km: float | None,
+    near_locality: str | None,
+) -> list[FieldCondition]:
+    """Radius condition on the ``location`` geo index (``near`` wins over ``near_locality``)."""
+    if near is None and near_locality:
+        name = find_locality(near_locality)
+        if name is None:
+            raise ValueError(f"Unknown locality '{near_locality}' for a geo search")
+        near = GOA_COORDS[name]
+    if near is None:
+        return []
+    radius_km = radius_km or settings.GEO_DEFAULT_RADIUS_KM
+    return [
+        FieldCondition(
+            key="location",
+            geo_radius=GeoRadius(center=GeoPoint(lat=near[0], lon=near[1]), radius=radius_km * 1000),
+        )
+    ]
+
+
+def _locality_conditions(locality: str | list[str] | None) -> list[FieldCondition]:
+    """Exact (one) or any-of (several) match on the canonical ``locality_id`` keyword."""
+    names = [locality] if isinstance(locality, str) else list(locality or [])
+    ids = list(dict.fromkeys(filter(None, (locality_id(n) for n in names))))
+    if not ids:
+        return []
+    match = MatchValue(value=ids[0]) if len(ids) == 1 else MatchAny(any=ids)
+    return [FieldCondition(key="locality_id", match=match)]
+
+
+def _hotel_filter(
+    min_stars: float,
+    min_rating: float,
+    locality: str | list[str] | None,
+    facilities: list[str] | None = None,
+    near: tuple[float, float] | None = None,
+    radius_km: float | None = None,
+    near_locality: str | None = None,
+) -> Filter | None:
+    must_conditions: list = _geo_conditions(near, radius_km, near_locality)
+    if min_stars > 0:
+        must_conditions.append(
+            FieldCondition(key="hotel_star_rating", range=Range(gte=min_stars))
+        )
+    if min_rating > 0:
+        must_conditions.append(
+            FieldCondition(key="site_review_rating", range=Range(gte=min_rating))
+        )
+    must_conditions.extend(_locality_conditions(locality))
+    # one condition per flag: the hotel must offer all of them
+    for flag in normalize_facilities(facilities):
+        must_conditions.append(
+            FieldCondition(key="facilities", match=MatchValue(value=flag))
+        )
+    return Filter(must=must_conditions) if must_conditions else None
+
+
+def _place_filter(
+    category: str | list[str] | None,
+    category_match: str = "any",
+    near: tuple[float, float] | None = None,
+    radius_km: float | None = None,
+    near_locality: str | None = None,
+    locality: str | list[str] | None = None,
+) -> Filter | None:
+    """Filter on the ``category`` keyword array (any-of or all-of), localities and an optional radius."""
+    if category_match not in CATEGORY_MATCHES:
+        raise ValueError(f"Unknown category match '{category_match}', expected one of {CATEGORY_MATCHES}")
+    categories = [category] if isinstance(category, str) else list(category or [])
+    categories = [c.strip() for c in categories if c and c.strip()]
+    must_conditions: list = _geo_conditions(near, radius_km, near_locality) + _locality_conditions(locality)
+    if len(categories) == 1 or (categories and category_match == "all"):
+        for cat in categories:
+            must_conditions.append(
+                FieldCondition(key="category", match=MatchValue(value=cat))
+            )
+    elif categories:
+        must_conditions.append(
+            FieldCondition(key="category", match=MatchAny(any=categories))
+        )
+    return Filter(must=must_conditions) if must_conditions else None
+
+
+class _SearchCore:
+    """Transport-independent half of hybrid search.
+
+    Holds the query/rerank caches and implements query encoding, request
+    building, client-side fusion, document hydration and the rerank policy.
+    Subclasses only add
+    the Qdrant round trips (sync in ``HybridSearcher``, asyncio in
+    ``AsyncHybridSearcher``).
+    """
 
     def __init__(
         self,
         embedder: HybridEmbedder,
-        qdrant_client: QdrantClient | None = None,
+        search_mode: str = settings.SEARCH_MODE,
+        rerank_policy: str = settings.RERANK_POLICY,
+        index_profile: str = settings.INDEX_PROFILE,
     ) -> None:
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{search_mode}', expected one of {SEARCH_MODES}")
+        if rerank_policy not in RERANK_POLICIES:
+            raise ValueError(f"Unknown rerank policy '{rerank_policy}', expected one of {RERANK_POLICIES}")
         self.embedder = embedder
-        if qdrant_client:
-            self.client = qdrant_client
-        else:
-            kwargs: dict = {"url": settings.QDRANT_URL, "timeout": 30}
-            if settings.QDRANT_API_KEY:
-                kwargs["api_key"] = settings.QDRANT_API_KEY
-            self.client = QdrantClient(**kwargs)
+        self.search_mode = search_mode
+        self.rerank_policy = rerank_policy
+        self.search_params = search_params(index_profile)  # dense HNSW ef / quantization rescoring
+        self.docs = get_doc_store()
         self._reranker: CrossEncoder | None = None
+        self._reranker_lock = threading.Lock()
+        self._query_cache = LRUCache(settings.QUERY_CACHE_SIZE)
+        self._rerank_cache = LRUCache(settings.RERANK_CACHE_SIZE)
+        self._facet_cache = LRUCache(256, ttl_s=settings.FACET_CACHE_TTL_S)
 
     @property
     def reranker(self) -> CrossEncoder:
-        if self._reranker is None:
-            log.info("Loading cross-encoder reranker...")
-            self._reranker = CrossEncoder(settings.CROSS_ENCODER_NAME)
+        with self._reranker_lock:
+            if self._reranker is None:
+                log.info("Loading cross-encoder reranker...")
+                self._reranker = CrossEncoder(settings.CROSS_ENCODER_NAME)
         return self._reranker
 
-    # -- core search -----------------------------------------------------
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        return {
+            "query": self._query_cache.stats(),
+            "rerank": self._rerank_cache.stats(),
+            "facet": self._facet_cache.stats(),
+        }
 
-    def _search(
+    # -- facets ----------------------------------------------------------
+
+    @staticmethod
+    def _facet_filter(field: str, value: str | None) -> Filter | None:
+        if value is None:
+            return None
+        return Filter(must=[FieldCondition(key=field, match=MatchValue(value=value))])
+
+    @staticmethod
+    def _facet_counts(resp) -> dict[str, int]:
+        return {str(hit.value): hit.count for hit in resp.hits}
+
+    def _facet_key(self, city: str | None, field: str = "category") -> tuple:
+        collection = settings.PLACES_COLLECTION
+        return (collection, collection_epoch(collection), field, city)
+
+    # -- query encoding --------------------------------------------------
+
+    def _encode_queries(self, queries: list[str]) -> list[tuple[list[float], SparseVector]]:
+        """Dense + sparse vectors per query; cache misses share one forward pass."""
+        model_key = self.embedder.model_key
+        norms = [normalize_query(q) for q in queries]
+        encoded: dict[str, tuple[list[float], SparseVector]] = {}
+        misses: list[str] = []
+        for norm in dict.fromkeys(norms):
+            cached = self._query_cache.get((model_key, norm))
+            if cached is not None:
+                encoded[norm] = cached
+            else:
+                misses.append(norm)
+
+        if misses:
+            dense = self.embedder.encode_dense(misses, use_cache=False)
+            sparse = self.embedder.encode_sparse_batch(misses)
+            for norm, q_dense, (sp_idx, sp_val) in zip(misses, dense, sparse):
+                value = (q_dense.tolist(), SparseVector(indices=sp_idx, values=sp_val))
+                self._query_cache.put((model_key, norm), value)
+                encoded[norm] = value
+
+        return [encoded[norm] for norm in norms]
+
+    # -- candidate retrieval ---------------------------------------------
+
+    def _fused_request(
         self,
-        collection: str,
-        query: str,
+        q_dense: list[float],
+        q_sparse: SparseVector,
         filters: Filter | None,
-        retrieve_limit: int = 20,
-        top_k: int = 5,
-        text_field: str = "search_text",
-    ) -> list[dict]:
-        # encode query
-        q_dense = self.embedder.encode_dense([query])[0].tolist()
-        sp_idx, sp_val = self.embedder.encode_sparse(query)
-
-        # dense search via query_points (qdrant-client >= 1.12)
-        dense_resp = self.client.query_points(
-            collection_name=collection,
-            query=q_dense,
-            using="dense",
-            query_filter=filters,
-            limit=retrieve_limit,
-            with_payload=False,
+        retrieve_limit: int,
+    ) -> QueryRequest:
+        """Dense + sparse prefetch with server-side RRF and inline payloads."""
+        return QueryRequest(
+            prefetch=[
+                Prefetch(
+                    query=q_dense, using="dense", filter=filters, params=self.search_params, limit=retrieve_limit,
+                ),
+                Prefetch(query=q_sparse, using="sparse", filter=filters, limit=retrieve_limit),
+            ],
+            query=RrfQuery(rrf=Rrf(k=settings.RRF_K)),
+            limit=2 * retrieve_limit,
+            with_payload=True,
         )
-        dense_hits = dense_resp.points
-
-        # sparse search via query_points
-        sparse_resp = self.client.query_points(
-            collection_name=collection,
-            query=SparseVector(indices=sp_idx, values=sp_val),
-            using="sparse",
-            query_filter=filters,
-            limit=retrieve_limit,
-            with_payload=False,
+
+    @staticmethod
+    def _fused_candidates(resp: QueryResponse) -> list[dict]:
+        return [{"id": p.id, **p.payload, "fusion_score": p.score} for p in resp.points if p.payload]
+
+    def _client_requests(
+        self,
+        encoded: list[tuple[list[float], SparseVector]],
+        filters: list[Filter | None],
+        retrieve_limit: int,
+    ) -> tuple[list[QueryRequest], list[QueryRequest]]:
+        """Separate dense and sparse requests for the client-side fusion path."""
+        dense, sparse = [], []
+        for (q_dense, q_sparse), qfilter in zip(encoded, filters):
+            dense.append(
+                QueryRequest(
+                    query=q_dense, using="dense", filter=qfilter, params=self.search_params,
+                    limit=retrieve_limit, with_payload=False,
+                )
+            )
+            sparse.append(
+                QueryRequest(query=q_sparse, using="sparse", filter=qfilter, limit=retrieve_limit, with_payload=False)
+            )
+        return dense, sparse
+
+    @staticmethod
+    def _client_fuse(
+        dense_responses: list[QueryResponse],
+        sparse_responses: list[QueryResponse],
+    ) -> list[list[tuple[int, float]]]:
+        """RRF fusion per query of the dense and sparse id lists."""
+        return [
+            _rrf([[h.id for h in dense.points], [h.id for h in sparse.points]])
+            for dense, sparse in zip(dense_responses, sparse_responses)
+        ]
+
+    @staticmethod
+    def _attach_payloads(fused_lists: list[list[tuple[int, float]]], records: list) -> list[list[dict]]:
+        id_to_payload = {r.id: r.payload for r in records}
+        results = []
+        for fused in fused_lists:
+            candidates = []
+            for pid, score in fused:
+                payload = id_to_payload.get(pid)
+                if payload:
+                    candidates.append({"id": pid, **payload, "fusion_score": score})
+            results.append(candidates)
+        return results
+
+    def _hydrate(self, collection: str, candidates: list[dict]) -> None:
+        """Fill in the long text fields of ``candidates`` from the document store.
+
+        Docs are looked up by (id, ``content_hash``), so each version behind
+        the alias gets its own text. Fields already present (collections
+        indexed with full payloads) are left alone.
+        """
+        docs = self.docs.get_many(collection, [(c["id"], c.get("content_hash")) for c in candidates])
+        for c in candidates:
+            for field, value in docs.get((str(c["id"]), c.get("content_hash")), {}).items():
+                c.setdefault(field, value)
+
+    # -- reranking -------------------------------------------------------
+
+    def _rerank(self, collection: str, jobs: list[tuple[str, list[dict]]], text_field: str) -> list[int]:
+        """Set ``rerank_score`` on the candidates of every (query, candidates) job.
+
+        Scores are keyed on (model, the point's ``content_hash``, query): a
+        point whose text changes gets a new hash, even when the change was
+        made by another process. Points without a hash fall back to
+        (collection, rebuild epoch, point id). All uncached pairs go to the
+        cross-encoder in a single ``predict`` call. Returns the number of
+        pairs actually scored per job.
+        """
+        epoch = collection_epoch(collection)
+        slots: list[tuple[dict, str, tuple]] = []
+        for query, candidates in jobs:
+            norm = normalize_query(query)
+            for c in candidates:
+                doc_key = c.get("content_hash") or (collection, epoch, c["id"])
+                slots.append((c, norm, (settings.CROSS_ENCODER_NAME, doc_key, norm)))
+
+        scores = [self._rerank_cache.get(key) for _, _, key in slots]
+        missing = [i for i, s in enumerate(scores) if s is None]
+        if missing:
+            # identical (query, point) pairs within a batch are scored once
+            unique: dict[tuple, int] = {}
+            for i in missing:
+                unique.setdefault(slots[i][2], i)
+            pairs = [(slots[i][1], str(slots[i][0].get(text_field, "") or "")) for i in unique.values()]
+            predicted = dict(zip(unique, (float(s) for s in self.reranker.predict(pairs))))
+            for key, score in predicted.items():
+                self._rerank_cache.put(key, score)
+            for i in missing:
+                scores[i] = predicted[slots[i][2]]
+
+        for (c, _, _), s in zip(slots, scores):
+            c["rerank_score"] = s
+
+        scored_per_job: list[int] = []
+        offset = 0
+        missing_set = set(missing)
+        for _, candidates in jobs:
+            span = range(offset, offset + len(candidates))
+            scored_per_job.append(sum(1 for i in span if i in missing_set))
+            offset += len(candidates)
+        return scored_per_job
+
+    @staticmethod
+    def _retrievers_agree(candidates: list[dict], top_k: int) -> bool:
+        """True when dense and sparse put the same documents at the top.
+
+        Fused scores are 1 / (k + pos) summed over both lists, with pos
+        starting at 0 in every search mode (see ``_rrf``). A score of at
+        least 2 / (k + m - 1) means the document sits, on average, within the
+        top m of BOTH ranked lists. If that holds for the first m fused hits
+        (m = min(top_k, RERANK_AGREEMENT_DEPTH)) the cross-encoder is unlikely
+        to change the head of the ranking.
+        """
+        m = min(top_k, settings.RERANK_AGREEMENT_DEPTH, len(candidates))
+        if m == 0:
+            return False
+        threshold = 2.0 / (settings.RRF_K + m - 1)  # both lists at position m - 1
+        return all(c.get("fusion_score", 0.0) >= threshold for c in candidates[:m])
+
+    def _rerank_depth(self, candidates: list[dict], top_k: int, stats: dict) -> int:
+        """How many fused candidates ``rerank_policy`` sends to the cross-encoder."""
+        if self.rerank_policy == "none":
+            stats["rerank_skipped"] = "fast mode"
+            return 0
+        if self.rerank_policy == "adaptive":
+            if self._retrievers_agree(candidates, top_k):
+                stats["rerank_skipped"] = "dense/sparse agreement"
+                return 0
+            return min(len(candidates), max(settings.RERANK_MIN_DEPTH, settings.RERANK_DEPTH_FACTOR * top_k))
+        return len(candidates)
+
+    def _rank(
+        self,
+        collection: str,
+        queries: list[str],
+        candidate_lists: list[list[dict]],
+        top_k: int,
+        text_field: str,
+    ) -> tuple[list[list[dict]], list[dict]]:
+        """Apply the rerank policy to fused candidates; returns (results, per-query stats)."""
+        all_stats: list[dict] = []
+        heads: list[list[dict]] = []
+        for candidates in candidate_lists:
+            stats = {
+                "collection": collection,
+                "search_mode": self.search_mode,
+                "rerank_policy": self.rerank_policy,
+                "batch_size": len(queries),
+                "candidates": len(candidates),
+                "rerank_depth": 0,
+                "pairs_scored": 0,
+                "rerank_cache_hits": 0,
+                "rerank_skipped": None,
+            }
+            depth = self._rerank_depth(candidates, top_k, stats) if candidates else 0
+            stats["rerank_depth"] = depth
+            heads.append(candidates[:depth])
+            all_stats.append(stats)
+
+        # the final top_k is drawn from the reranked head plus the next fused
+        # hits, so only those need their text: one store lookup per batch
+        self._hydrate(
+            collection,
+            [c for candidates, head in zip(candidate_lists, heads) for c in candidates[: max(len(head), top_k)]],
         )
-        sparse_hits = sparse_resp.points
 
-        # RRF fusion
-        dense_ids = [h.id for h in dense_hits]
-        sparse_ids = [h.id for h in sparse_hits]
-        fused_ids = _rrf([dense_ids, sparse_ids])
+        jobs = [(query, head) for query, head in zip(queries, heads) if head]
+        if jobs:
+            scored = iter(self._rerank(collection, jobs, text_field))
+            for head, stats in zip(heads, all_stats):
+                if head:
+                    stats["pairs_scored"] = next(scored)
+                    stats["rerank_cache_hits"] = len(head) - stats["pairs_scored"]
 
-        if not fused_ids:
-            return []
+        results = []
+        for candidates, head in zip(candidate_lists, heads):
+            head.sort(key=lambda x: x["rerank_score"], reverse=True)
+            results.append((head + candidates[len(head):])[:top_k])
+        return results, all_stats
+
+    @staticmethod
+    def _finish_stats(all_stats: list[dict], start: float) -> None:
+        elapsed = round((time.perf_counter() - start) * 1000, 2)
+        for stats in all_stats:
+            stats["elapsed_ms"] = elapsed
+            log.debug("Search stats: %s", stats)
+
+
+class HybridSearcher(_SearchCore):
+    """Hybrid (dense + sparse) search with RRF fusion and cross-encoder reranking."""
+
+    def __init__(
+        self,
+        embedder: HybridEmbedder,
+        qdrant_client: QdrantClient | VectorBackend | None = None,
+        search_mode: str = settings.SEARCH_MODE,
+        rerank_policy: str = settings.RERANK_POLICY,
+        index_profile: str = settings.INDEX_PROFILE,
+    ) -> None:
+        super().__init__(embedder, search_mode, rerank_policy, index_profile)
+        self.client = qdrant_client or create_client()
+        self._local = threading.local()
+
+    @property
+    def last_search_stats(self) -> dict | None:
+        """Stats of the last single-query search issued from the calling thread."""
+        return getattr(self._local, "stats", None)
+
+    @property
+    def last_batch_stats(self) -> list[dict]:
+        """Per-query stats of the last search (single or batch) from the calling thread."""
+        return getattr(self._local, "batch_stats", [])
+
+    # -- candidate retrieval ---------------------------------------------
+
+    def _fetch_fused(
+        self,
+        collection: str,
+        encoded: list[tuple[list[float], SparseVector]],
+        filters: list[Filter | None],
+        retrieve_limit: int,
+    ) -> list[list[dict]]:
+        """One Query API round trip for all queries: prefetch + server-side RRF."""
+        requests = [
+            self._fused_request(q_dense, q_sparse, qfilter, retrieve_limit)
+            for (q_dense, q_sparse), qfilter in zip(encoded, filters)
+        ]
+        responses = self.client.query_batch_points(collection_name=collection, requests=requests)
+        return [self._fused_candidates(resp) for resp in responses]
+
+    def _fetch_client_fused(
+        self,
+        collection: str,
+        encoded: list[tuple[list[float], SparseVector]],
+        filters: list[Filter | None],
+        retrieve_limit: int,
+    ) -> list[list[dict]]:
+        """Legacy path: dense and sparse queries, one payload retrieve, local RRF."""
+        dense_reqs, sparse_reqs = self._client_requests(encoded, filters, retrieve_limit)
+        responses = self.client.query_batch_points(collection_name=collection, requests=dense_reqs + sparse_reqs)
+        fused_lists = self._client_fuse(responses[: len(dense_reqs)], responses[len(dense_reqs) :])
+
+        all_ids = list({pid: None for fused in fused_lists for pid, _ in fused})
+        if not all_ids:
+            return [[] for _ in fused_lists]
 
         # retrieve full payloads
-        records = self.client.retrieve(collection, ids=fused_ids, with_payload=True)
-        id_to_payload = {r.id: r.payload for r in records}
+        records = self.client.retrieve(collection, ids=all_ids, with_payload=True)
+        return self._attach_payloads(fused_lists, records)
 
-        candidates = []
-        for pid in fused_ids:
-            payload = id_to_payload.get(pid)
-            if payload:
-                candidates.append({"id": pid, **payload})
+    # -- facets ----------------------------------------------------------
 
-        if not candidates:
+    def category_facets(self, city: str | None = None) -> dict[str, int]:
+        """Number of places per category (optionally in one city), largest first.
+
+        Counted by Qdrant from the ``category`` keyword index, no scan of the
+        points; cached until the places collection is rebuilt in this process
+        or ``FACET_CACHE_TTL_S`` has passed.
+        """
+        key = self._facet_key(city)
+        counts = self._facet_cache.get(key)
+        if counts is None:
+            resp = self.client.facet(
+                collection_name=settings.PLACES_COLLECTION,
+                key="category",
+                facet_filter=self._facet_filter("city", city),
+                limit=len(settings.PLACE_CATEGORIES) + 1,  # + "General"
+                exact=True,
+            )
+            counts = self._facet_counts(resp)
+            self._facet_cache.put(key, counts)
+        return counts
+
+    def category_facets_by_city(self) -> dict[str, dict[str, int]]:
+        """{city: {category: places}} for every city that has places."""
+        key = self._facet_key(None, field="city")
+        cities = self._facet_cache.get(key)
+        if cities is None:
+            resp = self.client.facet(
+                collection_name=settings.PLACES_COLLECTION, key="city", limit=len(settings.GOA_CITIES), exact=True,
+            )
+            cities = self._facet_counts(resp)
+            self._facet_cache.put(key, cities)
+        return {city: self.category_facets(city) for city in cities}
+
+    # -- core search -----------------------------------------------------
+
+    def _search_batch(
+        self,
+        collection: str,
+        queries: list[str],
+        filters: list[Filter | None],
+        retrieve_limit: int = 20,
+        top_k: int = 5,
+        text_field: str = "search_text",
+    ) -> list[list[dict]]:
+        if not queries:
             return []
+        start = time.perf_counter()
+        encoded = self._encode_queries(queries)
 
-        # rerank
-        passages = [str(c.get(text_field, "") or "") for c in candidates]
-        pairs = [(query, p) for p in passages]
-        scores = self.reranker.predict(pairs)
-        for c, s in zip(candidates, scores):
-            c["rerank_score"] = float(s)
+        fetch = self._fetch_fused if self.search_mode == "fusion" else self._fetch_client_fused
+        candidate_lists = fetch(collection, encoded, filters, retrieve_limit)
 
-        candidates.sort(key=lambda x: x["rerank_score"], reverse=True)
-        return candidates[:top_k]
+        results, all_stats = self._rank(collection, queries, candidate_lists, top_k, text_field)
+        self._finish_stats(all_stats, start)
+        self._local.batch_stats = all_stats
+        return results
+
+    def _search(
+        self,
+        collection: str,
+        query: str,
+        filters: Filter | None,
+        retrieve_limit: int = 20,
+        top_k: int = 5,
+        text_field: str = "search_text",
+    ) -> list[dict]:
+        results = self._search_batch(collection, [query], [filters], retrieve_limit, top_k, text_field)
+        self._local.stats = self._local.batch_stats[0]
+        return results[0]
 
     # -- public API ------------------------------------------------------
 
@@ -127,28 +579,17 @@ class HybridSearcher:
         query: str,
         min_stars: float = 0,
         min_rating: float = 0,
-        locality: str | None = None,
+        locality: str | list[str] | None = None,
+        facilities: list[str] | None = None,
         top_k: int = 5,
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
     ) -> list[dict]:
-        must_conditions: list = []
-        if min_stars > 0:
-            must_conditions.append(
-                FieldCondition(key="hotel_star_rating", range=Range(gte=min_stars))
-            )
-        if min_rating > 0:
-            must_conditions.append(
-                FieldCondition(key="site_review_rating", range=Range(gte=min_rating))
-            )
-        if locality:
-            must_conditions.append(
-                FieldCondition(key="locality", match=MatchText(text=locality))
-            )
-
-        qfilter = Filter(must=must_conditions) if must_conditions else None
         return self._search(
             collection=settings.HOTELS_COLLECTION,
             query=query,
-            filters=qfilter,
+            filters=_hotel_filter(min_stars, min_rating, locality, facilities, near, radius_km, near_locality),
             top_k=top_k,
             text_field="search_text",
         )
@@ -156,20 +597,61 @@ class HybridSearcher:
     def search_places(
         self,
         query: str,
-        category: str | None = None,
+        category: str | list[str] | None = None,
         top_k: int = 5,
+        category_match: str = "any",
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
+        locality: str | list[str] | None = None,
     ) -> list[dict]:
-        must_conditions: list = []
-        if category:
-            must_conditions.append(
-                FieldCondition(key="category", match=MatchValue(value=category))
-            )
-
-        qfilter = Filter(must=must_conditions) if must_conditions else None
         return self._search(
             collection=settings.PLACES_COLLECTION,
             query=query,
-            filters=qfilter,
+            filters=_place_filter(category, category_match, near, radius_km, near_locality, locality),
+            top_k=top_k,
+            text_field="full_text",
+        )
+
+    def search_hotels_batch(
+        self,
+        queries: list[str],
+        min_stars: float = 0,
+        min_rating: float = 0,
+        locality: str | list[str] | None = None,
+        facilities: list[str] | None = None,
+        top_k: int = 5,
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
+    ) -> list[list[dict]]:
+        """Run many hotel queries with shared filters; same results as ``search_hotels``."""
+        qfilter = _hotel_filter(min_stars, min_rating, locality, facilities, near, radius_km, near_locality)
+        return self._search_batch(
+            collection=settings.HOTELS_COLLECTION,
+            queries=queries,
+            filters=[qfilter] * len(queries),
+            top_k=top_k,
+            text_field="search_text",
+        )
+
+    def search_places_batch(
+        self,
+        queries: list[str],
+        category: str | list[str] | None = None,
+        top_k: int = 5,
+        category_match: str = "any",
+        near: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+        near_locality: str | None = None,
+        locality: str | list[str] | None = None,
+    ) -> list[list[dict]]:
+        """Run many place queries with a shared filter; same results as ``search_places``."""
+        qfilter = _place_filter(category, category_match, near, radius_km, near_locality, locality)
+        return self._search_batch(
+            collection=settings.PLACES_COLLECTION,
+            queries=queries,
+            filters=[qfilter] * len(queries),
             top_k=top_k,
             text_field="full_text",
         )
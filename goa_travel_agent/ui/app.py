@@ -20,20 +20,31 @@ if _css_path.exists():
 
 def _ensure_data_pipeline():
     """Run data download + preprocessing + embeddings + Qdrant upload if needed."""
-    import pandas as pd
-
     from goa_travel_agent.config.settings import settings
     from goa_travel_agent.src.utils.logger import get_logger
 
     log = get_logger("ui.init")
 
-    # --- Step 1: Data pipeline ---
-    if settings.HOTELS_CSV.exists() and settings.PLACES_CSV.exists():
-        log.info("Processed CSVs found, loading...")
-        hotels_df = pd.read_csv(settings.HOTELS_CSV)
-        places_df = pd.read_csv(settings.PLACES_CSV)
+    # --- Step 0: fresh node -> restore a prebuilt bundle instead of recomputing ---
+    if settings.BOOTSTRAP_BUNDLE and not settings.TFIDF_PATH.exists():
+        from goa_travel_agent.src.vector_db.qdrant_manager import QdrantManager
+
+        log.info("Bootstrapping from bundle %s", settings.BOOTSTRAP_BUNDLE)
+        QdrantManager().restore_bundle(Path(settings.BOOTSTRAP_BUNDLE))
+
+    # --- Step 1: Data pipeline (only when raw files or preprocessing config changed) ---
+    # Stored datasets are read lazily below, only the columns each stage needs
+    from goa_travel_agent.src.data_management.preprocessor import load_processed, processed_row_counts
+    from goa_travel_agent.src.utils.build_manifest import BuildManifest
+
+    manifest = BuildManifest()
+    step = manifest.check("preprocess")
+    if not step.run:
+        log.info("Processed datasets: %s.", step.reason)
+        hotels_df = places_df = None
+        num_hotels, num_places = processed_row_counts()
     else:
-        log.info("Processed CSVs not found, running data pipeline...")
+        log.info("Running data pipeline (%s)...", step.reason)
         from goa_travel_agent.src.data_management.kaggle_downloader import download_all
         from goa_travel_agent.src.data_management.data_loader import load_hotels_csv, load_places_csv
         from goa_travel_agent.src.data_management.preprocessor import (
@@ -48,29 +59,43 @@ def _ensure_data_pipeline():
         hotels_df = preprocess_hotels(raw_hotels)
         places_df = preprocess_places(raw_places)
         save_processed(hotels_df, places_df)
+        num_hotels, num_places = len(hotels_df), len(places_df)
+    manifest.record("preprocess")
 
     # --- Step 2: Embeddings + Qdrant ---
     from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder
+    from goa_travel_agent.src.vector_db.backends import backend_configured
     from goa_travel_agent.src.vector_db.qdrant_manager import QdrantManager
 
     embedder = HybridEmbedder()
-    if not embedder.is_tfidf_fitted():
-        log.info("Fitting TF-IDF on full corpus...")
-        corpus = hotels_df["search_text"].tolist() + places_df["full_text"].tolist()
-        embedder.fit_tfidf(corpus)
+    step = manifest.check("tfidf")
+    if step.run:
+        log.info("Fitting TF-IDF on full corpus (%s)...", step.reason)
+        if hotels_df is None:
+            hotel_texts, place_texts = load_processed(["search_text"], ["full_text"])
+        else:
+            hotel_texts, place_texts = hotels_df, places_df
+        embedder.fit_tfidf(hotel_texts["search_text"].tolist() + place_texts["full_text"].tolist())
     else:
         embedder.load_tfidf()
+    manifest.record("tfidf")
 
-    if settings.QDRANT_URL:
+    if backend_configured():
         manager = QdrantManager()
-        if not manager.collection_exists_and_populated(settings.HOTELS_COLLECTION):
-            log.info("Uploading hotels to Qdrant...")
+        present = all(
+            manager.collection_exists_and_populated(name)
+            for name in (settings.HOTELS_COLLECTION, settings.PLACES_COLLECTION)
+        )
+        step = manifest.check("index", present=present)
+        if step.run:
+            log.info("Syncing hotels and places with Qdrant (%s)...", step.reason)
+            if hotels_df is None:
+                hotels_df, places_df = load_processed()
             manager.setup_hotels_collection(hotels_df, embedder)
-        if not manager.collection_exists_and_populated(settings.PLACES_COLLECTION):
-            log.info("Uploading places to Qdrant...")
             manager.setup_places_collection(places_df, embedder)
+        manifest.record("index")
 
-    return embedder, len(hotels_df), len(places_df)
+    return embedder, num_hotels, num_places
 
 
 @st.cache_resource
@@ -11,13 +11,14 @@ BADGE_MAP = {
 }
 
 
-def _category_badges(category: str) -> str:
+def _category_badges(category: list[str] | str) -> str:
+    categories = [category] if isinstance(category, str) else list(category) or ["General"]
     badges = []
-    for cat in category.split(", "):
+    for cat in categories:
         css_class = BADGE_MAP.get(cat.strip(), "")
         if css_class:
             badges.append(f'<span class="category-badge {css_class}">{cat.strip()}</span>')
-    return " ".join(badges) if badges else f'<span class="category-badge">{category}</span>'
+    return " ".join(badges) if badges else f'<span class="category-badge">{", ".join(categories)}</span>'
 
 
 def _rating_dots(rating: float, max_dots: int = 5) -> str:
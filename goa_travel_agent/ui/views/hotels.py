@@ -1,5 +1,6 @@
 import streamlit as st
 
+from goa_travel_agent.config.settings import settings
 from goa_travel_agent.ui.components.hotel_cards import render_hotel_results
 from goa_travel_agent.ui.components.sidebar import render_sidebar
 
@@ -14,21 +15,39 @@ def render(searcher) -> None:
         placeholder="es. luxury resort con piscina vicino alla spiaggia di Candolim",
     )
 
-    locality = st.text_input("📍 Localita (opzionale)", "", placeholder="es. Candolim, Baga, Panjim")
+    col_loc, col_radius = st.columns([3, 1])
+    with col_loc:
+        locality = st.text_input("📍 Localita (opzionale)", "", placeholder="es. Candolim, Baga, Panjim", help="Piu localita separate da virgola")
+    with col_radius:
+        radius_km = st.number_input("📏 Entro km", min_value=0, max_value=50, value=0, help="0 = solo nella localita")
+
+    facilities = st.multiselect(
+        "🛎️ Servizi richiesti",
+        list(settings.HOTEL_FACILITIES),
+        format_func=lambda f: f.replace("_", " ").title(),
+    )
 
     if st.button("🔍 Cerca Hotel", use_container_width=True):
         if not query:
             st.warning("Inserisci una descrizione per la ricerca.")
             return
 
+        near = bool(locality and radius_km)  # radius -> geo filter around the locality
         with st.spinner("Ricerca in corso..."):
-            results = searcher.search_hotels(
-                query=query,
-                min_stars=float(filters["hotel_stars"]),
-                min_rating=float(filters["min_rating"]),
-                locality=locality or None,
-                top_k=5,
-            )
+            try:
+                results = searcher.search_hotels(
+                    query=query,
+                    min_stars=float(filters["hotel_stars"]),
+                    min_rating=float(filters["min_rating"]),
+                    locality=None if near else [loc for loc in locality.split(",") if loc.strip()] or None,
+                    facilities=facilities or None,
+                    near_locality=locality if near else None,
+                    radius_km=float(radius_km) if near else None,
+                    top_k=5,
+                )
+            except ValueError as exc:
+                st.warning(f"Localita non riconosciuta: {exc}")
+                return
             st.session_state["hotel_results"] = results
 
     if "hotel_results" in st.session_state:
@@ -14,6 +14,28 @@ CATEGORIES = [
 ]
 
 
+def _category_counts(searcher) -> dict[str, int]:
+    try:
+        return searcher.category_facets()
+    except Exception:
+        return {}  # counts are decoration: never block the view on them
+
+
+def _render_city_facets(searcher) -> None:
+    with st.expander("📊 Luoghi per citta e categoria"):
+        try:
+            by_city = searcher.category_facets_by_city()
+        except Exception:
+            st.caption("Conteggi non disponibili.")
+            return
+        categories = [val for _, val in CATEGORIES if val] + ["General"]
+        rows = [
+            {"Citta": city.title(), **{cat: counts.get(cat, 0) for cat in categories}}
+            for city, counts in sorted(by_city.items())
+        ]
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+
+
 def render(searcher) -> None:
     st.header("🗺️ Scopri Luoghi a Goa")
 
@@ -21,17 +43,20 @@ def render(searcher) -> None:
     if "places_category" not in st.session_state:
         st.session_state.places_category = ""
 
-    cat_labels = [label for label, _ in CATEGORIES]
-    cat_values = [val for _, val in CATEGORIES]
+    counts = _category_counts(searcher)
+    labels = {val: label for label, val in CATEGORIES}
 
-    selected_label = st.radio(
+    # options are the plain categories, so the selection survives count changes
+    selected_cat = st.radio(
         "Categoria",
-        cat_labels,
+        list(labels),
+        format_func=lambda val: f"{labels[val]} ({counts.get(val, 0)})" if val and counts else labels[val],
         horizontal=True,
         label_visibility="collapsed",
         key="places_cat_radio",
     )
-    selected_cat = cat_values[cat_labels.index(selected_label)]
+
+    _render_city_facets(searcher)
 
     st.markdown("")
 
@@ -1,8 +1,14 @@
 """Goa Travel Agent — main entry point.
 
 Usage:
-    uv run python main.py          # CLI interactive mode
-    uv run python main.py --ui     # Launch Streamlit web app
+    uv run python main.py                  # CLI interactive mode
+    uv run python main.py --ui             # Launch Streamlit web app
+    uv run python main.py --reindex        # Rebuild collections blue/green, then CLI
+    uv run python main.py --export-bundle  # Index, then write a bootstrap bundle and exit
+    uv run python main.py --export-csv     # Write the processed datasets as CSV and exit
+    uv run python main.py --plan           # Show which pipeline stages would run, and why
+
+Set BOOTSTRAP_BUNDLE=<bundle dir> on new nodes to restore instead of re-indexing.
 """
 
 from __future__ import annotations
@@ -14,21 +20,38 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 
-def _run_data_pipeline() -> tuple:
-    """STEP 1: Download & preprocess datasets (skipped if CSVs already exist)."""
-    import pandas as pd
-
+def _bootstrap_from_bundle() -> None:
+    """STEP 0: On a fresh node, restore a prebuilt bundle instead of recomputing."""
     from goa_travel_agent.config.settings import settings
+
+    if not settings.BOOTSTRAP_BUNDLE or settings.TFIDF_PATH.exists():
+        return
+
+    from goa_travel_agent.src.vector_db.qdrant_manager import QdrantManager
+
+    print(f"\n[STEP 0] Restoring bundle {settings.BOOTSTRAP_BUNDLE}")
+    QdrantManager().restore_bundle(Path(settings.BOOTSTRAP_BUNDLE))
+
+
+def _run_data_pipeline(manifest) -> tuple:
+    """STEP 1: Download & preprocess datasets (skipped while raw files and config are unchanged).
+
+    Returns the freshly preprocessed frames, or (None, None) when the stored
+    ones are current: later stages then read only the columns they need.
+    """
+    from goa_travel_agent.src.data_management.preprocessor import processed_row_counts
     from goa_travel_agent.src.utils.logger import get_logger
 
     log = get_logger("pipeline")
 
-    if settings.HOTELS_CSV.exists() and settings.PLACES_CSV.exists():
-        log.info("Processed CSVs already exist, loading...")
-        hotels_df = pd.read_csv(settings.HOTELS_CSV)
-        places_df = pd.read_csv(settings.PLACES_CSV)
-        log.info("Hotels: %d rows  |  Places: %d rows", len(hotels_df), len(places_df))
-        return hotels_df, places_df
+    step = manifest.check("preprocess")
+    if not step.run:
+        log.info("Processed datasets: %s.", step.reason)
+        manifest.record("preprocess")
+        log.info("Hotels: %d rows  |  Places: %d rows", *processed_row_counts())
+        return None, None
+
+    log.info("Preprocessing (%s)", step.reason)
 
     # Download
     from goa_travel_agent.src.data_management.kaggle_downloader import download_all
@@ -52,6 +75,7 @@ def _run_data_pipeline() -> tuple:
     hotels_df = preprocess_hotels(raw_hotels)
     places_df = preprocess_places(raw_places)
     save_processed(hotels_df, places_df)
+    manifest.record("preprocess")
 
     log.info("Hotels: %d rows  |  Places: %d rows", len(hotels_df), len(places_df))
     print(f"\n--- Hotels sample ---\n{hotels_df.head(3).to_string()}")
@@ -60,10 +84,28 @@ def _run_data_pipeline() -> tuple:
     return hotels_df, places_df
 
 
-def _run_embeddings(hotels_df, places_df):
-    """STEP 2: Fit TF-IDF + encode embeddings + upload to Qdrant (skipped if already done)."""
+def _index_present(manager) -> bool:
     from goa_travel_agent.config.settings import settings
+
+    return all(
+        manager.collection_exists_and_populated(name)
+        for name in (settings.HOTELS_COLLECTION, settings.PLACES_COLLECTION)
+    )
+
+
+def _processed(hotels_df, places_df, hotel_columns=None, place_columns=None) -> tuple:
+    """Frames preprocessed by this run, else the stored ones (only the given columns)."""
+    if hotels_df is not None:
+        return hotels_df, places_df
+    from goa_travel_agent.src.data_management.preprocessor import load_processed
+
+    return load_processed(hotel_columns, place_columns)
+
+
+def _run_embeddings(hotels_df, places_df, manifest, reindex: bool = False):
+    """STEP 2: Fit TF-IDF + encode embeddings + delta-sync Qdrant, each only when its inputs changed."""
     from goa_travel_agent.src.embeddings.hybrid_embedder import HybridEmbedder
+    from goa_travel_agent.src.vector_db.backends import backend_configured
     from goa_travel_agent.src.vector_db.qdrant_manager import QdrantManager
     from goa_travel_agent.src.utils.logger import get_logger
 
@@ -71,44 +113,73 @@ def _run_embeddings(hotels_df, places_df):
     embedder = HybridEmbedder()
 
     # Fit TF-IDF once on full corpus (CRITICAL FIX)
-    if not embedder.is_tfidf_fitted():
-        corpus = hotels_df["search_text"].tolist() + places_df["full_text"].tolist()
-        embedder.fit_tfidf(corpus)
+    step = manifest.check("tfidf")
+    if step.run:
+        log.info("Fitting TF-IDF (%s)", step.reason)
+        hotel_texts, place_texts = _processed(hotels_df, places_df, ["search_text"], ["full_text"])
+        embedder.fit_tfidf(hotel_texts["search_text"].tolist() + place_texts["full_text"].tolist())
     else:
         embedder.load_tfidf()
-        log.info("TF-IDF model already fitted, loaded from cache.")
+        log.info("TF-IDF model: %s. Loaded from cache.", step.reason)
+    manifest.record("tfidf")
 
-    # Upload to Qdrant (skip if already populated)
-    if not settings.QDRANT_URL:
+    # Upload to Qdrant
+    if not backend_configured():
         log.warning("QDRANT_URL not set. Skipping Qdrant upload.")
         return embedder
 
     manager = QdrantManager()
 
-    if manager.collection_exists_and_populated(settings.HOTELS_COLLECTION):
-        log.info("Hotels collection already populated (%d points).", manager.collection_count(settings.HOTELS_COLLECTION))
-    else:
-        log.info("Setting up hotels collection...")
-        manager.setup_hotels_collection(hotels_df, embedder)
+    if reindex:
+        # Blue/green: build new versions, then swap the aliases searches use
+        hotels_df, places_df = _processed(hotels_df, places_df)
+        log.info("Reindexing hotels -> %s", manager.reindex_hotels_collection(hotels_df, embedder))
+        log.info("Reindexing places -> %s", manager.reindex_places_collection(places_df, embedder))
+        manifest.record("index")
+        return embedder
 
-    if manager.collection_exists_and_populated(settings.PLACES_COLLECTION):
-        log.info("Places collection already populated (%d points).", manager.collection_count(settings.PLACES_COLLECTION))
-    else:
-        log.info("Setting up places collection...")
-        manager.setup_places_collection(places_df, embedder)
+    step = manifest.check("index", present=_index_present(manager))
+    if not step.run:
+        log.info("Collections: %s. Skipping sync.", step.reason)
+        manifest.record("index")
+        return embedder
+
+    # Delta sync: only new/changed rows are encoded, removed rows are deleted
+    log.info("Syncing collections (%s)", step.reason)
+    hotels_df, places_df = _processed(hotels_df, places_df)
+    log.info("Syncing hotels collection...")
+    manager.setup_hotels_collection(hotels_df, embedder)
+    log.info("Syncing places collection...")
+    manager.setup_places_collection(places_df, embedder)
+    manifest.record("index")
 
     return embedder
 
 
+def _print_plan(reindex: bool) -> None:
+    """Show which pipeline stages would run, and why, without running them."""
+    from goa_travel_agent.src.utils.build_manifest import BuildManifest
+    from goa_travel_agent.src.vector_db.backends import backend_configured
+
+    index_present = None
+    if backend_configured():
+        from goa_travel_agent.src.vector_db.qdrant_manager import QdrantManager
+
+        index_present = _index_present(QdrantManager())
+
+    for step in BuildManifest().plan(index_present=index_present, reindex=reindex):
+        print(f"  {step.stage:<11} {'run' if step.run else 'skip':<5} {step.reason}")
+
+
 def _run_search_demo(embedder):
     """STEP 3: Run example hybrid searches."""
-    from goa_travel_agent.config.settings import settings
+    from goa_travel_agent.src.vector_db.backends import backend_configured
     from goa_travel_agent.src.vector_db.searcher import HybridSearcher
     from goa_travel_agent.src.utils.logger import get_logger
 
     log = get_logger("search")
 
-    if not settings.QDRANT_URL:
+    if not backend_configured():
         log.warning("Qdrant not configured. Skipping search demo.")
         return None
 
@@ -213,18 +284,41 @@ def main() -> None:
         subprocess.run([sys.executable, "-m", "streamlit", "run", str(app_path)], check=False)
         return
 
+    if "--plan" in args:
+        print("Pipeline plan:")
+        _print_plan(reindex="--reindex" in args)
+        return
+
     # CLI pipeline
     print("=" * 60)
     print("  GOA TRAVEL AGENT — Pipeline")
     print("=" * 60)
 
+    _bootstrap_from_bundle()
+
+    from goa_travel_agent.src.utils.build_manifest import BuildManifest
+
+    manifest = BuildManifest()
+
     # Step 1
     print("\n[STEP 1] Data Pipeline")
-    hotels_df, places_df = _run_data_pipeline()
+    hotels_df, places_df = _run_data_pipeline(manifest)
+
+    if "--export-csv" in args:
+        from goa_travel_agent.src.data_management.preprocessor import export_csv
+
+        print("CSV written to " + ", ".join(str(p) for p in export_csv()))
+        return
 
     # Step 2
     print("\n[STEP 2] Embeddings + Qdrant")
-    embedder = _run_embeddings(hotels_df, places_df)
+    embedder = _run_embeddings(hotels_df, places_df, manifest, reindex="--reindex" in args)
+
+    if "--export-bundle" in args:
+        from goa_travel_agent.src.vector_db.qdrant_manager import QdrantManager
+
+        print(f"Bundle written to {QdrantManager().export_bundle(embedder)}")
+        return
 
     # Step 3
     print("\n[STEP 3] Search Demo")
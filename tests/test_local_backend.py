@@ -0,0 +1,98 @@
+"""Crash recovery and compaction of the in-process vector store."""
+
+import numpy as np
+import pytest
+from qdrant_client.models import Distance, PointStruct, SparseVector, VectorParams
+
+from goa_travel_agent.config.settings import settings
+from goa_travel_agent.src.vector_db.local_backend import LocalVectorStore
+
+DIM = 4
+
+
+def _point(pid: int, payload: dict | None = None) -> PointStruct:
+    rng = np.random.default_rng(pid)
+    return PointStruct(
+        id=pid,
+        vector={"dense": rng.random(DIM).tolist(), "sparse": SparseVector(indices=[pid % 3], values=[1.0])},
+        payload=payload if payload is not None else {"n": pid},
+    )
+
+
+def _own_vector_hit(store: LocalVectorStore, point: PointStruct):
+    return store.query_points("c", query=point.vector["dense"], using="dense", limit=1).points[0]
+
+
+def _reopen(path) -> LocalVectorStore:
+    store = LocalVectorStore(path)
+    store.get_collection("c")  # collections are replayed on first use
+    return store
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalVectorStore(tmp_path)
+    store.create_collection("c", {"dense": VectorParams(size=DIM, distance=Distance.COSINE)})
+    store.upsert("c", [_point(i) for i in range(5)])
+    return store
+
+
+def test_dense_rows_without_records_are_dropped_on_open(store, tmp_path):
+    # an upsert interrupted between the dense rows and their JSONL lines
+    with open(tmp_path / "c" / "dense.f32", "ab") as f:
+        np.zeros((3, DIM), dtype=np.float32).tofile(f)
+
+    reopened = _reopen(tmp_path)
+    assert (tmp_path / "c" / "dense.f32").stat().st_size == 5 * DIM * 4
+    fresh = _point(42)
+    reopened.upsert("c", [fresh])
+    hit = _own_vector_hit(reopened, fresh)
+    assert hit.id == 42
+    assert hit.score == pytest.approx(1.0, abs=1e-5)
+
+
+def test_unfinished_last_record_is_trimmed(store, tmp_path):
+    points_path = tmp_path / "c" / "points.jsonl"
+    with open(points_path, "a", encoding="utf-8") as f:
+        f.write('{"id": 99, "payload": {"n"')
+    with open(tmp_path / "c" / "dense.f32", "ab") as f:
+        np.ones((1, DIM), dtype=np.float32).tofile(f)
+
+    reopened = _reopen(tmp_path)
+    assert points_path.read_text().endswith("\n")
+    assert reopened.retrieve("c", [99]) == []
+    reopened.upsert("c", [_point(7)])
+    assert [r.id for r in _reopen(tmp_path).scroll("c", limit=10)[0]] == [0, 1, 2, 3, 4, 7]
+
+
+def test_corrupt_record_before_the_end_is_an_error(store, tmp_path):
+    points_path = tmp_path / "c" / "points.jsonl"
+    lines = points_path.read_text().splitlines(keepends=True)
+    lines[1] = "not json\n"
+    points_path.write_text("".join(lines))
+    with pytest.raises(RuntimeError, match="corrupt"):
+        _reopen(tmp_path)
+
+
+def test_failed_upsert_leaves_files_and_memory_untouched(store, tmp_path):
+    sizes = [(tmp_path / "c" / name).stat().st_size for name in ("dense.f32", "points.jsonl")]
+    with pytest.raises(TypeError):
+        store.upsert("c", [_point(1, {"bad": object()})])  # payload is not JSON-serializable
+
+    assert [(tmp_path / "c" / name).stat().st_size for name in ("dense.f32", "points.jsonl")] == sizes
+    assert store.retrieve("c", [1])[0].payload == {"n": 1}
+    fresh = _point(43)
+    store.upsert("c", [fresh])
+    assert _own_vector_hit(store, fresh).id == 43
+
+
+def test_compaction_keeps_live_points(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOCAL_COMPACT_RATIO", 0.5)
+    store.delete("c", [0, 1])
+    store.upsert("c", [_point(2, {"n": 20})])  # 3 of 6 rows dead -> compacted
+
+    assert (tmp_path / "c" / "dense.f32").stat().st_size == 3 * DIM * 4
+    reopened = _reopen(tmp_path)
+    assert sorted(r.id for r in reopened.scroll("c", limit=10)[0]) == [2, 3, 4]
+    assert reopened.retrieve("c", [2])[0].payload == {"n": 20}
+    assert _own_vector_hit(reopened, _point(3)).id == 3